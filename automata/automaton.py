@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 
+from automata.charclass import ClassMap
 from automata.state import State
 
 
 class Automaton(ABC):
+    # set on automata whose symbols stand for character classes
+    classes: ClassMap | None = None
+
     @abstractmethod
     def _traverse(self, string: str) -> tuple[list[State], bool]:
         pass
@@ -12,10 +17,17 @@ class Automaton(ABC):
     def accepts(self, string: str) -> bool:
         pass
 
+    def accepts_many(self, strings: Iterable[str]) -> bytearray:
+        return bytearray(self.accepts(string) for string in strings)
+
     @abstractmethod
     def state_transitions(self, string: str) -> list[State]:
         pass
 
+    @abstractmethod
+    def iter_transitions(self, string: str) -> Iterator[State]:
+        pass
+
     @abstractmethod
     def delta(self, state: State, symbol: str) -> None | State | set[State]:
         pass
@@ -24,9 +36,6 @@ class Automaton(ABC):
     def _new_unique_state(cls, existing: set[State]):
         new_state = State()
         while new_state in existing:
-            print(existing)
-            print(State.base_name, State.instance_counter)
-            print(f"new: {new_state!r}")
             new_state = State()
         return new_state
 
@@ -0,0 +1,126 @@
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import override
+
+MAX_CODE_POINT = 0x110000
+
+# sorted, disjoint, non-adjacent half-open ranges [start, stop) of code points
+Intervals = tuple[tuple[int, int], ...]
+
+ANY_CHAR: Intervals = ((0, MAX_CODE_POINT),)
+
+
+def normalize(intervals: Iterable[tuple[int, int]]) -> Intervals:
+    merged: list[tuple[int, int]] = []
+    for start, stop in sorted(intervals):
+        if start >= stop:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1] = merged[-1][0], max(merged[-1][1], stop)
+        else:
+            merged.append((start, stop))
+    return tuple(merged)
+
+
+def negate(intervals: Intervals) -> Intervals:
+    complement: list[tuple[int, int]] = []
+    previous = 0
+    for start, stop in intervals:
+        if previous < start:
+            complement.append((previous, start))
+        previous = stop
+    if previous < MAX_CODE_POINT:
+        complement.append((previous, MAX_CODE_POINT))
+    return tuple(complement)
+
+
+def contains(intervals: Intervals, code_point: int) -> bool:
+    i = bisect_right(intervals, (code_point, MAX_CODE_POINT)) - 1
+    return i >= 0 and intervals[i][0] <= code_point < intervals[i][1]
+
+
+class ClassMap:
+    """
+    Partition of the code points into the classes an automaton tells apart.
+
+    Automata built over character classes use one symbol per class, its
+    smallest member, so a class of any size costs one transition. Inputs
+    are mapped onto these symbols before they are matched; characters in
+    no class have no symbol and are left as they are, which can never be
+    mistaken for a symbol.
+    """
+
+    __slots__ = ("starts", "symbols", "_table")
+
+    def __init__(self, starts: tuple[int, ...], symbols: tuple[str | None, ...]):
+        if len(starts) != len(symbols) or not starts or starts[0] != 0:
+            raise ValueError("Class starts must begin at 0 and match the symbols.")
+        self.starts: tuple[int, ...] = starts
+        self.symbols: tuple[str | None, ...] = symbols
+        # code point -> code point of its symbol, filled in as inputs are seen
+        self._table: dict[int, int] = {}
+
+    @classmethod
+    def from_intervals(cls, classes: Iterable[Intervals]) -> "ClassMap":
+        """The coarsest partition that does not split any of `classes`."""
+        classes = list(classes)
+        bounds = {0, MAX_CODE_POINT}
+        for intervals in classes:
+            for start, stop in intervals:
+                bounds.update((start, stop))
+        ordered = sorted(bounds)[:-1]
+
+        representatives: dict[tuple[int, ...], str] = {}
+        starts: list[int] = []
+        symbols: list[str | None] = []
+        for start in ordered:
+            signature = tuple(
+                i for i, intervals in enumerate(classes) if contains(intervals, start)
+            )
+            symbol = None
+            if signature:
+                symbol = representatives.setdefault(signature, chr(start))
+            if not symbols or symbols[-1] != symbol:
+                starts.append(start)
+                symbols.append(symbol)
+        return cls(tuple(starts), tuple(symbols))
+
+    @property
+    def alphabet(self) -> set[str]:
+        return {symbol for symbol in self.symbols if symbol is not None}
+
+    def symbol(self, char: str) -> str | None:
+        return self.symbols[bisect_right(self.starts, ord(char)) - 1]
+
+    def symbols_of(self, intervals: Intervals) -> list[str]:
+        """Symbols of the classes that make up `intervals`."""
+        found: set[str] = set()
+        for i, start in enumerate(self.starts):
+            symbol = self.symbols[i]
+            if symbol is not None and contains(intervals, start):
+                found.add(symbol)
+        return sorted(found)
+
+    def translate(self, string: str) -> str:
+        """Replace every character of `string` with the symbol of its class."""
+        table = self._table
+        for char in set(string):
+            code_point = ord(char)
+            if code_point not in table:
+                symbol = self.symbol(char)
+                table[code_point] = code_point if symbol is None else ord(symbol)
+        return string.translate(table)
+
+    @override
+    def __eq__(self, value: object, /) -> bool:
+        if isinstance(value, ClassMap):
+            return self.starts == value.starts and self.symbols == value.symbols
+        return False
+
+    @override
+    def __hash__(self) -> int:
+        return hash((self.starts, self.symbols))
+
+    @override
+    def __repr__(self):
+        return f"ClassMap(classes={len(self.alphabet)})"
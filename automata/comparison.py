@@ -0,0 +1,35 @@
+from typing import override
+
+
+class Comparison:
+    """
+    Outcome of comparing the languages of two automata.
+
+    Truthy when the relation holds; otherwise `counterexample` is a
+    shortest string on which the automata disagree.
+    """
+
+    __slots__ = ("holds", "counterexample")
+
+    def __init__(self, counterexample: str | None = None):
+        self.holds: bool = counterexample is None
+        self.counterexample: str | None = counterexample
+
+    def __bool__(self) -> bool:
+        return self.holds
+
+    @override
+    def __eq__(self, value: object, /) -> bool:
+        if isinstance(value, Comparison):
+            return self.counterexample == value.counterexample
+        return NotImplemented
+
+    @override
+    def __hash__(self) -> int:
+        return hash(self.counterexample)
+
+    @override
+    def __repr__(self):
+        if self.holds:
+            return "Comparison(holds=True)"
+        return f"Comparison(holds=False, counterexample={self.counterexample!r})"
@@ -1 +1,6 @@
+from .compiled import CompiledDFA as CompiledDFA
+from .counting import LanguageCounter as LanguageCounter
 from .dfa import DFA as DFA
+from .parallel import ParallelMatcher as ParallelMatcher
+from .product import ProductDFA as ProductDFA
+from .stream import StreamMatcher as StreamMatcher
@@ -0,0 +1,271 @@
+from array import array
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, override
+
+from automata.charclass import ClassMap
+from automata.state import State
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from automata.dfa.parallel import ParallelMatcher
+    from automata.dfa.stream import StreamMatcher
+    from automata.regex.prefilter import Prefilter
+
+DEAD: int = -1
+
+
+class CompiledDFA:
+    """
+    Frozen, integer-indexed matcher for a DFA.
+
+    States and symbols are numbered densely and the transition function is
+    kept in a flat row-major table, so that ``table[state * width + symbol]``
+    is the next state, or ``DEAD`` where the DFA has no transition. With
+    `classes`, inputs are mapped onto the class symbols before lookup. With
+    a `prefilter`, `accepts` rejects inputs missing its literals by
+    substring search before the table is read.
+    """
+
+    __slots__ = (
+        "states",
+        "symbols",
+        "symbol_index",
+        "width",
+        "table",
+        "initial",
+        "accepting",
+        "classes",
+        "prefilter",
+    )
+
+    states: tuple[State, ...]
+    symbols: tuple[str, ...]
+    symbol_index: dict[str, int]
+    width: int
+    table: array[int]
+    initial: int
+    accepting: bytes
+    classes: ClassMap | None
+    prefilter: "Prefilter | None"
+
+    def __init__(
+        self,
+        states: tuple[State, ...],
+        symbols: tuple[str, ...],
+        table: array[int],
+        initial: int,
+        accepting: bytes,
+        classes: ClassMap | None = None,
+        prefilter: "Prefilter | None" = None,
+    ):
+        if len(table) != len(states) * len(symbols):
+            raise ValueError("Table size does not match the states and symbols.")
+        if len(accepting) != len(states):
+            raise ValueError("Accepting flags do not match the number of states.")
+        object.__setattr__(self, "states", states)
+        object.__setattr__(self, "symbols", symbols)
+        object.__setattr__(
+            self, "symbol_index", {symbol: i for i, symbol in enumerate(symbols)}
+        )
+        object.__setattr__(self, "width", len(symbols))
+        object.__setattr__(self, "table", table)
+        object.__setattr__(self, "initial", initial)
+        object.__setattr__(self, "accepting", accepting)
+        object.__setattr__(self, "classes", classes)
+        object.__setattr__(self, "prefilter", prefilter)
+
+    @classmethod
+    def from_dfa(
+        cls,
+        states: set[State],
+        alphabet: set[str],
+        transitions: dict[State, dict[str, State]],
+        initial: State,
+        accepting: set[State],
+        classes: ClassMap | None = None,
+    ) -> "CompiledDFA":
+        symbols = tuple(sorted(alphabet))
+        symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        width = len(symbols)
+
+        # reachable states are numbered in BFS order from the initial state
+        order: list[State] = [initial]
+        state_index: dict[State, int] = {initial: 0}
+        i = 0
+        while i < len(order):
+            row = transitions.get(order[i], {})
+            i += 1
+            for symbol in symbols:
+                next_state = row.get(symbol)
+                if next_state is not None and next_state not in state_index:
+                    state_index[next_state] = len(order)
+                    order.append(next_state)
+        for state in sorted(states, key=lambda s: s.name):
+            if state not in state_index:
+                state_index[state] = len(order)
+                order.append(state)
+        ordered_states = tuple(order)
+
+        table = array("i", [DEAD]) * (len(ordered_states) * width)
+        for state, row in transitions.items():
+            base = state_index[state] * width
+            for symbol, next_state in row.items():
+                table[base + symbol_index[symbol]] = state_index[next_state]
+
+        return cls(
+            ordered_states,
+            symbols,
+            table,
+            state_index[initial],
+            bytes(state in accepting for state in ordered_states),
+            classes,
+        )
+
+    def run(self, string: str) -> int:
+        """Index of the state reached after reading `string`, or ``DEAD``."""
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        symbol_index = self.symbol_index
+        table = self.table
+        width = self.width
+        current = self.initial
+        for symbol in string:
+            i = symbol_index.get(symbol)
+            if i is None:
+                return DEAD
+            current = table[current * width + i]
+            if current < 0:
+                return DEAD
+        return current
+
+    def accepts(self, string: str) -> bool:
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("DFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        # mirrors DFA.accepts, which never accepts the empty string
+        if not string:
+            return False
+        if self.prefilter is not None and not self.prefilter.may_fullmatch(string):
+            return False
+        current = self.run(string)
+        return current >= 0 and self.accepting[current] == 1
+
+    def accepts_many(self, strings: Iterable[str]) -> bytearray:
+        """Acceptance of every string, one byte each, in input order."""
+        symbol_index = self.symbol_index
+        table = self.table
+        width = self.width
+        initial = self.initial
+        accepting = self.accepting
+        classes = self.classes
+        prefilter = self.prefilter
+        results = bytearray()
+        append = results.append
+        for string in strings:
+            if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+                raise TypeError("DFA expects string input only.")  # pyright: ignore[reportUnreachable]
+            if prefilter is not None and not prefilter.may_fullmatch(string):
+                append(False)
+                continue
+            if classes is not None:
+                string = classes.translate(string)
+            current = initial if string else DEAD
+            for symbol in string:
+                i = symbol_index.get(symbol)
+                if i is None:
+                    current = DEAD
+                    break
+                current = table[current * width + i]
+                if current < 0:
+                    break
+            append(current >= 0 and accepting[current])
+        return results
+
+    def longest_prefix(self, string: str, start: int = 0) -> int:
+        """
+        End of the longest non-empty accepted substring of `string` that
+        begins at `start`, or ``DEAD`` if there is none.
+        """
+        symbol_index = self.symbol_index
+        table = self.table
+        width = self.width
+        accepting = self.accepting
+        classes = self.classes
+        current = self.initial
+        end = DEAD
+        for position in range(start, len(string)):
+            symbol = string[position]
+            if classes is not None:
+                symbol = classes.symbol(symbol) or symbol
+            i = symbol_index.get(symbol)
+            if i is None:
+                break
+            current = table[current * width + i]
+            if current < 0:
+                break
+            if accepting[current]:
+                end = position + 1
+        return end
+
+    def stream(self) -> "StreamMatcher":
+        from automata.dfa.stream import StreamMatcher
+
+        return StreamMatcher(self)
+
+    def parallel(
+        self,
+        workers: int | None = None,
+        chunk_size: int = 1 << 20,
+        executor: "Executor | None" = None,
+    ) -> "ParallelMatcher":
+        from automata.dfa.parallel import ParallelMatcher
+
+        return ParallelMatcher(self, workers, chunk_size, executor)
+
+    def with_prefilter(self, prefilter: "Prefilter | None") -> "CompiledDFA":
+        """Copy that consults `prefilter` before matching, if it knows anything."""
+        if prefilter is not None and not (prefilter.prefixes or prefilter.required):
+            prefilter = None
+        return CompiledDFA(
+            self.states,
+            self.symbols,
+            self.table,
+            self.initial,
+            self.accepting,
+            self.classes,
+            prefilter,
+        )
+
+    def step(self, state: int, symbol: str) -> int:
+        if self.classes is not None:
+            symbol = self.classes.symbol(symbol) or symbol
+        i = self.symbol_index.get(symbol)
+        if i is None or state < 0:
+            return DEAD
+        return self.table[state * self.width + i]
+
+    @override
+    def __setattr__(self, name: str, value: object, /):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    @override
+    def __delattr__(self, name: str, /):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    @override
+    def __reduce__(self):
+        # a table memory-mapped from a file is copied, as views cannot be pickled
+        table = self.table if isinstance(self.table, array) else array("i", self.table)
+        return CompiledDFA, (
+            self.states,
+            self.symbols,
+            table,
+            self.initial,
+            self.accepting,
+            self.classes,
+            self.prefilter,
+        )
+
+    @override
+    def __repr__(self):
+        return f"CompiledDFA(states={len(self.states)}, symbols={len(self.symbols)})"
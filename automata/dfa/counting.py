@@ -0,0 +1,162 @@
+from bisect import bisect_right
+from random import Random
+
+from automata.charclass import MAX_CODE_POINT
+from automata.dfa.compiled import DEAD, CompiledDFA
+
+Matrix = list[list[int]]
+
+
+def _multiply(left: Matrix, right: Matrix) -> Matrix:
+    size = len(right)
+    product: Matrix = []
+    for row in left:
+        result = [0] * size
+        for k, factor in enumerate(row):
+            if factor:
+                for j, value in enumerate(right[k]):
+                    if value:
+                        result[j] += factor * value
+        product.append(result)
+    return product
+
+
+class LanguageCounter:
+    """
+    Counts and uniformly samples the strings of each length a DFA accepts.
+
+    ``counts[k][p]`` is the number of strings of length `k` accepted from
+    state `p`, computed backwards from the accepting states with exact
+    integers and kept for every length asked for so far. A symbol standing
+    for a character class counts once per character of the class. Sampling
+    walks forwards from the initial state and picks every transition with
+    probability proportional to the strings it leads to, so every accepted
+    string of the length is equally likely and none is rejected.
+    """
+
+    def __init__(self, compiled: CompiledDFA):
+        self.compiled: CompiledDFA = compiled
+        classes = compiled.classes
+        # code point ranges of every symbol, with their sizes summed up
+        self._ranges: list[list[tuple[int, int]]] = []
+        for symbol in compiled.symbols:
+            if classes is None:
+                self._ranges.append([(ord(symbol), ord(symbol) + 1)])
+                continue
+            stops = classes.starts[1:] + (MAX_CODE_POINT,)
+            self._ranges.append(
+                [
+                    (start, stop)
+                    for start, stop, other in zip(
+                        classes.starts, stops, classes.symbols
+                    )
+                    if other == symbol
+                ]
+            )
+        self._offsets: list[list[int]] = []
+        for ranges in self._ranges:
+            offsets = [0]
+            for start, stop in ranges:
+                offsets.append(offsets[-1] + stop - start)
+            self._offsets.append(offsets)
+        self.weights: tuple[int, ...] = tuple(offsets[-1] for offsets in self._offsets)
+
+        width = compiled.width
+        self._edges: list[list[tuple[int, int]]] = []
+        for p in range(len(compiled.states)):
+            edges: list[tuple[int, int]] = []
+            for a in range(width):
+                target = compiled.table[p * width + a]
+                if target != DEAD:
+                    edges.append((a, target))
+            self._edges.append(edges)
+        self.counts: list[list[int]] = [list(compiled.accepting)]
+        # per length, the running totals of the strings each edge leads to
+        self._cumulative: dict[int, list[list[int]]] = {}
+
+    def count(self, n: int) -> int:
+        """Number of strings of length `n` accepted by the DFA."""
+        if n < 0:
+            raise ValueError("Parameter n must not be negative.")
+        # mirrors DFA.accepts, which never accepts the empty string
+        if n == 0:
+            return 0
+        size = len(self.compiled.states)
+        edges = sum(len(edges) for edges in self._edges)
+        if n >= len(self.counts) and size**3 * n.bit_length() < n * edges:
+            return self._count_by_powers(n)
+        self._extend(n)
+        return self.counts[n][self.compiled.initial]
+
+    def sample(self, n: int, k: int = 1, rng: Random | None = None) -> list[str]:
+        """`k` strings of length `n` drawn uniformly from those accepted."""
+        if k < 0:
+            raise ValueError("Parameter k must not be negative.")
+        total = self.count(n)
+        if total == 0:
+            raise ValueError(f"No strings of length {n} are accepted.")
+        self._extend(n)
+        rng = rng or Random()
+        counts = self.counts
+        samples: list[str] = []
+        for _ in range(k):
+            state = self.compiled.initial
+            chars: list[str] = []
+            for remaining in range(n - 1, -1, -1):
+                cumulative = self._cumulative_of(remaining)[state]
+                r = rng.randrange(counts[remaining + 1][state])
+                i = bisect_right(cumulative, r)
+                a, target = self._edges[state][i]
+                below = cumulative[i - 1] if i else 0
+                chars.append(self._char(a, (r - below) // counts[remaining][target]))
+                state = target
+            samples.append("".join(chars))
+        return samples
+
+    def _extend(self, n: int):
+        counts = self.counts
+        weights = self.weights
+        while len(counts) <= n:
+            previous = counts[-1]
+            counts.append(
+                [
+                    sum(weights[a] * previous[target] for a, target in edges)
+                    for edges in self._edges
+                ]
+            )
+
+    def _count_by_powers(self, n: int) -> int:
+        size = len(self.compiled.states)
+        power: Matrix = [[0] * size for _ in range(size)]
+        for p, edges in enumerate(self._edges):
+            for a, target in edges:
+                power[p][target] += self.weights[a]
+        vector: Matrix = [[accepting] for accepting in self.compiled.accepting]
+        while n:
+            if n & 1:
+                vector = _multiply(power, vector)
+            n >>= 1
+            if n:
+                power = _multiply(power, power)
+        return vector[self.compiled.initial][0]
+
+    def _cumulative_of(self, remaining: int) -> list[list[int]]:
+        cumulative = self._cumulative.get(remaining)
+        if cumulative is None:
+            counts = self.counts[remaining]
+            cumulative = []
+            for edges in self._edges:
+                totals: list[int] = []
+                total = 0
+                for a, target in edges:
+                    total += self.weights[a] * counts[target]
+                    totals.append(total)
+                cumulative.append(totals)
+            self._cumulative[remaining] = cumulative
+        return cumulative
+
+    def _char(self, a: int, index: int) -> str:
+        """The `index`-th character of the class of symbol `a`."""
+        offsets = self._offsets[a]
+        i = bisect_right(offsets, index) - 1
+        return chr(self._ranges[a][i][0] + index - offsets[i])
@@ -1,6 +1,16 @@
+from collections.abc import Iterable, Iterator
+from random import Random
 from typing import override
 
+from automata import instrumentation
 from automata.automaton import Automaton
+from automata.comparison import Comparison
+from automata.dfa.compiled import DEAD, CompiledDFA
+from automata.dfa.counting import LanguageCounter
+from automata.dfa.equivalence import hopcroft_karp, shortest_accepted
+from automata.dfa.minimize import hopcroft
+from automata.dfa.product import ProductDFA
+from automata.dfa.stream import StreamMatcher
 from automata.state import State
 
 
@@ -28,30 +38,218 @@ class DFA(Automaton):
 
     @override
     def _traverse(self, string: str) -> tuple[list[State], bool]:
+        visited = list(self.iter_transitions(string))
+        is_valid = (
+            len(visited) == len(string) + 1
+            and len(string) > 0
+            and visited[-1] in self.accepting
+        )
+        return visited, is_valid
+
+    @override
+    def accepts(self, string: str) -> bool:
         if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
             raise TypeError("DFA expects string input only.")  # pyright: ignore[reportUnreachable]
-        is_valid: bool = False
-        current_node: State | None = self.initial
-        visited: list[State] = [current_node]
+        if instrumentation.active() is not None:
+            # the counted path, kept out of the loop below
+            return self._traverse(string)[1]
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        alphabet = self.alphabet
+        transitions = self.transitions
+        current_node: State = self.initial
         for symbol in string:
-            if symbol not in self.alphabet:
-                return visited, False
-            current_node = self.delta(current_node, symbol)
-            if current_node is None:
-                return visited, False
-            is_valid = current_node in self.accepting
-            visited.append(current_node)
-        return visited, is_valid
+            if symbol not in alphabet:
+                return False
+            row = transitions.get(current_node)
+            if row is None:
+                return False
+            next_node = row.get(symbol)
+            if next_node is None:
+                return False
+            current_node = next_node
+        return len(string) > 0 and current_node in self.accepting
 
     @override
-    def accepts(self, string: str) -> bool:
-        _, is_valid = self._traverse(string)
-        return is_valid
+    def accepts_many(self, strings: Iterable[str]) -> bytearray:
+        return self.compile().accepts_many(strings)
 
     @override
     def state_transitions(self, string: str) -> list[State]:
-        states, _ = self._traverse(string)
-        return states
+        return list(self.iter_transitions(string))
+
+    @override
+    def iter_transitions(self, string: str) -> Iterator[State]:
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("DFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        return self._iter_transitions(string)
+
+    def _iter_transitions(self, string: str) -> Iterator[State]:
+        stats = instrumentation.active()
+        visited = 1
+        current_node: State = self.initial
+        try:
+            yield current_node
+            for symbol in string:
+                if symbol not in self.alphabet:
+                    return
+                next_node = self.delta(current_node, symbol)
+                if next_node is None:
+                    return
+                current_node = next_node
+                visited += 1
+                yield current_node
+        finally:
+            if stats is not None:
+                stats.count("dfa.characters", visited - 1)
+                stats.count("dfa.states", visited)
+
+    def compile(self) -> CompiledDFA:
+        return CompiledDFA.from_dfa(
+            self.states,
+            self.alphabet,
+            self.transitions,
+            self.initial,
+            self.accepting,
+            self.classes,
+        )
+
+    def stream(self) -> StreamMatcher:
+        return StreamMatcher(self.compile())
+
+    def counter(self) -> LanguageCounter:
+        return LanguageCounter(self.compile())
+
+    def count(self, n: int) -> int:
+        return self.counter().count(n)
+
+    def sample(self, n: int, k: int = 1, rng: Random | None = None) -> list[str]:
+        return self.counter().sample(n, k, rng)
+
+    @instrumentation.timed("dfa.minimize")
+    def minimize(self) -> "DFA":
+        compiled = self.compile()
+        width = compiled.width
+        table = compiled.table
+
+        # number the reachable states in BFS order and send every missing
+        # transition to an explicit sink, so the table is complete
+        order: list[int] = [compiled.initial]
+        index: dict[int, int] = {compiled.initial: 0}
+        i = 0
+        while i < len(order):
+            base = order[i] * width
+            i += 1
+            for a in range(width):
+                target = table[base + a]
+                if target != DEAD and target not in index:
+                    index[target] = len(order)
+                    order.append(target)
+        sink = len(order)
+        dense: list[int] = []
+        for p in order:
+            base = p * width
+            for a in range(width):
+                target = table[base + a]
+                dense.append(sink if target == DEAD else index[target])
+        dense.extend([sink] * width)
+        accepting = [compiled.accepting[p] == 1 for p in order] + [False]
+
+        block_of = hopcroft(dense, width, accepting)
+        representative = {block_of[p]: p for p in reversed(range(sink + 1))}
+        # states equivalent to the sink are dropped, unless that would leave
+        # the initial state without any transition
+        dead = block_of[sink]
+        keep_dead = all(block_of[dense[a]] == dead for a in range(width))
+
+        blocks: list[int] = [block_of[0]]
+        names: dict[int, State] = {block_of[0]: State(f"{State.base_name}0")}
+        transitions: dict[State, dict[str, State]] = {}
+        j = 0
+        while j < len(blocks):
+            block = blocks[j]
+            j += 1
+            base = representative[block] * width
+            row: dict[str, State] = {}
+            for a, symbol in enumerate(compiled.symbols):
+                target = block_of[dense[base + a]]
+                if target == dead and not keep_dead:
+                    continue
+                if target not in names:
+                    names[target] = State(f"{State.base_name}{len(blocks)}")
+                    blocks.append(target)
+                row[symbol] = names[target]
+            if row:
+                transitions[names[block]] = row
+
+        minimal = DFA(
+            set(names.values()),
+            set(self.alphabet),
+            transitions,
+            names[block_of[0]],
+            {names[b] for b in blocks if accepting[representative[b]]},
+        )
+        minimal.classes = self.classes
+        return minimal
+
+    def equivalent(self, other: "DFA") -> Comparison:
+        """Whether both DFAs accept the same strings."""
+        product = ProductDFA(self, other, "symmetric_difference")
+        if hopcroft_karp(product):
+            return Comparison()
+        return Comparison(shortest_accepted(product))
+
+    def is_subset(self, other: "DFA") -> Comparison:
+        """Whether `other` accepts every string this DFA accepts."""
+        return Comparison(shortest_accepted(ProductDFA(self, other, "difference")))
+
+    def __and__(self, other: "DFA | ProductDFA") -> ProductDFA:
+        return self._product(other, "intersection")
+
+    def __or__(self, other: "DFA | ProductDFA") -> ProductDFA:
+        return self._product(other, "union")
+
+    def __sub__(self, other: "DFA | ProductDFA") -> ProductDFA:
+        return self._product(other, "difference")
+
+    def __xor__(self, other: "DFA | ProductDFA") -> ProductDFA:
+        return self._product(other, "symmetric_difference")
+
+    def _product(self, other: "DFA | ProductDFA", operation: str) -> ProductDFA:
+        if isinstance(other, ProductDFA):
+            other = other.to_dfa()
+        elif not isinstance(other, DFA):  # pyright: ignore[reportUnnecessaryIsInstance]
+            return NotImplemented  # pyright: ignore[reportUnreachable]
+        return ProductDFA(self, other, operation)
+
+    def __invert__(self) -> "DFA":
+        """
+        Complement over the alphabet; like every DFA, it still rejects the
+        empty string and characters outside the alphabet.
+        """
+        compiled = self.compile()
+        size = len(compiled.states)
+        names = [State(f"{State.base_name}{p}") for p in range(size + 1)]
+        sink = names[size]
+        transitions: dict[State, dict[str, State]] = {}
+        for p, name in enumerate(names):
+            transitions[name] = {
+                symbol: sink
+                if p == size or (target := compiled.table[p * compiled.width + a]) < 0
+                else names[target]
+                for a, symbol in enumerate(compiled.symbols)
+            }
+        complement = DFA(
+            set(names),
+            set(self.alphabet),
+            transitions,
+            names[compiled.initial],
+            {names[p] for p in range(size) if not compiled.accepting[p]} | {sink},
+        )
+        complement.classes = self.classes
+        return complement
 
     @override
     def delta(self, state: State, symbol: str) -> State | None:
@@ -0,0 +1,91 @@
+from collections import deque
+
+from automata.dfa.compiled import DEAD
+from automata.dfa.product import UNEXPLORED, ProductDFA
+
+
+def hopcroft_karp(product: ProductDFA) -> bool:
+    """
+    Whether the operands of `product` accept the same non-empty strings.
+
+    The states of both operands, each with an extra sink standing in for
+    ``DEAD``, are merged in a union-find as pairs of them are reached by
+    the same string. A pair whose states are already in the same block is
+    not explored again, so every merge costs one pass over the alphabet and
+    the whole check is near-linear in the number of states. The initial
+    pair itself is never compared, since no DFA accepts the empty string.
+    """
+    left, right = product.left, product.right
+    left_sink = len(left.states)
+    offset = left_sink + 1
+    right_sink = offset + len(right.states)
+    accepting = bytes(left.accepting) + b"\0" + bytes(right.accepting) + b"\0"
+    parent = list(range(right_sink + 1))
+
+    def find(state: int) -> int:
+        while parent[state] != state:
+            parent[state] = parent[parent[state]]
+            state = parent[state]
+        return state
+
+    def successors(p: int, q: int):
+        for a, b in product.moves:
+            if p == left_sink or a < 0:
+                next_p = left_sink
+            else:
+                next_p = left.table[p * left.width + a]
+                next_p = left_sink if next_p == DEAD else next_p
+            if q == right_sink or b < 0:
+                next_q = right_sink
+            else:
+                next_q = right.table[(q - offset) * right.width + b]
+                next_q = right_sink if next_q == DEAD else next_q + offset
+            yield next_p, next_q
+
+    pending = list(successors(left.initial, right.initial + offset))
+    while pending:
+        p, q = pending.pop()
+        if accepting[p] != accepting[q]:
+            return False
+        root_p, root_q = find(p), find(q)
+        if root_p == root_q:
+            continue
+        parent[root_p] = root_q
+        pending.extend(successors(p, q))
+    return True
+
+
+def shortest_accepted(product: ProductDFA) -> str | None:
+    """
+    Shortest non-empty string accepted by `product`, found breadth-first
+    over the pairs, or None if it accepts nothing.
+    """
+    table = product.table
+    width = product.width
+    initial = product.initial
+    # pair -> (previous pair, symbol index) on a shortest path to it
+    parent: dict[int, tuple[int, int]] = {}
+    queue = deque([initial])
+    while queue:
+        current = queue.popleft()
+        for i in range(width):
+            target = table[current * width + i]
+            if target == UNEXPLORED:
+                target = product._explore(current, i)  # pyright: ignore[reportPrivateUsage]
+            if target < 0 or target in parent:
+                continue
+            parent[target] = current, i
+            if product.accepting[target]:
+                return _path(product, parent, target)
+            if target != initial:
+                queue.append(target)
+    return None
+
+
+def _path(product: ProductDFA, parent: dict[int, tuple[int, int]], end: int) -> str:
+    previous, i = parent[end]
+    symbols = [product.symbols[i]]
+    while previous != product.initial:
+        previous, i = parent[previous]
+        symbols.append(product.symbols[i])
+    return "".join(reversed(symbols))
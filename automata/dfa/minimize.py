@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+
+
+def hopcroft(table: Sequence[int], width: int, accepting: Sequence[bool]) -> list[int]:
+    """
+    Hopcroft's partition refinement over a complete, dense transition table.
+
+    `table[p * width + a]` must be a valid state index for every state `p`
+    and symbol index `a`. Returns the block index of every state; two states
+    share a block iff they are equivalent.
+    """
+    size = len(accepting)
+    inverse: list[list[list[int]]] = [[[] for _ in range(size)] for _ in range(width)]
+    for p in range(size):
+        base = p * width
+        for a in range(width):
+            inverse[a][table[base + a]].append(p)
+
+    blocks: list[set[int]] = [
+        block
+        for block in (
+            {p for p in range(size) if accepting[p]},
+            {p for p in range(size) if not accepting[p]},
+        )
+        if block
+    ]
+    block_of: list[int] = [0] * size
+    for i, block in enumerate(blocks):
+        for p in block:
+            block_of[p] = i
+
+    smallest = min(range(len(blocks)), key=lambda i: len(blocks[i]))
+    waiting: set[tuple[int, int]] = {(smallest, a) for a in range(width)}
+    while waiting:
+        splitter, a = waiting.pop()
+        inverse_a = inverse[a]
+        predecessors: set[int] = set()
+        for q in blocks[splitter]:
+            predecessors.update(inverse_a[q])
+
+        touched: dict[int, set[int]] = {}
+        for p in predecessors:
+            touched.setdefault(block_of[p], set()).add(p)
+
+        for b, inside in touched.items():
+            block = blocks[b]
+            if len(inside) == len(block):
+                continue
+            # the larger half keeps the old index, so any pending (b, x)
+            # splitter now refers to it and only the smaller half is queued;
+            # either way the split costs O(|inside|), never O(|block|)
+            if 2 * len(inside) <= len(block):
+                small = inside
+                block -= inside
+            else:
+                small = block - inside
+                blocks[b] = inside
+            new = len(blocks)
+            blocks.append(small)
+            for p in small:
+                block_of[p] = new
+            for x in range(width):
+                waiting.add((new, x))
+    return block_of
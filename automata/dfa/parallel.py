@@ -0,0 +1,215 @@
+import multiprocessing
+import os
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Self
+
+from automata.dfa.compiled import DEAD, CompiledDFA
+
+# matcher of the current worker process, set once by the pool initializer
+_worker_compiled: CompiledDFA | None = None
+
+
+def chunk_mapping(compiled: CompiledDFA, chunk: str) -> array[int]:
+    """
+    State reached after reading `chunk` from every state, or ``DEAD``.
+
+    Runs from all states at once, but start states that reach the same state
+    are merged into one lane, so after a few symbols there is usually a
+    single lane left and the rest of the chunk costs as much as `run`.
+    """
+    if compiled.classes is not None:
+        chunk = compiled.classes.translate(chunk)
+    symbol_index = compiled.symbol_index
+    table = compiled.table
+    width = compiled.width
+    # current state -> the start states that have reached it
+    lanes: dict[int, list[int]] = {
+        state: [state] for state in range(len(compiled.states))
+    }
+    position = 0
+    while lanes and position < len(chunk) and len(lanes) > 1:
+        i = symbol_index.get(chunk[position])
+        position += 1
+        if i is None:
+            lanes = {}
+            break
+        next_lanes: dict[int, list[int]] = {}
+        for state, origins in lanes.items():
+            target = table[state * width + i]
+            if target >= 0:
+                merged = next_lanes.get(target)
+                if merged is None:
+                    next_lanes[target] = origins
+                else:
+                    merged.extend(origins)
+        lanes = next_lanes
+    if len(lanes) == 1:
+        ((current, origins),) = lanes.items()
+        for symbol in chunk[position:]:
+            i = symbol_index.get(symbol)
+            if i is None:
+                current = DEAD
+                break
+            current = table[current * width + i]
+            if current < 0:
+                break
+        lanes = {current: origins} if current >= 0 else {}
+
+    mapping = array("i", [DEAD]) * len(compiled.states)
+    for state, origins in lanes.items():
+        for origin in origins:
+            mapping[origin] = state
+    return mapping
+
+
+def _initialize_worker(compiled: CompiledDFA):
+    global _worker_compiled
+    _worker_compiled = compiled
+
+
+def _worker_mapping(chunk: str) -> array[int]:
+    assert _worker_compiled is not None
+    return chunk_mapping(_worker_compiled, chunk)
+
+
+def _start_method() -> str:
+    # fork is unsafe once the parent has threads, and deprecated for that
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return "forkserver"
+    return "spawn"
+
+
+class ParallelMatcher:
+    """
+    Matches long inputs by splitting them into chunks across processes.
+
+    Each worker maps every state of the DFA to the state it reaches after
+    its chunk, and the mappings are composed in input order, so the chunks
+    need not know where the previous one ended. Inputs no longer than one
+    chunk are matched in-process.
+
+    Chunks are sliced as they are submitted, and at most two per worker are
+    in flight, so memory stays bounded on inputs far larger than a chunk.
+    The process pool is started on first use and kept for later inputs
+    until `close`, or the end of a ``with`` block. An `executor` owned by
+    the caller can be passed instead; its workers then receive the DFA
+    with every chunk.
+    """
+
+    def __init__(
+        self,
+        compiled: CompiledDFA,
+        workers: int | None = None,
+        chunk_size: int = 1 << 20,
+        executor: Executor | None = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("Parameter chunk_size must be at least 1.")
+        if workers is not None and workers < 1:
+            raise ValueError("Parameter workers must be at least 1.")
+        self.compiled: CompiledDFA = compiled
+        self.workers: int | None = workers
+        self.chunk_size: int = chunk_size
+        self.executor: Executor | None = executor
+        self._owned: ProcessPoolExecutor | None = None
+
+    def boundaries(self, string: str) -> list[int]:
+        """
+        State at the start of every chunk, followed by the state at the end
+        of the input; ``DEAD`` from the first chunk that kills the match.
+        """
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("DFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        states = [self.compiled.initial]
+        if len(string) <= self.chunk_size or self.workers == 1:
+            for chunk in self._chunks(string):
+                previous = states[-1]
+                states.append(DEAD if previous < 0 else self._run_from(previous, chunk))
+            return states
+
+        executor = self._pool()
+        limit = 2 * (self.workers or os.cpu_count() or 1)
+        pending: deque[Future[array[int]]] = deque()
+
+        def collect():
+            mapping = pending.popleft().result()
+            previous = states[-1]
+            states.append(DEAD if previous < 0 else mapping[previous])
+
+        try:
+            for chunk in self._chunks(string):
+                if states[-1] < 0:
+                    break
+                if self.executor is None:
+                    pending.append(executor.submit(_worker_mapping, chunk))
+                else:
+                    pending.append(executor.submit(chunk_mapping, self.compiled, chunk))
+                if len(pending) >= limit:
+                    collect()
+            while pending:
+                collect()
+        finally:
+            for future in pending:
+                _ = future.cancel()
+        # a dead prefix ends the match, so the chunks after it are not run
+        chunks = -(-len(string) // self.chunk_size)
+        states.extend([DEAD] * (chunks + 1 - len(states)))
+        return states
+
+    def close(self):
+        """Shut down the process pool this matcher started, if any."""
+        if self._owned is not None:
+            self._owned.shutdown()
+            self._owned = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object):
+        self.close()
+
+    def run(self, string: str) -> int:
+        return self.boundaries(string)[-1]
+
+    def accepts(self, string: str) -> bool:
+        # mirrors DFA.accepts, which never accepts the empty string
+        current = self.run(string)
+        return (
+            len(string) > 0 and current >= 0 and self.compiled.accepting[current] == 1
+        )
+
+    def _chunks(self, string: str) -> Iterator[str]:
+        size = self.chunk_size
+        for start in range(0, len(string), size):
+            yield string[start : start + size]
+
+    def _pool(self) -> Executor:
+        if self.executor is not None:
+            return self.executor
+        if self._owned is None:
+            self._owned = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(_start_method()),
+                initializer=_initialize_worker,
+                initargs=(self.compiled,),
+            )
+        return self._owned
+
+    def _run_from(self, state: int, chunk: str) -> int:
+        compiled = self.compiled
+        if compiled.classes is not None:
+            chunk = compiled.classes.translate(chunk)
+        symbol_index = compiled.symbol_index
+        table = compiled.table
+        width = compiled.width
+        for symbol in chunk:
+            i = symbol_index.get(symbol)
+            if i is None:
+                return DEAD
+            state = table[state * width + i]
+            if state < 0:
+                return DEAD
+        return state
@@ -0,0 +1,262 @@
+from array import array
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+
+from automata.charclass import ClassMap
+from automata.dfa.compiled import DEAD, CompiledDFA
+from automata.state import State
+
+if TYPE_CHECKING:
+    from automata.dfa.dfa import DFA
+
+OPERATIONS = ("intersection", "union", "difference", "symmetric_difference")
+
+# table entry of a transition that has not been explored yet
+UNEXPLORED: int = -2
+
+
+def literal_classes(alphabet: set[str]) -> ClassMap:
+    """Class map with one class per symbol of `alphabet`."""
+    return ClassMap.from_intervals(((ord(c), ord(c) + 1),) for c in alphabet)
+
+
+def joint_classes(
+    left_classes: ClassMap | None,
+    left_alphabet: set[str],
+    right_classes: ClassMap | None,
+    right_alphabet: set[str],
+) -> tuple[ClassMap | None, dict[str, str | None], dict[str, str | None]]:
+    """
+    Class map telling apart every pair of classes of two automata, with the
+    symbol each side reads for every joint symbol.
+    """
+    if left_classes == right_classes:
+        alphabet = left_alphabet | right_alphabet
+        return (
+            left_classes,
+            {s: s if s in left_alphabet else None for s in alphabet},
+            {s: s if s in right_alphabet else None for s in alphabet},
+        )
+    left_map = left_classes or literal_classes(left_alphabet)
+    right_map = right_classes or literal_classes(right_alphabet)
+    representatives: dict[tuple[str | None, str | None], str] = {}
+    starts: list[int] = []
+    symbols: list[str | None] = []
+    for start in sorted(set(left_map.starts) | set(right_map.starts)):
+        signature = (
+            left_map.symbols[bisect_right(left_map.starts, start) - 1],
+            right_map.symbols[bisect_right(right_map.starts, start) - 1],
+        )
+        symbol = None
+        if signature != (None, None):
+            symbol = representatives.setdefault(signature, chr(start))
+        if not symbols or symbols[-1] != symbol:
+            starts.append(start)
+            symbols.append(symbol)
+    return (
+        ClassMap(tuple(starts), tuple(symbols)),
+        {symbol: left for (left, _), symbol in representatives.items()},
+        {symbol: right for (_, right), symbol in representatives.items()},
+    )
+
+
+def co_reachable(compiled: CompiledDFA) -> bytearray:
+    """Flag per state, set where some input leads to an accepting state."""
+    width = compiled.width
+    predecessors: list[list[int]] = [[] for _ in compiled.states]
+    for source in range(len(compiled.states)):
+        for target in compiled.table[source * width : (source + 1) * width]:
+            if target >= 0:
+                predecessors[target].append(source)
+    live = bytearray(compiled.accepting)
+    stack = [state for state, accepting in enumerate(live) if accepting]
+    while stack:
+        for source in predecessors[stack.pop()]:
+            if not live[source]:
+                live[source] = 1
+                stack.append(source)
+    return live
+
+
+class ProductDFA:
+    """
+    Lazy product of two DFAs under a boolean operation.
+
+    A state is a pair of states of the operands, with ``DEAD`` for an
+    operand that can accept nothing from where the input has led it, either
+    because it has rejected the input or because it is in a state with no
+    path to acceptance. Pairs and their transitions are only built when an
+    input first reaches them, and are kept in a flat table like
+    `CompiledDFA`, so matching costs one lookup per character instead of one
+    per character and operand. A pair is dead, which ends the match early,
+    when the operation needs an operand that is ``DEAD``: either one for an
+    intersection, both for a union or symmetric difference, and the left
+    one for a difference.
+    """
+
+    def __init__(self, left: "DFA", right: "DFA", operation: str):
+        if operation not in OPERATIONS:
+            raise ValueError(
+                f"Unknown operation {operation!r}, "
+                f"expected one of {', '.join(OPERATIONS)}."
+            )
+        self.operation: str = operation
+        self.left: CompiledDFA = left.compile()
+        self.right: CompiledDFA = right.compile()
+        self.left_live: bytearray = co_reachable(self.left)
+        self.right_live: bytearray = co_reachable(self.right)
+        self.classes, left_symbols, right_symbols = joint_classes(
+            left.classes, left.alphabet, right.classes, right.alphabet
+        )
+        self.symbols: tuple[str, ...] = tuple(sorted(left_symbols))
+        self.symbol_index: dict[str, int] = {
+            symbol: i for i, symbol in enumerate(self.symbols)
+        }
+        self.width: int = len(self.symbols)
+        # per joint symbol, the symbol index of each operand or DEAD
+        self.moves: list[tuple[int, int]] = [
+            (
+                self._index_of(self.left.symbol_index, left_symbols[symbol]),
+                self._index_of(self.right.symbol_index, right_symbols[symbol]),
+            )
+            for symbol in self.symbols
+        ]
+        self.pairs: list[tuple[int, int]] = []
+        self._pair_index: dict[tuple[int, int], int] = {}
+        self.table: array[int] = array("i")
+        self.accepting: bytearray = bytearray()
+        self.initial: int = self._add_pair(
+            self._live_pair(self.left.initial, self.right.initial)
+        )
+
+    @staticmethod
+    def _index_of(symbol_index: dict[str, int], symbol: str | None) -> int:
+        if symbol is None:
+            return DEAD
+        return symbol_index.get(symbol, DEAD)
+
+    @property
+    def size(self) -> int:
+        """Number of pairs explored so far."""
+        return len(self.pairs)
+
+    def accepts(self, string: str) -> bool:
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("DFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        symbol_index = self.symbol_index
+        table = self.table
+        width = self.width
+        current = self.initial
+        for symbol in string:
+            i = symbol_index.get(symbol)
+            if i is None:
+                return False
+            target = table[current * width + i]
+            if target == UNEXPLORED:
+                target = self._explore(current, i)
+            if target < 0:
+                return False
+            current = target
+        # mirrors DFA.accepts, which never accepts the empty string
+        return len(string) > 0 and self.accepting[current] == 1
+
+    def to_dfa(self) -> "DFA":
+        """Materialize every reachable pair as a DFA."""
+        from automata.dfa.dfa import DFA
+
+        i = 0
+        while i < len(self.pairs):
+            for a in range(self.width):
+                if self.table[i * self.width + a] == UNEXPLORED:
+                    _ = self._explore(i, a)
+            i += 1
+        names = [State(f"{State.base_name}{p}") for p in range(len(self.pairs))]
+        transitions: dict[State, dict[str, State]] = {}
+        for p, name in enumerate(names):
+            row = {
+                symbol: names[target]
+                for a, symbol in enumerate(self.symbols)
+                if (target := self.table[p * self.width + a]) >= 0
+            }
+            if row:
+                transitions[name] = row
+        initial = names[self.initial]
+        dfa = DFA(
+            set(names),
+            set(self.symbols),
+            transitions or {initial: {}},
+            initial,
+            {name for p, name in enumerate(names) if self.accepting[p]},
+        )
+        dfa.classes = self.classes
+        return dfa
+
+    def _explore(self, current: int, i: int) -> int:
+        left, right = self.pairs[current]
+        a, b = self.moves[i]
+        if left >= 0 and a >= 0:
+            left = self.left.table[left * self.left.width + a]
+        else:
+            left = DEAD
+        if right >= 0 and b >= 0:
+            right = self.right.table[right * self.right.width + b]
+        else:
+            right = DEAD
+        left, right = self._live_pair(left, right)
+        target = self._pair_index.get((left, right))
+        if target is None:
+            target = (
+                DEAD if self._is_dead(left, right) else self._add_pair((left, right))
+            )
+        self.table[current * self.width + i] = target
+        return target
+
+    def _live_pair(self, left: int, right: int) -> tuple[int, int]:
+        if left >= 0 and not self.left_live[left]:
+            left = DEAD
+        if right >= 0 and not self.right_live[right]:
+            right = DEAD
+        return left, right
+
+    def _add_pair(self, pair: tuple[int, int]) -> int:
+        index = len(self.pairs)
+        self.pairs.append(pair)
+        self._pair_index[pair] = index
+        self.table.extend([UNEXPLORED] * self.width)
+        left, right = pair
+        left_accepts = left >= 0 and self.left.accepting[left] == 1
+        right_accepts = right >= 0 and self.right.accepting[right] == 1
+        if self.operation == "intersection":
+            accepting = left_accepts and right_accepts
+        elif self.operation == "union":
+            accepting = left_accepts or right_accepts
+        elif self.operation == "symmetric_difference":
+            accepting = left_accepts != right_accepts
+        else:
+            accepting = left_accepts and not right_accepts
+        self.accepting.append(accepting)
+        return index
+
+    def _is_dead(self, left: int, right: int) -> bool:
+        if self.operation == "intersection":
+            return left < 0 or right < 0
+        if self.operation in ("union", "symmetric_difference"):
+            return left < 0 and right < 0
+        return left < 0
+
+    def __and__(self, other: "DFA | ProductDFA") -> "ProductDFA":
+        return self.to_dfa() & other
+
+    def __or__(self, other: "DFA | ProductDFA") -> "ProductDFA":
+        return self.to_dfa() | other
+
+    def __sub__(self, other: "DFA | ProductDFA") -> "ProductDFA":
+        return self.to_dfa() - other
+
+    def __xor__(self, other: "DFA | ProductDFA") -> "ProductDFA":
+        return self.to_dfa() ^ other
+
+    def __invert__(self) -> "DFA":
+        return ~self.to_dfa()
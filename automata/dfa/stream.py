@@ -0,0 +1,81 @@
+from collections.abc import Iterable
+
+from automata.dfa.compiled import DEAD, CompiledDFA
+from automata.state import State
+
+
+class StreamMatcher:
+    """
+    Resumable DFA matcher that reads its input chunk by chunk.
+
+    Feeding chunks `a` then `b` leaves the matcher in the same state as
+    matching `a + b` at once, so `is_accepting` agrees with `DFA.accepts`.
+    Once the DFA reaches a dead state, further input is not read.
+    """
+
+    def __init__(self, compiled: CompiledDFA):
+        self.compiled: CompiledDFA = compiled
+        self.state: int = compiled.initial
+        self.consumed: int = 0
+
+    def feed(self, chunk: str) -> bool:
+        """Advance over `chunk`; returns False once the matcher is dead."""
+        if not isinstance(chunk, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("DFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        current = self.state
+        if current < 0:
+            return False
+        compiled = self.compiled
+        if compiled.classes is not None:
+            chunk = compiled.classes.translate(chunk)
+        symbol_index = compiled.symbol_index
+        table = compiled.table
+        width = compiled.width
+        for position, symbol in enumerate(chunk):
+            i = symbol_index.get(symbol)
+            current = DEAD if i is None else table[current * width + i]
+            if current < 0:
+                self.state = DEAD
+                self.consumed += position + 1
+                return False
+        self.state = current
+        self.consumed += len(chunk)
+        return True
+
+    def consume(self, chunks: Iterable[str]) -> bool:
+        """Feed chunks until they run out or the matcher dies."""
+        for chunk in chunks:
+            if not self.feed(chunk):
+                break
+        return self.is_accepting
+
+    @property
+    def is_accepting(self) -> bool:
+        # mirrors DFA.accepts, which never accepts the empty string
+        return (
+            self.consumed > 0
+            and self.state >= 0
+            and self.compiled.accepting[self.state] == 1
+        )
+
+    @property
+    def is_dead(self) -> bool:
+        return self.state < 0
+
+    @property
+    def current_state(self) -> State | None:
+        return None if self.state < 0 else self.compiled.states[self.state]
+
+    def reset(self):
+        self.state = self.compiled.initial
+        self.consumed = 0
+
+    def snapshot(self) -> tuple[int, int]:
+        return self.state, self.consumed
+
+    def restore(self, snapshot: tuple[int, int]):
+        state, consumed = snapshot
+        if not DEAD <= state < len(self.compiled.states) or consumed < 0:
+            raise ValueError("Snapshot does not belong to this matcher.")
+        self.state = state
+        self.consumed = consumed
@@ -0,0 +1,108 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import ParamSpec, TypeVar, override
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# called as hook(name, value) with every count added and every time taken
+Hook = Callable[[str, float], None]
+
+
+class Stats:
+    """
+    Counters and timings collected while instrumentation is enabled.
+
+    Counters are named after what they count, such as "nfa.subsets" or
+    "cache.hits". Timed operations, such as "regex.parse", add their
+    seconds to `timings` and one call to the counter of the same name.
+    """
+
+    __slots__ = ("counters", "timings", "hook")
+
+    def __init__(self, hook: Hook | None = None):
+        self.counters: dict[str, int] = {}
+        self.timings: dict[str, float] = {}
+        self.hook: Hook | None = hook
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+        if self.hook is not None:
+            self.hook(name, amount)
+
+    def time(self, name: str, seconds: float):
+        self.counters[name] = self.counters.get(name, 0) + 1
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+        if self.hook is not None:
+            self.hook(name, seconds)
+
+    def reset(self):
+        self.counters.clear()
+        self.timings.clear()
+
+    def as_dict(self) -> dict[str, dict[str, int] | dict[str, float]]:
+        return {"counters": dict(self.counters), "timings": dict(self.timings)}
+
+    @override
+    def __repr__(self):
+        return f"Stats(counters={self.counters!r}, timings={self.timings!r})"
+
+
+# the stats being collected, or None while instrumentation is disabled
+_active: Stats | None = None
+
+
+def active() -> Stats | None:
+    """
+    Stats being collected, or None. Instrumented code reads this once per
+    call and skips all bookkeeping when it is None.
+    """
+    return _active
+
+
+def enable(hook: Hook | None = None) -> Stats:
+    """Start collecting into new stats, replacing any being collected."""
+    global _active
+    _active = Stats(hook)
+    return _active
+
+
+def disable() -> Stats | None:
+    """Stop collecting; returns the stats collected so far."""
+    global _active
+    stats, _active = _active, None
+    return stats
+
+
+@contextmanager
+def collect(hook: Hook | None = None) -> Iterator[Stats]:
+    """Collect stats for the duration of a `with` block."""
+    global _active
+    previous = _active
+    stats = enable(hook)
+    try:
+        yield stats
+    finally:
+        _active = previous
+
+
+def timed(name: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    """Decorator timing every call under `name` while enabled."""
+
+    def decorate(function: Callable[P, T]) -> Callable[P, T]:
+        @wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            stats = _active
+            if stats is None:
+                return function(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stats.time(name, perf_counter() - start)
+
+        return wrapper
+
+    return decorate
@@ -1,3 +1,6 @@
+from .builder import NFABuilder as NFABuilder
+from .compiled import CompiledNFA as CompiledNFA
 from .epsilon import Epsilon as Epsilon
 from .epsilon import epsilon as epsilon
+from .lazy import LazyDFA as LazyDFA
 from .nfa import NFA as NFA
@@ -0,0 +1,142 @@
+from collections.abc import Iterable
+
+from automata.nfa.epsilon import Epsilon, epsilon
+from automata.nfa.nfa import NFA
+from automata.state import State
+
+Fragment = tuple[int, int]
+
+
+class NFABuilder:
+    """
+    Thompson construction over an arena of integer states.
+
+    Combinators add edges in place and return `(start, accept)` fragments,
+    so no transitions are copied or validated until `build` turns a
+    fragment into an `NFA`. The accept state of a fragment never has
+    outgoing edges.
+    """
+
+    def __init__(self):
+        self.edges: list[dict[str | Epsilon, set[int]]] = []
+        self.alphabet: set[str] = set()
+
+    def new_state(self) -> int:
+        self.edges.append({})
+        return len(self.edges) - 1
+
+    def add_edge(self, source: int, symbol: str | Epsilon, target: int):
+        if symbol is not epsilon:
+            self.alphabet.add(symbol)  # pyright: ignore[reportArgumentType]
+        self.edges[source].setdefault(symbol, set()).add(target)
+
+    def symbol(self, symbol: str) -> Fragment:
+        start = self.new_state()
+        accept = self.new_state()
+        self.add_edge(start, symbol, accept)
+        return start, accept
+
+    def symbols(self, symbols: Iterable[str]) -> Fragment:
+        """One edge per symbol between a single pair of states."""
+        start = self.new_state()
+        accept = self.new_state()
+        for symbol in symbols:
+            self.add_edge(start, symbol, accept)
+        return start, accept
+
+    def empty(self) -> Fragment:
+        start = self.new_state()
+        accept = self.new_state()
+        self.add_edge(start, epsilon, accept)
+        return start, accept
+
+    def concat(self, left: Fragment, right: Fragment) -> Fragment:
+        self.add_edge(left[1], epsilon, right[0])
+        return left[0], right[1]
+
+    def union(self, left: Fragment, right: Fragment) -> Fragment:
+        start = self.new_state()
+        accept = self.new_state()
+        for fragment in (left, right):
+            self.add_edge(start, epsilon, fragment[0])
+            self.add_edge(fragment[1], epsilon, accept)
+        return start, accept
+
+    def star(self, fragment: Fragment, plus: bool = False) -> Fragment:
+        start = self.new_state()
+        accept = self.new_state()
+        self.add_edge(start, epsilon, fragment[0])
+        self.add_edge(fragment[1], epsilon, accept)
+        self.add_edge(fragment[1], epsilon, fragment[0])
+        if not plus:
+            self.add_edge(start, epsilon, accept)
+        return start, accept
+
+    def optional(self, fragment: Fragment) -> Fragment:
+        start = self.new_state()
+        accept = self.new_state()
+        self.add_edge(start, epsilon, fragment[0])
+        self.add_edge(fragment[1], epsilon, accept)
+        self.add_edge(start, epsilon, accept)
+        return start, accept
+
+    def copy(self, fragment: Fragment) -> Fragment:
+        """Fresh copy of the states reachable from the fragment's start."""
+        copies: dict[int, int] = {fragment[0]: self.new_state()}
+        pending = [fragment[0]]
+        while pending:
+            source = pending.pop()
+            for symbol, targets in list(self.edges[source].items()):
+                for target in targets:
+                    if target not in copies:
+                        copies[target] = self.new_state()
+                        pending.append(target)
+                    self.add_edge(copies[source], symbol, copies[target])
+        if fragment[1] not in copies:
+            copies[fragment[1]] = self.new_state()
+        return copies[fragment[0]], copies[fragment[1]]
+
+    def repeat(self, fragment: Fragment, minimum: int, maximum: int | None) -> Fragment:
+        """
+        Between `minimum` and `maximum` (unbounded if None) repetitions.
+
+        Copies are taken before any of them is wrapped, since wrapping adds
+        edges to the fragment that must not be copied along.
+        """
+        if maximum == 0:
+            return self.empty()
+        count = max(minimum, 1) if maximum is None else maximum
+        copies = [fragment] + [self.copy(fragment) for _ in range(count - 1)]
+        if maximum is None:
+            last = self.star(copies[-1], plus=minimum > 0)
+            pieces = copies[:-1] + [last]
+        else:
+            pieces = copies[:minimum] + [self.optional(c) for c in copies[minimum:]]
+        out = pieces[0]
+        for piece in pieces[1:]:
+            out = self.concat(out, piece)
+        return out
+
+    def build(self, fragment: Fragment, accepting: Iterable[int] = ()) -> NFA:
+        """
+        States are named from `State.base_name` and their arena index.
+
+        States in `accepting` are accepting in addition to the fragment's
+        accept state.
+        """
+        states = [State(f"{State.base_name}{i}") for i in range(len(self.edges))]
+        transitions: dict[State, dict[str | Epsilon, set[State]]] = {
+            states[i]: {
+                symbol: {states[target] for target in targets}
+                for symbol, targets in row.items()
+            }
+            for i, row in enumerate(self.edges)
+            if row
+        }
+        return NFA(
+            set(states),
+            set(self.alphabet),
+            transitions,
+            {states[fragment[0]]},
+            {states[fragment[1]], *(states[i] for i in accepting)},
+        )
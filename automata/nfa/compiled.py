@@ -0,0 +1,296 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, override
+
+from automata.charclass import ClassMap
+from automata.state import State
+
+if TYPE_CHECKING:
+    from automata.nfa.nfa import NFA
+    from automata.regex.prefilter import Prefilter
+
+# positions whose follow sets are unioned by one cached lookup
+CHUNK: int = 8
+
+# a state entered on a set of symbols, or None for the start position
+Position = tuple[State, frozenset[str]] | None
+
+
+class CompiledNFA:
+    """
+    Frozen, bit-parallel matcher for an NFA.
+
+    The NFA is recompiled into positions, as in a Glushkov automaton:
+    position 0 is the start, and every other position is a state together
+    with the symbols it is entered on, with epsilon closures folded into the
+    follow sets. Every transition into a position reads the same symbols, so
+    a step is ``follow(active) & masks[symbol]`` on Python ints.
+
+    Positions are numbered depth-first, so most are followed by the next
+    one and ``(active & linear) << 1`` covers those moves at once, as in
+    shift-and matching. The remaining `extra` follow sets are unioned
+    `CHUNK` positions at a time, through a cache filled as inputs need it.
+
+    With a `prefilter`, `accepts` rejects inputs missing its literals by
+    substring search before any step is taken.
+    """
+
+    __slots__ = (
+        "states",
+        "symbols",
+        "symbol_index",
+        "closures",
+        "masks",
+        "linear",
+        "extra",
+        "irregular",
+        "initial",
+        "accepting",
+        "classes",
+        "prefilter",
+        "_follows",
+    )
+
+    states: tuple[State, ...]
+    symbols: tuple[str, ...]
+    symbol_index: dict[str, int]
+    closures: tuple[int, ...]
+    masks: tuple[int, ...]
+    linear: int
+    extra: tuple[int, ...]
+    irregular: int
+    initial: int
+    accepting: int
+    classes: ClassMap | None
+    prefilter: "Prefilter | None"
+    _follows: dict[int, int]
+
+    def __init__(
+        self,
+        states: tuple[State, ...],
+        symbols: tuple[str, ...],
+        closures: tuple[int, ...],
+        masks: tuple[int, ...],
+        linear: int,
+        extra: tuple[int, ...],
+        accepting: int,
+        classes: ClassMap | None = None,
+        prefilter: "Prefilter | None" = None,
+    ):
+        if not closures or len(extra) != len(closures):
+            raise ValueError("Follow sets do not match the number of positions.")
+        if len(masks) != len(symbols):
+            raise ValueError("Symbol masks do not match the symbols.")
+        object.__setattr__(self, "states", states)
+        object.__setattr__(self, "symbols", symbols)
+        object.__setattr__(
+            self, "symbol_index", {symbol: i for i, symbol in enumerate(symbols)}
+        )
+        object.__setattr__(self, "closures", closures)
+        object.__setattr__(self, "masks", masks)
+        object.__setattr__(self, "linear", linear)
+        object.__setattr__(self, "extra", extra)
+        object.__setattr__(
+            self, "irregular", sum(1 << p for p, mask in enumerate(extra) if mask)
+        )
+        object.__setattr__(self, "initial", 1)
+        object.__setattr__(self, "accepting", accepting)
+        object.__setattr__(self, "classes", classes)
+        object.__setattr__(self, "prefilter", prefilter)
+        object.__setattr__(self, "_follows", {})
+
+    @classmethod
+    def from_nfa(cls, nfa: "NFA") -> "CompiledNFA":
+        states = tuple(sorted(nfa.states, key=lambda s: s.name))
+        symbols = tuple(sorted(nfa.alphabet))
+        index = {state: i for i, state in enumerate(states)}
+        closure_sets = nfa._state_closures()  # pyright: ignore[reportPrivateUsage]
+
+        # per state, the states it moves to and the symbols it moves on
+        moves: dict[State, dict[State, set[str]]] = {}
+        for source, row in nfa.transitions.items():
+            for symbol, targets in row.items():
+                if isinstance(symbol, str):
+                    for target in targets:
+                        moves.setdefault(source, {}).setdefault(target, set()).add(
+                            symbol
+                        )
+
+        def closed(position: Position) -> frozenset[State]:
+            if position is None:
+                return frozenset().union(*(closure_sets[q] for q in nfa.initial))
+            return closure_sets[position[0]]
+
+        def successors(position: Position) -> list[Position]:
+            found = {
+                (target, frozenset(labels))
+                for source in closed(position)
+                for target, labels in moves.get(source, {}).items()
+            }
+            return sorted(found, key=lambda p: (index[p[0]], sorted(p[1])))
+
+        # depth-first, so a position is usually numbered right after the
+        # first position it leads to
+        order: list[Position] = []
+        number: dict[Position, int] = {}
+        follow_lists: list[list[Position]] = []
+        stack: list[Position] = [None]
+        while stack:
+            position = stack.pop()
+            if position in number:
+                continue
+            number[position] = len(order)
+            order.append(position)
+            follow = successors(position)
+            follow_lists.append(follow)
+            stack.extend(reversed(follow))
+
+        def mask(subset: Iterable[State]) -> int:
+            return sum(1 << index[state] for state in subset)
+
+        linear = 0
+        extra: list[int] = []
+        for p, follow in enumerate(follow_lists):
+            follow_mask = sum(1 << number[position] for position in follow)
+            if follow_mask >> (p + 1) & 1:
+                linear |= 1 << p
+                follow_mask ^= 1 << (p + 1)
+            extra.append(follow_mask)
+        masks = [0] * len(symbols)
+        symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        for p, position in enumerate(order):
+            if position is not None:
+                for symbol in position[1]:
+                    masks[symbol_index[symbol]] |= 1 << p
+        accepting = sum(
+            1 << p
+            for p, position in enumerate(order)
+            if not nfa.accepting.isdisjoint(closed(position))
+        )
+        return cls(
+            states,
+            symbols,
+            tuple(mask(closed(position)) for position in order),
+            tuple(masks),
+            linear,
+            tuple(extra),
+            accepting,
+            nfa.classes,
+        )
+
+    def follow(self, current: int) -> int:
+        """Positions that can follow the active ones, on any symbol."""
+        follow = (current & self.linear) << 1
+        irregular = current & self.irregular
+        while irregular:
+            shift = (irregular & -irregular).bit_length() - 1
+            shift -= shift % CHUNK
+            block = (irregular >> shift) & ((1 << CHUNK) - 1)
+            follow |= self._follow_block(shift, block)
+            irregular ^= block << shift
+        return follow
+
+    def _follow_block(self, shift: int, block: int) -> int:
+        key = shift << CHUNK | block
+        found = self._follows.get(key)
+        if found is None:
+            found = 0
+            for i in range(CHUNK):
+                if block >> i & 1:
+                    found |= self.extra[shift + i]
+            self._follows[key] = found
+        return found
+
+    def step(self, current: int, symbol: str) -> int:
+        if self.classes is not None:
+            symbol = self.classes.symbol(symbol) or symbol
+        i = self.symbol_index.get(symbol)
+        if i is None:
+            return 0
+        return self.follow(current) & self.masks[i]
+
+    def run(self, string: str) -> int:
+        """Mask of the positions active after reading `string`; 0 once dead."""
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        symbol_index = self.symbol_index
+        masks = self.masks
+        linear = self.linear
+        all_irregular = self.irregular
+        follow_block = self._follow_block
+        current = self.initial
+        for symbol in string:
+            i = symbol_index.get(symbol)
+            if i is None:
+                return 0
+            follow = (current & linear) << 1
+            irregular = current & all_irregular
+            while irregular:
+                shift = (irregular & -irregular).bit_length() - 1
+                shift -= shift % CHUNK
+                block = (irregular >> shift) & ((1 << CHUNK) - 1)
+                follow |= follow_block(shift, block)
+                irregular ^= block << shift
+            current = follow & masks[i]
+            if not current:
+                return 0
+        return current
+
+    def accepts(self, string: str) -> bool:
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("NFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        if self.prefilter is not None and not self.prefilter.may_fullmatch(string):
+            return False
+        return (self.run(string) & self.accepting) != 0
+
+    def accepts_many(self, strings: Iterable[str]) -> bytearray:
+        """Acceptance of every string, one byte each, in input order."""
+        results = bytearray()
+        append = results.append
+        accepting = self.accepting
+        prefilter = self.prefilter
+        for string in strings:
+            if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+                raise TypeError("NFA expects string input only.")  # pyright: ignore[reportUnreachable]
+            if prefilter is not None and not prefilter.may_fullmatch(string):
+                append(False)
+                continue
+            append((self.run(string) & accepting) != 0)
+        return results
+
+    def with_prefilter(self, prefilter: "Prefilter | None") -> "CompiledNFA":
+        """Copy that consults `prefilter` before matching, if it knows anything."""
+        if prefilter is not None and not (prefilter.prefixes or prefilter.required):
+            prefilter = None
+        return CompiledNFA(
+            self.states,
+            self.symbols,
+            self.closures,
+            self.masks,
+            self.linear,
+            self.extra,
+            self.accepting,
+            self.classes,
+            prefilter,
+        )
+
+    def to_states(self, mask: int) -> set[State]:
+        """States of the NFA active while the positions in `mask` are."""
+        closed = 0
+        for p, closure in enumerate(self.closures):
+            if mask >> p & 1:
+                closed |= closure
+        return {state for i, state in enumerate(self.states) if closed >> i & 1}
+
+    @override
+    def __setattr__(self, name: str, value: object, /):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    @override
+    def __delattr__(self, name: str, /):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    @override
+    def __repr__(self):
+        return (
+            f"CompiledNFA(positions={len(self.closures)}, symbols={len(self.symbols)})"
+        )
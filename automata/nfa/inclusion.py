@@ -0,0 +1,89 @@
+from collections import deque
+from typing import TYPE_CHECKING
+
+from automata.dfa.product import joint_classes
+from automata.state import State
+
+if TYPE_CHECKING:
+    from automata.nfa.nfa import NFA
+
+
+def antichain_counterexample(left: "NFA", right: "NFA") -> str | None:
+    """
+    Shortest string accepted by `left` but not by `right`, or None if the
+    language of `left` is included in that of `right`.
+
+    Explores pairs of a state of `left` and the subset of `right` reached
+    by the same string, breadth-first. A pair is dropped when an earlier
+    pair has the same state of `left` and a smaller subset, since any
+    counterexample from the larger subset is one from the smaller subset
+    too. Only the minimal subsets per state are kept, so `right` is
+    never fully determinized.
+    """
+    _, left_symbols, right_symbols = joint_classes(
+        left.classes, left.alphabet, right.classes, right.alphabet
+    )
+    symbols = sorted(left_symbols)
+    left_closures = left._state_closures()  # pyright: ignore[reportPrivateUsage]
+    right_closures = right._state_closures()  # pyright: ignore[reportPrivateUsage]
+    right_accepting = right.accepting
+
+    def closure(
+        states: set[State] | frozenset[State],
+        closures: dict[State, frozenset[State]],
+    ) -> frozenset[State]:
+        return frozenset(states).union(*(closures.get(q, ()) for q in states))
+
+    posts: dict[tuple[frozenset[State], str], frozenset[State]] = {}
+
+    def post(subset: frozenset[State], symbol: str) -> frozenset[State]:
+        key = subset, symbol
+        found = posts.get(key)
+        if found is None:
+            targets: set[State] = set()
+            for q in subset:
+                targets.update(right.transitions.get(q, {}).get(symbol, ()))
+            found = posts[key] = closure(targets, right_closures)
+        return found
+
+    # visited pairs, as (state, subset, index of the previous pair, symbol)
+    pairs: list[tuple[State, frozenset[State], int, str]] = []
+    antichain: dict[State, list[frozenset[State]]] = {}
+    queue: deque[int] = deque()
+
+    def visit(state: State, subset: frozenset[State], previous: int, symbol: str):
+        minimal = antichain.setdefault(state, [])
+        if any(other <= subset for other in minimal):
+            return False
+        minimal[:] = [other for other in minimal if not subset <= other]
+        minimal.append(subset)
+        pairs.append((state, subset, previous, symbol))
+        queue.append(len(pairs) - 1)
+        return state in left.accepting and right_accepting.isdisjoint(subset)
+
+    def path(index: int) -> str:
+        path: list[str] = []
+        while index >= 0:
+            _, _, index, symbol = pairs[index]
+            path.append(symbol)
+        return "".join(reversed(path))
+
+    initial = closure(right.initial, right_closures)
+    for state in closure(left.initial, left_closures):
+        if visit(state, initial, -1, ""):
+            return path(len(pairs) - 1)
+    empty: frozenset[State] = frozenset()
+    while queue:
+        index = queue.popleft()
+        state, subset, _, _ = pairs[index]
+        row = left.transitions.get(state, {})
+        for symbol in symbols:
+            left_symbol = left_symbols[symbol]
+            if left_symbol is None or left_symbol not in row:
+                continue
+            right_symbol = right_symbols[symbol]
+            next_subset = empty if right_symbol is None else post(subset, right_symbol)
+            for target in closure(row[left_symbol], left_closures):
+                if visit(target, next_subset, index, symbol):
+                    return path(len(pairs) - 1)
+    return None
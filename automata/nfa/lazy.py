@@ -0,0 +1,128 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from automata import instrumentation
+from automata.state import State
+
+if TYPE_CHECKING:
+    from automata.nfa.nfa import NFA
+
+EVICTION_POLICIES = ("lru", "flush")
+
+
+class LazyDFA:
+    """
+    On-the-fly determinization of an NFA.
+
+    Only the epsilon-closed subsets reached by the input are built, and their
+    outgoing transitions are memoized in a cache holding at most `max_states`
+    subsets. When the cache is full, the least recently used subset is
+    evicted ("lru") or the whole cache is cleared ("flush"). If a single
+    input evicts more than `max_states` subsets, the cache is thrashing and
+    the rest of that input is matched by plain NFA simulation.
+    """
+
+    def __init__(self, nfa: "NFA", max_states: int = 1024, eviction: str = "lru"):
+        if max_states < 1:
+            raise ValueError("Parameter max_states must be at least 1.")
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy {eviction!r}, "
+                f"expected one of {', '.join(EVICTION_POLICIES)}."
+            )
+        self.max_states: int = max_states
+        self.eviction: str = eviction
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.fallbacks: int = 0
+
+        self._classes = nfa.classes
+        self._transitions = nfa.transitions
+        self._closures = nfa._state_closures()  # pyright: ignore[reportPrivateUsage]
+        self._alphabet = frozenset(nfa.alphabet)
+        self._accepting = frozenset(nfa.accepting)
+        self._initial = frozenset().union(*(self._closures[q] for q in nfa.initial))
+        self._cache: OrderedDict[frozenset[State], dict[str, frozenset[State]]] = (
+            OrderedDict()
+        )
+
+    @property
+    def cache_size(self) -> int:
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    def accepts(self, string: str) -> bool:
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("NFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        if self._classes is not None:
+            string = self._classes.translate(string)
+        stats = instrumentation.active()
+        hits, misses = self.hits, self.misses
+        try:
+            return self._accepts(string)
+        finally:
+            if stats is not None:
+                stats.count("lazy_dfa.hits", self.hits - hits)
+                stats.count("lazy_dfa.misses", self.misses - misses)
+
+    def _accepts(self, string: str) -> bool:
+        cache = self._cache
+        alphabet = self._alphabet
+        lru = self.eviction == "lru"
+        evictions_before = self.evictions
+        current = self._initial
+        for i, symbol in enumerate(string):
+            if symbol not in alphabet or not current:
+                return False
+            row = cache.get(current)
+            if row is None:
+                row = self._new_row(current)
+            elif lru:
+                cache.move_to_end(current)
+            next_subset = row.get(symbol)
+            if next_subset is None:
+                self.misses += 1
+                next_subset = row[symbol] = self._successor(current, symbol)
+            else:
+                self.hits += 1
+            current = next_subset
+            if self.evictions - evictions_before > self.max_states:
+                self.fallbacks += 1
+                return self._simulate(current, string[i + 1 :])
+        return not self._accepting.isdisjoint(current)
+
+    def _new_row(self, subset: frozenset[State]) -> dict[str, frozenset[State]]:
+        cache = self._cache
+        if len(cache) >= self.max_states:
+            if self.eviction == "lru":
+                _ = cache.popitem(last=False)
+                self.evictions += 1
+            else:
+                self.evictions += len(cache)
+                cache.clear()
+        row: dict[str, frozenset[State]] = {}
+        cache[subset] = row
+        return row
+
+    def _successor(self, subset: frozenset[State], symbol: str) -> frozenset[State]:
+        closures = self._closures
+        transitions = self._transitions
+        return frozenset().union(
+            *(
+                closures[r]
+                for q in subset
+                for r in transitions.get(q, {}).get(symbol, ())
+            )
+        )
+
+    def _simulate(self, current: frozenset[State], string: str) -> bool:
+        alphabet = self._alphabet
+        for symbol in string:
+            if symbol not in alphabet or not current:
+                return False
+            current = self._successor(current, symbol)
+        return not self._accepting.isdisjoint(current)
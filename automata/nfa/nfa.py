@@ -1,9 +1,14 @@
-from functools import reduce
+from collections.abc import Iterable, Iterator
 from typing import override
 
+from automata import instrumentation
 from automata.automaton import Automaton
+from automata.comparison import Comparison
 from automata.dfa.dfa import DFA
+from automata.nfa.compiled import CompiledNFA
 from automata.nfa.epsilon import Epsilon, epsilon
+from automata.nfa.inclusion import antichain_counterexample
+from automata.nfa.lazy import LazyDFA
 from automata.state import State
 
 
@@ -32,24 +37,102 @@ class NFA(Automaton):
         if len(initial) > 1:
             _ = self._merge_initial_states()
 
-    def epsilon_closure(self, states: set[State]):
-        closure: set[State] = states
-        stack: list[State] = list(states)
-        while stack:
-            state: State = stack.pop()
-            if epsilon in self.transitions.get(state, {}):
-                for next_state in self.delta(state, epsilon):
-                    if next_state not in closure:
-                        closure.add(next_state)
-                        stack.append(next_state)
+    @property
+    def transitions(self) -> dict[State, dict[str | Epsilon, set[State]]]:
+        return self._transitions
+
+    @transitions.setter
+    def transitions(self, transitions: dict[State, dict[str | Epsilon, set[State]]]):
+        self._transitions: dict[State, dict[str | Epsilon, set[State]]] = transitions
+        self._invalidate_closures()
+
+    def _invalidate_closures(self):
+        """Must be called after transitions are changed in place."""
+        self._closures: dict[State, frozenset[State]] | None = None
+
+    def epsilon_closure(self, states: set[State]) -> set[State]:
+        closures = self._state_closures()
+        closure: set[State] = set(states)
+        for state in states:
+            closure.update(closures.get(state, ()))
         return closure
 
+    def _state_closures(self) -> dict[State, frozenset[State]]:
+        if self._closures is None:
+            self._closures = self._compute_closures()
+        return self._closures
+
+    def _compute_closures(self) -> dict[State, frozenset[State]]:
+        """
+        Epsilon closure of every state, computed once per strongly connected
+        component of the epsilon graph.
+
+        Tarjan's algorithm completes a component only after every component
+        reachable from it, so the closure of a component is its own states
+        plus the already known closures of the components it points to.
+        """
+        transitions = self._transitions
+
+        def targets(state: State) -> set[State] | tuple[()]:
+            return transitions.get(state, {}).get(epsilon, ())
+
+        closures: dict[State, frozenset[State]] = {}
+        index: dict[State, int] = {}
+        lowlink: dict[State, int] = {}
+        stack: list[State] = []
+        on_stack: set[State] = set()
+        for root in self.states:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(targets(root)))]
+            while work:
+                state, successors = work[-1]
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = len(index)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(targets(successor))))
+                        break
+                    if successor in on_stack:
+                        lowlink[state] = min(lowlink[state], index[successor])
+                else:
+                    _ = work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[state])
+                    if lowlink[state] != index[state]:
+                        continue
+                    component: set[State] = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == state:
+                            break
+                    closure = set(component)
+                    for member in component:
+                        for successor in targets(member):
+                            if successor not in component:
+                                closure.update(closures[successor])
+                    frozen = frozenset(closure)
+                    for member in component:
+                        closures[member] = frozen
+        stats = instrumentation.active()
+        if stats is not None:
+            stats.count("nfa.closures", len(closures))
+        return closures
+
     def _merge_initial_states(self, new_initial: None | State = None) -> State:
         new_initial = new_initial or NFA._new_unique_state(self.states)
         self.transitions[new_initial] = {}
         self.transitions[new_initial][epsilon] = self.initial
         self.states.add(new_initial)
         self.initial = {new_initial}
+        self._invalidate_closures()
         return new_initial
 
     def _merge_accepting_states(self, new_accepting: None | State = None) -> State:
@@ -59,6 +142,7 @@ class NFA(Automaton):
             self.transitions[accepting][epsilon] = {new_accepting}
         self.states.add(new_accepting)
         self.accepting = {new_accepting}
+        self._invalidate_closures()
         return new_accepting
 
     @classmethod
@@ -90,11 +174,14 @@ class NFA(Automaton):
     @classmethod
     def kleene_star(cls, nfa: "NFA", plus: bool = False) -> "NFA":
         new_nfa = NFA(
-            states=nfa.states,
-            alphabet=nfa.alphabet,
-            transitions=nfa.transitions,
-            initial=nfa.initial,
-            accepting=nfa.accepting,
+            states=set(nfa.states),
+            alphabet=set(nfa.alphabet),
+            transitions={
+                state: {symbol: set(targets) for symbol, targets in row.items()}
+                for state, row in nfa.transitions.items()
+            },
+            initial=set(nfa.initial),
+            accepting=set(nfa.accepting),
         )
         new_initial = new_nfa._merge_initial_states()
         new_accepting = new_nfa._merge_accepting_states()
@@ -106,81 +193,279 @@ class NFA(Automaton):
             new_nfa.transitions[accepting][epsilon] = (
                 new_nfa.transitions[accepting][epsilon] | nfa.initial
             )
+        new_nfa._invalidate_closures()
         return new_nfa
 
-    def to_dfa(self) -> DFA:
-        dfa_initial = self.epsilon_closure(self.initial)
-        dfa_states: list[set[State]] = [dfa_initial]
-        dfa_transitions: dict[State, dict[str, State]] = {}
+    def remove_epsilons(self) -> "NFA":
+        """
+        Equivalent NFA without epsilon transitions.
+
+        A state moves on a symbol wherever a state in its epsilon closure
+        does, and accepts if its closure meets an accepting state. States
+        that are unreachable, or from which no accepting state is reachable,
+        are pruned, and states with the same acceptance and the same outgoing
+        transitions are merged.
+        """
+        closures = self._state_closures()
+        rows: dict[State, dict[str, set[State]]] = {}
+        reachable: list[State] = list(self.initial)
+        seen: set[State] = set(reachable)
+        i = 0
+        while i < len(reachable):
+            state = reachable[i]
+            i += 1
+            row: dict[str, set[State]] = {}
+            for member in closures.get(state, (state,)):
+                for symbol, targets in self.transitions.get(member, {}).items():
+                    if symbol is not epsilon:
+                        row.setdefault(symbol, set()).update(targets)  # pyright: ignore[reportArgumentType]
+            rows[state] = row
+            for targets in row.values():
+                for target in targets:
+                    if target not in seen:
+                        seen.add(target)
+                        reachable.append(target)
+        accepting = {
+            state
+            for state in reachable
+            if not self.accepting.isdisjoint(closures.get(state, (state,)))
+        }
+
+        predecessors: dict[State, set[State]] = {}
+        for state, row in rows.items():
+            for targets in row.values():
+                for target in targets:
+                    predecessors.setdefault(target, set()).add(state)
+        useful: set[State] = set(accepting)
+        stack: list[State] = list(accepting)
+        while stack:
+            for predecessor in predecessors.get(stack.pop(), ()):
+                if predecessor not in useful:
+                    useful.add(predecessor)
+                    stack.append(predecessor)
+        keep = useful | self.initial
+        rows = {
+            state: {
+                symbol: kept
+                for symbol, targets in rows[state].items()
+                if (kept := targets & useful)
+            }
+            for state in reachable
+            if state in keep
+        }
+
+        while True:
+            representative: dict[State, State] = {}
+            by_signature: dict[
+                tuple[bool, frozenset[tuple[str, frozenset[State]]]], State
+            ] = {}
+            for state in sorted(rows, key=lambda s: (s not in self.initial, s.name)):
+                signature = (
+                    state in accepting,
+                    frozenset(
+                        (symbol, frozenset(targets))
+                        for symbol, targets in rows[state].items()
+                    ),
+                )
+                representative[state] = by_signature.setdefault(signature, state)
+            if len(by_signature) == len(rows):
+                break
+            rows = {
+                state: {
+                    symbol: {representative[target] for target in targets}
+                    for symbol, targets in row.items()
+                }
+                for state, row in rows.items()
+                if representative[state] == state
+            }
+
+        transitions: dict[State, dict[str | Epsilon, set[State]]] = {
+            state: dict(row) for state, row in rows.items()
+        }
+        nfa = NFA(
+            set(rows),
+            set(self.alphabet),
+            transitions,
+            set(self.initial),
+            accepting & set(rows),
+        )
+        nfa.classes = self.classes
+        return nfa
+
+    def _determinize(self) -> tuple[list[frozenset[State]], list[dict[str, int]]]:
+        """
+        Subset construction over epsilon-closed subsets.
+
+        Returns the reachable subsets, in discovery order starting with the
+        initial one, and for each subset a row mapping every symbol to the
+        index of the successor subset.
+        """
+        closures = self._state_closures()
+        alphabet = sorted(self.alphabet)
+        transitions = self.transitions
+
+        # epsilon-closed successors of a single state, computed on first use
+        successors: dict[tuple[State, str], frozenset[State]] = {}
+
+        def successor(q: State, a: str) -> frozenset[State]:
+            key = (q, a)
+            closed = successors.get(key)
+            if closed is None:
+                targets = transitions.get(q, {}).get(a, ())
+                closed = frozenset().union(*(closures[r] for r in targets))
+                successors[key] = closed
+            return closed
 
         # Algorithms & Models of Computation
         # CS/ECE  374, Fall 2020
         # 5.1.2: Algorithm for converting NFA to DFA, p.11
-        subsets_to_check = [dfa_initial]
-        while subsets_to_check:
-            X = subsets_to_check.pop(0)
-            new_dfa_transition = State.from_set(X)
-            if new_dfa_transition in dfa_transitions:
-                continue
-            dfa_transitions[new_dfa_transition] = {}
-            for a in self.alphabet:
-                U: set[State] = set()
-                for q in X:
-                    x1 = self.epsilon_closure({q})
-                    y1 = reduce(set[State].union, (self.delta(p, a) for p in x1))
-                    zqa = reduce(
-                        set[State].union, (self.epsilon_closure({r}) for r in y1), set()
-                    )
-                    U.update(zqa)
-                    if U not in dfa_states:
-                        subsets_to_check.append(U)
-                        dfa_states.append(U)
-                    dfa_transitions[new_dfa_transition][a] = State.from_set(U)
+        dfa_initial = frozenset().union(*(closures[q] for q in self.initial))
+        subsets: list[frozenset[State]] = [dfa_initial]
+        index: dict[frozenset[State], int] = {dfa_initial: 0}
+        rows: list[dict[str, int]] = []
+        i = 0
+        while i < len(subsets):
+            X = subsets[i]
+            i += 1
+            row: dict[str, int] = {}
+            for a in alphabet:
+                U = frozenset().union(*(successor(q, a) for q in X))
+                j = index.get(U)
+                if j is None:
+                    j = index[U] = len(subsets)
+                    subsets.append(U)
+                row[a] = j
+            rows.append(row)
+        stats = instrumentation.active()
+        if stats is not None:
+            stats.count("nfa.subsets", len(subsets))
+        return subsets, rows
 
+    @instrumentation.timed("nfa.to_dfa")
+    def to_dfa(self) -> DFA:
+        subsets, rows = self._determinize()
+        dfa_states = [State.from_set(subset) for subset in subsets]
+        dfa_transitions: dict[State, dict[str, State]] = {
+            dfa_states[i]: {a: dfa_states[j] for a, j in row.items()}
+            for i, row in enumerate(rows)
+        }
         dfa_accepting = {
-            State.from_set(state)
-            for state in dfa_states
-            if self.accepting.intersection(state)
+            dfa_states[i]
+            for i, subset in enumerate(subsets)
+            if not self.accepting.isdisjoint(subset)
         }
-        nullstate = State.from_set(set())
-        if nullstate in dfa_transitions:
-            for a in self.alphabet:
-                dfa_transitions[nullstate][a] = nullstate
-        return DFA(
-            {State.from_set(s) for s in dfa_states},
+        dfa = DFA(
+            set(dfa_states),
             self.alphabet,
             dfa_transitions,
-            State.from_set(dfa_initial),
+            dfa_states[0],
             dfa_accepting,
         )
+        dfa.classes = self.classes
+        return dfa
+
+    def compile(self) -> CompiledNFA:
+        return CompiledNFA.from_nfa(self)
+
+    def lazy_dfa(self, max_states: int = 1024, eviction: str = "lru") -> LazyDFA:
+        return LazyDFA(self, max_states, eviction)
+
+    def is_subset(self, other: "NFA") -> Comparison:
+        """Whether `other` accepts every string this NFA accepts."""
+        return Comparison(antichain_counterexample(self, other))
+
+    def equivalent(self, other: "NFA") -> Comparison:
+        """Whether both NFAs accept the same strings."""
+        counterexamples = [
+            counterexample
+            for counterexample in (
+                antichain_counterexample(self, other),
+                antichain_counterexample(other, self),
+            )
+            if counterexample is not None
+        ]
+        return Comparison(min(counterexamples, key=len, default=None))
 
     @override
     def _traverse(self, string: str) -> tuple[list[State], bool]:
         if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
-            raise TypeError("DFA expects string input only.")  # pyright: ignore[reportUnreachable]
-        is_valid: bool = False
-        current_nodes: set[State] = self.epsilon_closure(self.initial)
-        visited: list[State] = list(current_nodes)
+            raise TypeError("NFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        # acceptance is read off the last closure, so the input is read once
+        visited: list[State] = []
+        current: set[State] = set()
+        steps = -1
+        for closure in self._iter_closures(string):
+            visited.extend(closure)
+            current = closure
+            steps += 1
+        return visited, steps == len(string) and not self.accepting.isdisjoint(current)
+
+    @override
+    def accepts(self, string: str) -> bool:
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("NFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        if instrumentation.active() is not None:
+            # the counted path, kept out of the loop below
+            return self._traverse(string)[1]
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        alphabet = self.alphabet
+        transitions = self.transitions
+        current_nodes: set[State] = self.epsilon_closure(set(self.initial))
         for symbol in string:
-            if symbol not in self.alphabet:
-                return visited, False
+            if symbol not in alphabet:
+                return False
             next_nodes: set[State] = set()
             for node in current_nodes:
-                next_nodes.update(self.delta(node, symbol))
+                next_nodes.update(transitions.get(node, {}).get(symbol, ()))
             current_nodes = self.epsilon_closure(next_nodes)
-            visited.extend(current_nodes)
-        is_valid = any(state in self.accepting for state in current_nodes)
-        return visited, is_valid
+        return not self.accepting.isdisjoint(current_nodes)
 
     @override
-    def accepts(self, string: str) -> bool:
-        _, is_valid = self._traverse(string)
-        return is_valid
+    def accepts_many(self, strings: Iterable[str]) -> bytearray:
+        return self.compile().accepts_many(strings)
 
     @override
     def state_transitions(self, string: str) -> list[State]:
-        states, _ = self._traverse(string)
-        return states
+        return list(self.iter_transitions(string))
+
+    @override
+    def iter_transitions(self, string: str) -> Iterator[State]:
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("NFA expects string input only.")  # pyright: ignore[reportUnreachable]
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        return self._iter_transitions(string)
+
+    def _iter_transitions(self, string: str) -> Iterator[State]:
+        for closure in self._iter_closures(string):
+            yield from closure
+
+    def _iter_closures(self, string: str) -> Iterator[set[State]]:
+        """The active states before and after every symbol read."""
+        stats = instrumentation.active()
+        characters = 0
+        states = 0
+        current_nodes: set[State] = self.epsilon_closure(set(self.initial))
+        try:
+            states += len(current_nodes)
+            yield current_nodes
+            for symbol in string:
+                if symbol not in self.alphabet:
+                    return
+                next_nodes: set[State] = set()
+                for node in current_nodes:
+                    next_nodes.update(self.delta(node, symbol))
+                current_nodes = self.epsilon_closure(next_nodes)
+                characters += 1
+                states += len(current_nodes)
+                yield current_nodes
+        finally:
+            if stats is not None:
+                stats.count("nfa.characters", characters)
+                stats.count("nfa.states", states)
 
     @override
     def delta(self, state: State, symbol: str | Epsilon) -> set[State]:
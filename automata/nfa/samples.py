@@ -1,4 +1,4 @@
-from automata import NFA, State, epsilon
+from automata import NFA, Epsilon, State, epsilon
 
 A_OR_B_WHOLE_STAR = NFA(
     {
@@ -34,3 +34,17 @@ A_OR_B_WHOLE_STAR = NFA(
     {s0},
     {q6},
 )
+
+
+def nth_symbol_from_end(n: int) -> NFA:
+    """
+    NFA over {a, b} for strings whose n-th symbol from the end is `a`. Its
+    minimal DFA has 2**n states.
+    """
+    states = [State(f"p{i}") for i in range(n + 1)]
+    transitions: dict[State, dict[str | Epsilon, set[State]]] = {
+        states[0]: {"a": {states[0], states[1]}, "b": {states[0]}}
+    }
+    for i in range(1, n):
+        transitions[states[i]] = {"a": {states[i + 1]}, "b": {states[i + 1]}}
+    return NFA(set(states), {"a", "b"}, transitions, {states[0]}, {states[n]})
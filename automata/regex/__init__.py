@@ -1 +1,7 @@
+from .cache import PatternCache as PatternCache
+from .derivative import DerivativeMatcher as DerivativeMatcher
+from .prefilter import Prefilter as Prefilter
 from .regex import RegExParser as RegExParser
+from .regexset import RegexSet as RegexSet
+from .search import Match as Match
+from .search import Searcher as Searcher
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any, TypeVar
+
+from automata import instrumentation
+
+T = TypeVar("T")
+
+
+class PatternCache:
+    """
+    Bounded LRU cache of compiled patterns.
+
+    Entries are shared between callers, so only immutable objects should be
+    stored. `build` runs outside the lock; two threads missing on the same
+    key may both build, and the first result stored wins.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        if maxsize < 1:
+            raise ValueError("Parameter maxsize must be at least 1.")
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def get(self, key: Hashable, build: Callable[[], T]) -> T:
+        stats = instrumentation.active()
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                if stats is not None:
+                    stats.count("cache.hits")
+                return self._entries[key]
+            self.misses += 1
+        if stats is not None:
+            stats.count("cache.misses")
+        value = build()
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                _ = self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def purge(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
@@ -0,0 +1,248 @@
+from collections.abc import Iterator
+from itertools import count
+from typing import override
+from weakref import WeakValueDictionary
+
+from automata import instrumentation
+from automata.charclass import ClassMap
+from automata.dfa.dfa import DFA
+from automata.state import State
+
+
+class Expr:
+    """
+    Hash-consed regular expression.
+
+    Expressions are only built through the smart constructors below, which
+    normalize them (unions are flattened, deduplicated and ordered, concat
+    is right-nested, units and zeros are folded away) and intern the result,
+    so structurally equal expressions are the same object and can be
+    compared and hashed by identity. The intern table only holds weak
+    references, so expressions no matcher uses any more are released.
+    """
+
+    __slots__ = ("kind", "symbol", "args", "nullable", "id", "__weakref__")
+
+    _table: WeakValueDictionary[tuple[str, str, tuple["Expr", ...]], "Expr"] = (
+        WeakValueDictionary()
+    )
+    _ids: Iterator[int] = count()
+
+    kind: str
+    symbol: str
+    args: tuple["Expr", ...]
+    nullable: bool
+    id: int
+
+    @classmethod
+    def _make(
+        cls, kind: str, nullable: bool, symbol: str = "", args: tuple["Expr", ...] = ()
+    ) -> "Expr":
+        key = (kind, symbol, args)
+        expr = cls._table.get(key)
+        if expr is None:
+            expr = cls.__new__(cls)
+            expr.kind = kind
+            expr.symbol = symbol
+            expr.args = args
+            expr.nullable = nullable
+            expr.id = next(cls._ids)
+            cls._table[key] = expr
+        return expr
+
+    @override
+    def __repr__(self):
+        if self.kind == "empty":
+            return "∅"
+        elif self.kind == "epsilon":
+            return "ε"
+        elif self.kind == "symbol":
+            return self.symbol
+        elif self.kind == "star":
+            return f"({self.args[0]!r})*"
+        elif self.kind == "concat":
+            return "".join(repr(arg) for arg in self.args)
+        return f"({'|'.join(repr(arg) for arg in self.args)})"
+
+
+EMPTY: Expr = Expr._make("empty", False)  # pyright: ignore[reportPrivateUsage]
+EPSILON: Expr = Expr._make("epsilon", True)  # pyright: ignore[reportPrivateUsage]
+
+
+def symbol(a: str) -> Expr:
+    return Expr._make("symbol", False, symbol=a)  # pyright: ignore[reportPrivateUsage]
+
+
+def concat(r: Expr, s: Expr) -> Expr:
+    if r is EMPTY or s is EMPTY:
+        return EMPTY
+    elif r is EPSILON:
+        return s
+    elif s is EPSILON:
+        return r
+    factors = [r]
+    while factors[-1].kind == "concat":
+        head, tail = factors.pop().args
+        factors += (head, tail)
+    for factor in reversed(factors):
+        s = Expr._make("concat", factor.nullable and s.nullable, args=(factor, s))  # pyright: ignore[reportPrivateUsage]
+    return s
+
+
+def union(*exprs: Expr) -> Expr:
+    members: set[Expr] = set()
+    for expr in exprs:
+        if expr.kind == "union":
+            members.update(expr.args)
+        elif expr is not EMPTY:
+            members.add(expr)
+    if not members:
+        return EMPTY
+    elif len(members) == 1:
+        return members.pop()
+    args = tuple(sorted(members, key=lambda expr: expr.id))
+    return Expr._make("union", any(arg.nullable for arg in args), args=args)  # pyright: ignore[reportPrivateUsage]
+
+
+def star(r: Expr) -> Expr:
+    if r is EMPTY or r is EPSILON:
+        return EPSILON
+    elif r.kind == "star":
+        return r
+    return Expr._make("star", True, args=(r,))  # pyright: ignore[reportPrivateUsage]
+
+
+def plus(r: Expr) -> Expr:
+    return concat(r, star(r))
+
+
+def optional(r: Expr) -> Expr:
+    return union(r, EPSILON)
+
+
+def repeat(r: Expr, minimum: int, maximum: int | None) -> Expr:
+    out = star(r) if maximum is None else EPSILON
+    for _ in range(0 if maximum is None else maximum - minimum):
+        out = optional(concat(r, out))
+    for _ in range(minimum):
+        out = concat(r, out)
+    return out
+
+
+def derivative(r: Expr, a: str) -> Expr:
+    """Brzozowski derivative of `r` with respect to the symbol `a`."""
+    if r.kind == "symbol":
+        return EPSILON if r.symbol == a else EMPTY
+    elif r.kind == "union":
+        return union(*(derivative(arg, a) for arg in r.args))
+    elif r.kind == "concat":
+        # every nullable head also lets the rest of the chain read `a`
+        terms: list[Expr] = []
+        while r.kind == "concat":
+            head, tail = r.args
+            terms.append(concat(derivative(head, a), tail))
+            if not head.nullable:
+                return union(*terms)
+            r = tail
+        terms.append(derivative(r, a))
+        return union(*terms)
+    elif r.kind == "star":
+        return concat(derivative(r.args[0], a), r)
+    return EMPTY
+
+
+def symbols_of(r: Expr) -> set[str]:
+    symbols: set[str] = set()
+    seen = {r}
+    stack = [r]
+    while stack:
+        expr = stack.pop()
+        if expr.kind == "symbol":
+            symbols.add(expr.symbol)
+        for arg in expr.args:
+            if arg not in seen:
+                seen.add(arg)
+                stack.append(arg)
+    return symbols
+
+
+class DerivativeMatcher:
+    """
+    Regular expression matcher over Brzozowski derivatives.
+
+    Derivatives are memoized per (expression, symbol), so the expressions
+    reached so far are the states of a DFA that is built lazily as inputs
+    are matched.
+    """
+
+    def __init__(self, expression: Expr, classes: ClassMap | None = None):
+        self.initial: Expr = expression
+        self.alphabet: set[str] = symbols_of(expression)
+        self.classes: ClassMap | None = classes
+        self._derivatives: dict[tuple[Expr, str], Expr] = {}
+
+    @property
+    def cache_size(self) -> int:
+        return len(self._derivatives)
+
+    def derive(self, expression: Expr, a: str) -> Expr:
+        stats = instrumentation.active()
+        key = (expression, a)
+        result = self._derivatives.get(key)
+        if result is None:
+            result = self._derivatives[key] = derivative(expression, a)
+            if stats is not None:
+                stats.count("derivative.misses")
+        elif stats is not None:
+            stats.count("derivative.hits")
+        return result
+
+    def accepts(self, string: str) -> bool:
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("Matcher expects string input only.")  # pyright: ignore[reportUnreachable]
+        if self.classes is not None:
+            string = self.classes.translate(string)
+        derivatives = self._derivatives
+        if instrumentation.active() is not None:
+            # the counted path: every step goes through `derive`
+            derivatives = {}
+        current = self.initial
+        for a in string:
+            next_expression = derivatives.get((current, a))
+            if next_expression is None:
+                next_expression = self.derive(current, a)
+            if next_expression is EMPTY:
+                return False
+            current = next_expression
+        return current.nullable
+
+    def to_dfa(self) -> DFA:
+        """Materialize every derivative reachable from the initial expression."""
+        alphabet = sorted(self.alphabet)
+        order: list[Expr] = [self.initial]
+        names: dict[Expr, State] = {self.initial: State(f"{State.base_name}0")}
+        transitions: dict[State, dict[str, State]] = {}
+        i = 0
+        while i < len(order):
+            expression = order[i]
+            i += 1
+            row: dict[str, State] = {}
+            for a in alphabet:
+                next_expression = self.derive(expression, a)
+                if next_expression is EMPTY:
+                    continue
+                if next_expression not in names:
+                    names[next_expression] = State(f"{State.base_name}{len(order)}")
+                    order.append(next_expression)
+                row[a] = names[next_expression]
+            if row:
+                transitions[names[expression]] = row
+        dfa = DFA(
+            set(names.values()),
+            set(self.alphabet),
+            transitions,
+            names[self.initial],
+            {names[expression] for expression in order if expression.nullable},
+        )
+        dfa.classes = self.classes
+        return dfa
@@ -0,0 +1,149 @@
+from typing import override
+
+from automata.regex.tokens import CONCAT, char_class, is_operand, repeat_bounds
+
+MAX_LITERALS = 16
+
+# a literal set containing the empty string carries no information
+ANY: frozenset[str] = frozenset({""})
+
+# exact strings (None when unknown), prefixes, suffixes, and factors of one
+# subexpression; every match is one of the exact strings and starts with,
+# ends with, and contains one of the respective literals
+Info = tuple[frozenset[str] | None, frozenset[str], frozenset[str], frozenset[str]]
+
+
+class Prefilter:
+    """
+    Literals every match of a regular expression must contain.
+
+    `prefixes` are the literals one of which starts every match, and
+    `required` the literals one of which occurs in every match. Either is
+    empty when nothing useful is known.
+    """
+
+    def __init__(self, prefixes: frozenset[str], required: frozenset[str]):
+        self.prefixes: tuple[str, ...] = (
+            () if "" in prefixes else tuple(sorted(prefixes))
+        )
+        self.required: tuple[str, ...] = (
+            () if "" in required else tuple(sorted(required))
+        )
+
+    def may_match(self, text: str, pos: int = 0) -> bool:
+        """False only if no match can occur in `text[pos:]`."""
+        return not self.required or any(
+            text.find(literal, pos) >= 0 for literal in self.required
+        )
+
+    def may_fullmatch(self, text: str) -> bool:
+        """False only if `text` as a whole cannot be a match."""
+        return (not self.prefixes or text.startswith(self.prefixes)) and (
+            self.may_match(text)
+        )
+
+    def next_candidate(self, text: str, pos: int = 0) -> int:
+        """First position from `pos` where a match could start, or -1."""
+        if not self.prefixes:
+            return pos if pos < len(text) else -1
+        positions = [
+            found for prefix in self.prefixes if (found := text.find(prefix, pos)) >= 0
+        ]
+        return min(positions, default=-1)
+
+    @override
+    def __repr__(self):
+        return f"Prefilter(prefixes={self.prefixes!r}, required={self.required!r})"
+
+
+def extract(parsed_tokens: list[str]) -> Prefilter:
+    """
+    Analyse the postfix from `RegExParser.parse` with the same stack
+    discipline as the constructions: operators apply to the top of the
+    stack, and a valid postfix leaves exactly one item.
+    """
+    stack: list[Info] = []
+    for token in parsed_tokens:
+        if is_operand(token):
+            literal = _literals(token)
+            exact = None if literal is ANY else literal
+            stack.append((exact, literal, literal, literal))
+        elif (
+            token in ("*", "?")
+            or token.startswith("{")
+            and repeat_bounds(token)[0] == 0
+        ):
+            _ = stack.pop()
+            stack.append((None, ANY, ANY, ANY))
+        elif token == "+" or token.startswith("{"):
+            _, prefix, suffix, factor = stack.pop()
+            stack.append((None, prefix, suffix, factor))
+        elif token == "|":
+            r = stack.pop()
+            l = stack.pop()
+            stack.append(_union(l, r))
+        elif token == CONCAT:
+            r = stack.pop()
+            l = stack.pop()
+            stack.append(_concat(l, r))
+    if len(stack) != 1:
+        return Prefilter(ANY, ANY)
+    info = stack[0]
+    return Prefilter(info[1], info[3])
+
+
+def _literals(token: str) -> frozenset[str]:
+    """The characters an operand matches, if there are few enough of them."""
+    intervals = char_class(token)
+    if sum(stop - start for start, stop in intervals) > MAX_LITERALS:
+        return ANY
+    return frozenset(chr(c) for start, stop in intervals for c in range(start, stop))
+
+
+def _union(l: Info, r: Info) -> Info:
+    exact = None
+    if l[0] is not None and r[0] is not None:
+        exact = _either(l[0], r[0])
+        if exact is ANY:
+            exact = None
+    return exact, _either(l[1], r[1]), _either(l[2], r[2]), _either(l[3], r[3])
+
+
+def _concat(l: Info, r: Info) -> Info:
+    l_exact, l_prefix, l_suffix, l_factor = l
+    r_exact, r_prefix, r_suffix, r_factor = r
+    exact = None
+    if l_exact is not None and r_exact is not None:
+        exact = _cross(l_exact, r_exact)
+    prefix = l_prefix if l_exact is None else _cross(l_exact, r_prefix) or l_exact
+    suffix = r_suffix if r_exact is None else _cross(l_suffix, r_exact) or r_exact
+    candidates = [l_factor, r_factor, prefix, suffix]
+    if l_suffix is not ANY and r_prefix is not ANY:
+        candidates.append(_cross(l_suffix, r_prefix) or ANY)
+    if exact is not None:
+        candidates.append(exact)
+    return exact, prefix, suffix, max(candidates, key=_score)
+
+
+def _either(l: frozenset[str], r: frozenset[str]) -> frozenset[str]:
+    if l is ANY or r is ANY:
+        return ANY
+    literals = l | r
+    return literals if len(literals) <= MAX_LITERALS else ANY
+
+
+def _cross(l: frozenset[str], r: frozenset[str]) -> frozenset[str] | None:
+    if r is ANY:
+        return l
+    if l is ANY:
+        return r
+    if len(l) * len(r) > MAX_LITERALS:
+        return None
+    return frozenset(x + y for x in l for y in r)
+
+
+def _score(literals: frozenset[str]) -> tuple[int, int]:
+    """Longer literals filter better, and so do fewer of them."""
+    if literals is ANY:
+        return 0, 0
+    return min(len(literal) for literal in literals), -len(literals)
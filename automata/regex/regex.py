@@ -1,7 +1,31 @@
+from automata import instrumentation
+from automata.charclass import ClassMap
+from automata.dfa.compiled import CompiledDFA
+from automata.nfa.builder import Fragment, NFABuilder
+from automata.nfa.compiled import CompiledNFA
+from automata.nfa.epsilon import Epsilon
 from automata.nfa.nfa import NFA
+from automata.regex import derivative, prefilter
+from automata.regex.cache import PatternCache
+from automata.regex.derivative import DerivativeMatcher, Expr
+from automata.regex.search import Searcher
+from automata.regex.tokens import (
+    CONCAT,
+    char_class,
+    class_map,
+    is_operand,
+    operand_symbols,
+    repeat_bounds,
+)
 from automata.state import State
 
-precedence = {"*": 2, "+": 2, "|": 1}
+precedence = {CONCAT: 2, "|": 1}
+
+# nullable, first and last positions, and the positions a subexpression owns
+Position = tuple[bool, set[int], set[int], list[int]]
+
+constructions = ("thompson", "glushkov")
+targets = ("nfa", "dfa")
 
 
 class ParsingError(Exception):
@@ -10,11 +34,49 @@ class ParsingError(Exception):
 
 
 class RegExParser:
+    cache: PatternCache = PatternCache()
+
+    @classmethod
+    def compiled(
+        cls, re: str, construction: str = "thompson", target: str = "nfa"
+    ) -> CompiledNFA | CompiledDFA:
+        """
+        Immutable matcher for `re`, shared through `RegExParser.cache`.
+
+        The "nfa" target is the bit-parallel `CompiledNFA`, and the "dfa"
+        target is the `CompiledDFA` table of the minimized DFA. Either one
+        carries the literal `Prefilter` of `re`, so inputs missing a required
+        literal are rejected before the automaton runs.
+        """
+        if target not in targets:
+            raise ValueError(
+                f"Unknown target {target!r}, expected one of {', '.join(targets)}."
+            )
+
+        def build() -> CompiledNFA | CompiledDFA:
+            nfa = cls.to_nfa(re, construction)
+            literals = prefilter.extract(cls.parse(cls.tokenize(re)))
+            if target == "dfa":
+                return nfa.to_dfa().minimize().compile().with_prefilter(literals)
+            return nfa.compile().with_prefilter(literals)
+
+        key = (re, construction, target, State.base_name)
+        return cls.cache.get(key, build)
+
     @classmethod
-    def to_nfa(cls, re: str) -> NFA:
-        return cls.compile(cls.parse(cls.tokenize(re)))
+    def to_nfa(cls, re: str, construction: str = "thompson") -> NFA:
+        if construction not in constructions:
+            raise ValueError(
+                f"Unknown construction {construction!r}, "
+                f"expected one of {', '.join(constructions)}."
+            )
+        parsed_tokens = cls.parse(cls.tokenize(re))
+        if construction == "glushkov":
+            return cls.compile_glushkov(parsed_tokens)
+        return cls.compile(parsed_tokens)
 
     @classmethod
+    @instrumentation.timed("regex.tokenize")
     def tokenize(cls, re: str) -> list[tuple[str, str]]:
         tokens: list[tuple[str, str]] = []
         i = 0
@@ -28,6 +90,37 @@ class RegExParser:
                 tokens.append(("STAR", char))
             elif char == "+":
                 tokens.append(("PLUS", char))
+            elif char == "?":
+                tokens.append(("QUESTION", char))
+            elif char == ".":
+                tokens.append(("DOT", char))
+            elif char == "[":
+                end = cls._class_end(re, i)
+                try:
+                    matched = char_class(re[i : end + 1])
+                except ValueError as error:
+                    raise ParsingError(str(error)) from None
+                if not matched:
+                    raise ParsingError(f"Empty character class: {re[i : end + 1]}")
+                tokens.append(("CLASS", re[i : end + 1]))
+                i = end
+            elif char == "{":
+                end = re.find("}", i)
+                body = re[i + 1 : end] if end >= 0 else ""
+                bounds = body.split(",")
+                if (
+                    len(bounds) > 2
+                    or not bounds[0].isdecimal()
+                    or not (
+                        len(bounds) == 1 or bounds[1] == "" or bounds[1].isdecimal()
+                    )
+                ):
+                    raise ParsingError(f"Invalid repetition: {re[i:]}")
+                minimum, maximum = repeat_bounds(re[i : end + 1])
+                if maximum is not None and maximum < minimum:
+                    raise ParsingError(f"Invalid repetition: {re[i : end + 1]}")
+                tokens.append(("REPEAT", re[i : end + 1]))
+                i = end
             elif char == "(":
                 tokens.append(("LPAREN", char))
             elif char == ")":
@@ -38,33 +131,54 @@ class RegExParser:
         return tokens
 
     @classmethod
+    def _class_end(cls, re: str, start: int) -> int:
+        """Index of the `]` closing the class opened at `start`."""
+        i = start + 1
+        if i < len(re) and re[i] == "^":
+            i += 1
+        if i < len(re) and re[i] == "]":
+            i += 1
+        while i < len(re) and re[i] != "]":
+            i += 2 if re[i] == "\\" else 1
+        if i >= len(re):
+            raise ParsingError("Unterminated character class.")
+        return i
+
+    @classmethod
+    @instrumentation.timed("regex.parse")
     def parse(cls, tokens: list[tuple[str, str]]) -> list[str]:
         """
         Modified shunting yard algorithm for regular expression
         and added support for (postfix) Keene star and positive closure.
+
+        Concatenation is implicit in the pattern, so an explicit `CONCAT`
+        operator is inserted wherever an item follows another. It binds
+        tighter than `|` and associates to the right, and postfix operators
+        bind tightest, to a single operand or a whole group.
         """
         out_queue: list[str] = []
         op_stack: list[str] = []
+        previous = None
         for token_type, symbol in tokens:
-            if token_type == "CHARACTER":
+            if token_type in ("CHARACTER", "DOT", "CLASS", "LPAREN") and previous in (
+                "CHARACTER",
+                "DOT",
+                "CLASS",
+                "RPAREN",
+                "STAR",
+                "PLUS",
+                "QUESTION",
+                "REPEAT",
+            ):
+                cls._push_operator(CONCAT, out_queue, op_stack)
+            if token_type in ("CHARACTER", "DOT", "CLASS"):
                 out_queue.append(symbol)
-            elif token_type in ("STAR", "PLUS"):
-                try:
-                    if out_queue[-1] in ("*", "+"):
-                        raise ParsingError(
-                            "Invalid regular expression with Kleene star."
-                        )
-                except IndexError:
+            elif token_type in ("STAR", "PLUS", "QUESTION", "REPEAT"):
+                if previous not in ("CHARACTER", "DOT", "CLASS", "RPAREN"):
                     raise ParsingError("Invalid regular expression with Kleene star.")
                 out_queue.append(symbol)
             elif token_type == "UNION":
-                while (
-                    op_stack
-                    and op_stack[-1] != "("
-                    and precedence[symbol] <= precedence[op_stack[-1]]
-                ):
-                    out_queue.append(op_stack.pop())
-                op_stack.append(symbol)
+                cls._push_operator(symbol, out_queue, op_stack)
             elif token_type == "LPAREN":
                 op_stack.append(symbol)
             elif token_type == "RPAREN":
@@ -76,6 +190,7 @@ class RegExParser:
                 not_lp = op_stack.pop()
                 if not_lp[-1] != "(":
                     raise ParsingError("Mismatched parentheses.")
+            previous = token_type
         while op_stack:
             not_lp = op_stack[-1]
             if not_lp[-1] == "(":
@@ -84,30 +199,244 @@ class RegExParser:
         return out_queue
 
     @classmethod
+    def _push_operator(cls, symbol: str, out_queue: list[str], op_stack: list[str]):
+        # operators of equal precedence are popped first for `|` only, so
+        # that concatenation associates to the right
+        while (
+            op_stack
+            and op_stack[-1] != "("
+            and (
+                precedence[symbol] < precedence[op_stack[-1]]
+                or precedence[symbol] == precedence[op_stack[-1]]
+                and symbol != CONCAT
+            )
+        ):
+            out_queue.append(op_stack.pop())
+        op_stack.append(symbol)
+
+    @classmethod
+    def searcher(cls, re: str) -> Searcher:
+        """Unanchored leftmost-longest searcher for `re`, shared through the cache."""
+
+        def build() -> Searcher:
+            builder = NFABuilder()
+            parsed_tokens = cls.parse(cls.tokenize(re))
+            classes = class_map(parsed_tokens)
+            fragment = cls._thompson(builder, parsed_tokens, classes)
+            forward = builder.build(fragment)
+            forward.classes = classes
+            return Searcher(
+                forward.to_dfa().minimize().compile(),
+                prefilter.extract(parsed_tokens),
+            )
+
+        key = (re, "search", State.base_name)
+        return cls.cache.get(key, build)
+
+    @classmethod
+    @instrumentation.timed("regex.compile")
     def compile(cls, parsed_tokens: list[str]) -> NFA:
-        stack: list[NFA] = []
+        builder = NFABuilder()
+        classes = class_map(parsed_tokens)
+        nfa = builder.build(cls._thompson(builder, parsed_tokens, classes))
+        nfa.classes = classes
+        return nfa
+
+    @classmethod
+    def _thompson(
+        cls,
+        builder: NFABuilder,
+        parsed_tokens: list[str],
+        classes: ClassMap | None = None,
+    ) -> Fragment:
+        stack: list[Fragment] = []
         try:
-            while parsed_tokens:
-                token = parsed_tokens.pop(0)
-                if token.isalnum():
-                    stack.append(cls.atomic_nfa(token))
+            for token in parsed_tokens:
+                if is_operand(token):
+                    stack.append(builder.symbols(operand_symbols(token, classes)))
                 elif token == "*":
-                    stack.append(NFA.kleene_star(stack.pop(0)))
+                    stack.append(builder.star(stack.pop()))
                 elif token == "+":
-                    stack.append(NFA.kleene_star(stack.pop(0), plus=True))
+                    stack.append(builder.star(stack.pop(), plus=True))
+                elif token == "?":
+                    stack.append(builder.optional(stack.pop()))
+                elif token.startswith("{"):
+                    stack.append(builder.repeat(stack.pop(), *repeat_bounds(token)))
                 elif token == "|":
                     r = stack.pop()
                     l = stack.pop()
-                    stack.append(NFA.union(r, l))
+                    stack.append(builder.union(r, l))
+                elif token == CONCAT:
+                    r = stack.pop()
+                    l = stack.pop()
+                    stack.append(builder.concat(l, r))
                 else:
                     raise ParsingError(f"Invalid token: {token}.")
         except IndexError:
             raise ParsingError("Invalid regular expression.")
-        out = stack.pop(0)
-        while stack:
-            out = NFA.concat(out, stack.pop(0))
-        State.reset_naming()
-        return out
+        if len(stack) != 1:
+            raise ParsingError("Invalid regular expression.")
+        return stack[0]
+
+    @classmethod
+    def to_derivative_matcher(cls, re: str) -> DerivativeMatcher:
+        parsed_tokens = cls.parse(cls.tokenize(re))
+        classes = class_map(parsed_tokens)
+        return DerivativeMatcher(
+            cls.compile_expression(parsed_tokens, classes), classes
+        )
+
+    @classmethod
+    @instrumentation.timed("regex.compile")
+    def compile_expression(
+        cls, parsed_tokens: list[str], classes: ClassMap | None = None
+    ) -> Expr:
+        """Hash-consed expression for the derivative matcher."""
+        stack: list[Expr] = []
+        try:
+            for token in parsed_tokens:
+                if is_operand(token):
+                    stack.append(
+                        derivative.union(
+                            *map(derivative.symbol, operand_symbols(token, classes))
+                        )
+                    )
+                elif token == "*":
+                    stack.append(derivative.star(stack.pop()))
+                elif token == "+":
+                    stack.append(derivative.plus(stack.pop()))
+                elif token == "?":
+                    stack.append(derivative.optional(stack.pop()))
+                elif token.startswith("{"):
+                    stack.append(derivative.repeat(stack.pop(), *repeat_bounds(token)))
+                elif token == "|":
+                    r = stack.pop()
+                    l = stack.pop()
+                    stack.append(derivative.union(l, r))
+                elif token == CONCAT:
+                    r = stack.pop()
+                    l = stack.pop()
+                    stack.append(derivative.concat(l, r))
+                else:
+                    raise ParsingError(f"Invalid token: {token}.")
+        except IndexError:
+            raise ParsingError("Invalid regular expression.")
+        if len(stack) != 1:
+            raise ParsingError("Invalid regular expression.")
+        return stack[0]
+
+    @classmethod
+    @instrumentation.timed("regex.compile")
+    def compile_glushkov(cls, parsed_tokens: list[str]) -> NFA:
+        """
+        Position (Glushkov) automaton of the parsed regular expression.
+
+        State 0 is initial and state i is the i-th symbol occurrence, so the
+        NFA has n + 1 states for n occurrences and no epsilon transitions.
+        Each subexpression is summarized as (nullable, first, last) position
+        sets, plus the positions it owns so that counted repetitions can copy
+        them, while the follow set of every position is filled in.
+        """
+        classes = class_map(parsed_tokens)
+        labels: list[list[str]] = []
+        follow: list[set[int]] = [set()]
+
+        def new_position(symbols: list[str]) -> int:
+            labels.append(symbols)
+            follow.append(set())
+            return len(labels)
+
+        def concat(l: Position, r: Position) -> Position:
+            for position in l[2]:
+                follow[position] |= r[1]
+            return (
+                l[0] and r[0],
+                l[1] | r[1] if l[0] else l[1],
+                l[2] | r[2] if r[0] else r[2],
+                l[3] + r[3],
+            )
+
+        def star(item: Position, plus: bool = False) -> Position:
+            for position in item[2]:
+                follow[position] |= item[1]
+            return item[0] or not plus, item[1], item[2], item[3]
+
+        def copy(item: Position) -> Position:
+            copies = {p: new_position(labels[p - 1]) for p in item[3]}
+            for p, q in copies.items():
+                follow[q] = {copies[r] for r in follow[p]}
+            return (
+                item[0],
+                {copies[p] for p in item[1]},
+                {copies[p] for p in item[2]},
+                list(copies.values()),
+            )
+
+        def repeat(item: Position, minimum: int, maximum: int | None) -> Position:
+            if maximum == 0:
+                return True, set(), set(), []
+            count = max(minimum, 1) if maximum is None else maximum
+            copies = [item] + [copy(item) for _ in range(count - 1)]
+            if maximum is None:
+                pieces = copies[:-1] + [star(copies[-1], plus=minimum > 0)]
+            else:
+                pieces = copies[:minimum] + [
+                    (True, c[1], c[2], c[3]) for c in copies[minimum:]
+                ]
+            out = pieces[0]
+            for piece in pieces[1:]:
+                out = concat(out, piece)
+            return out
+
+        stack: list[Position] = []
+        try:
+            for token in parsed_tokens:
+                if is_operand(token):
+                    position = new_position(operand_symbols(token, classes))
+                    stack.append((False, {position}, {position}, [position]))
+                elif token in ("*", "+"):
+                    stack.append(star(stack.pop(), plus=token == "+"))
+                elif token == "?":
+                    _, first, last, positions = stack.pop()
+                    stack.append((True, first, last, positions))
+                elif token.startswith("{"):
+                    stack.append(repeat(stack.pop(), *repeat_bounds(token)))
+                elif token == "|":
+                    r = stack.pop()
+                    l = stack.pop()
+                    stack.append((r[0] or l[0], r[1] | l[1], r[2] | l[2], l[3] + r[3]))
+                elif token == CONCAT:
+                    r = stack.pop()
+                    l = stack.pop()
+                    stack.append(concat(l, r))
+                else:
+                    raise ParsingError(f"Invalid token: {token}.")
+        except IndexError:
+            raise ParsingError("Invalid regular expression.")
+        if len(stack) != 1:
+            raise ParsingError("Invalid regular expression.")
+
+        nullable, first, last, _ = stack[0]
+        follow[0] = first
+
+        states = [State(f"{State.base_name}{i}") for i in range(len(follow))]
+        transitions: dict[State, dict[str | Epsilon, set[State]]] = {}
+        for i, positions in enumerate(follow):
+            row: dict[str | Epsilon, set[State]] = {}
+            for position in positions:
+                for symbol in labels[position - 1]:
+                    row.setdefault(symbol, set()).add(states[position])
+            if row:
+                transitions[states[i]] = row
+        accepting = {states[position] for position in last}
+        if nullable:
+            accepting.add(states[0])
+        alphabet = {symbol for symbols in labels for symbol in symbols}
+        # e.g. a{0}, where no position can be reached
+        transitions = transitions or {states[0]: {}}
+        nfa = NFA(set(states), alphabet, transitions, {states[0]}, accepting)
+        nfa.classes = classes
+        return nfa
 
     @classmethod
     def atomic_nfa(cls, symbol: str):
@@ -0,0 +1,79 @@
+from array import array
+from collections.abc import Iterable
+
+from automata.dfa.compiled import DEAD, CompiledDFA
+from automata.nfa.builder import NFABuilder
+from automata.nfa.epsilon import epsilon
+from automata.regex.regex import RegExParser
+from automata.regex.tokens import class_map
+from automata.state import State
+
+
+class RegexSet:
+    """
+    Many regular expressions matched by a single DFA.
+
+    The Thompson fragments of all patterns share one arena and hang off a
+    common start state, so the subset construction runs once for the whole
+    set. Each DFA state records the patterns whose accept state it contains,
+    and `matches` reports all of them after one pass over the input.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: tuple[str, ...] = tuple(patterns)
+        if not self.patterns:
+            raise ValueError("RegexSet needs at least one pattern.")
+
+        parsed = [
+            RegExParser.parse(RegExParser.tokenize(pattern))
+            for pattern in self.patterns
+        ]
+        # one partition for all patterns, so they share the DFA's symbols
+        classes = class_map([token for tokens in parsed for token in tokens])
+        builder = NFABuilder()
+        root = builder.new_state()
+        accepts: list[int] = []
+        for parsed_tokens in parsed:
+            start, accept = RegExParser._thompson(builder, parsed_tokens, classes)  # pyright: ignore[reportPrivateUsage]
+            builder.add_edge(root, epsilon, start)
+            accepts.append(accept)
+        nfa = builder.build((root, accepts[0]), accepts[1:])
+
+        subsets, rows = nfa._determinize()  # pyright: ignore[reportPrivateUsage]
+        owners = {
+            State(f"{State.base_name}{accept}"): i for i, accept in enumerate(accepts)
+        }
+        self.pattern_indices: tuple[tuple[int, ...], ...] = tuple(
+            tuple(sorted(owners[state] for state in subset if state in owners))
+            for subset in subsets
+        )
+
+        symbols = tuple(sorted(nfa.alphabet))
+        dead = {i for i, subset in enumerate(subsets) if not subset}
+        table = array("i")
+        for row in rows:
+            table.extend(DEAD if (j := row[a]) in dead else j for a in symbols)
+        self.compiled: CompiledDFA = CompiledDFA(
+            tuple(State.from_set(subset) for subset in subsets),
+            symbols,
+            table,
+            0,
+            bytes(bool(indices) for indices in self.pattern_indices),
+            classes,
+        )
+
+    def matches(self, string: str) -> list[int]:
+        """Indices of every pattern that accepts `string`, in ascending order."""
+        if not isinstance(string, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("RegexSet expects string input only.")  # pyright: ignore[reportUnreachable]
+        # mirrors DFA.accepts, which never accepts the empty string
+        if not string:
+            return []
+        current = self.compiled.run(string)
+        return [] if current < 0 else list(self.pattern_indices[current])
+
+    def is_match(self, string: str) -> bool:
+        return bool(self.matches(string))
+
+    def __len__(self) -> int:
+        return len(self.patterns)
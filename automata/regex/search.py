@@ -0,0 +1,212 @@
+from collections.abc import Iterator
+from typing import override
+
+from automata.dfa.compiled import DEAD, CompiledDFA
+from automata.regex.prefilter import Prefilter
+
+# memoized steps kept per symbol before the memo is flushed
+MAX_LIVE_SETS = 4096
+
+
+class Match:
+    __slots__ = ("string", "start", "end")
+
+    def __init__(self, string: str, start: int, end: int):
+        self.string: str = string
+        self.start: int = start
+        self.end: int = end
+
+    def group(self) -> str:
+        return self.string[self.start : self.end]
+
+    def span(self) -> tuple[int, int]:
+        return self.start, self.end
+
+    @override
+    def __eq__(self, value: object, /) -> bool:
+        if isinstance(value, Match):
+            return (self.string, self.start, self.end) == (
+                value.string,
+                value.start,
+                value.end,
+            )
+        return False
+
+    @override
+    def __hash__(self) -> int:
+        return hash((self.string, self.start, self.end))
+
+    @override
+    def __repr__(self):
+        return f"<Match span={self.span()!r} match={self.group()!r}>"
+
+
+class Searcher:
+    """
+    Unanchored, leftmost-longest search for a regular expression R.
+
+    One right-to-left pass over the text computes, for every position, the
+    live set: the states of the DFA for R from which the rest of the text
+    still leads to an accepting state. A match starts wherever the initial
+    state is live. Matches are taken from the leftmost start with an
+    anchored longest-match run of the DFA for R, which stops as soon as its
+    state is no longer live, so it never reads past the end of the match
+    and the whole search is linear. The search resumes after the end of each
+    match, so matches never overlap. Like `DFA.accepts`, empty matches are
+    never reported.
+
+    Live sets are bitmasks over the DFA states, and the step from one
+    position to the previous is memoized per symbol, which builds the
+    reverse subset automaton lazily and shares it between searches. A memo
+    holding `MAX_LIVE_SETS` steps is flushed, as in `LazyDFA`.
+
+    With a `Prefilter`, texts missing its required literals are rejected
+    by `str.find` alone, and when every match starts with a known literal
+    the backward pass is skipped in favour of jumping between occurrences
+    of those literals. If the runs from those occurrences read more than
+    the text once over, the rest of the text is searched with live sets.
+    """
+
+    def __init__(self, forward: CompiledDFA, prefilter: Prefilter | None = None):
+        self.forward: CompiledDFA = forward
+        self.prefilter: Prefilter | None = prefilter
+        self._accepting: int = sum(
+            1 << p for p, accepting in enumerate(forward.accepting) if accepting
+        )
+        self._before: list[dict[int, int]] = [{} for _ in range(forward.width)]
+
+    def starts(self, text: str, pos: int = 0) -> bytearray:
+        """Flag per position of `text`, set where a non-empty match starts."""
+        if not isinstance(text, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("Searcher expects string input only.")  # pyright: ignore[reportUnreachable]
+        return self._live(self._translate(text), pos)[0]
+
+    def finditer(self, text: str, pos: int = 0) -> Iterator[Match]:
+        if not isinstance(text, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("Searcher expects string input only.")  # pyright: ignore[reportUnreachable]
+        prefilter = self.prefilter
+        if prefilter is not None:
+            if not prefilter.may_match(text, pos):
+                return
+            if prefilter.prefixes:
+                yield from self._finditer_literals(prefilter, text, pos)
+                return
+        yield from self._finditer_live(text, self._translate(text), pos)
+
+    def _finditer_live(self, text: str, symbols: str, pos: int) -> Iterator[Match]:
+        marks, live = self._live(symbols, pos)
+        start = marks.find(1, pos)
+        while start >= 0:
+            end, _ = self._run(symbols, start, live)
+            yield Match(text, start, end)
+            start = marks.find(1, end)
+
+    def _finditer_literals(
+        self, prefilter: Prefilter, text: str, pos: int
+    ) -> Iterator[Match]:
+        symbols = self._translate(text)
+        # runs that die late can make literal jumps quadratic; past this many
+        # symbols read, the rest is searched with live sets instead
+        budget = len(text) - pos
+        start = prefilter.next_candidate(text, pos)
+        while start >= 0:
+            end, stop = self._run(symbols, start, None)
+            budget -= stop - start
+            if budget < 0:
+                yield from self._finditer_live(text, symbols, start)
+                return
+            if end < 0:
+                start = prefilter.next_candidate(text, start + 1)
+                continue
+            yield Match(text, start, end)
+            start = prefilter.next_candidate(text, end)
+
+    def _translate(self, text: str) -> str:
+        classes = self.forward.classes
+        return text if classes is None else classes.translate(text)
+
+    def _live(self, symbols: str, pos: int) -> tuple[bytearray, list[int]]:
+        """
+        Match starts and live sets of every position from `pos`, where a
+        state is live at a position if reading on from there reaches an
+        accepting state after at least one more symbol.
+        """
+        forward = self.forward
+        symbol_index = forward.symbol_index
+        initial = forward.initial
+        accepting = self._accepting
+        before = self._before
+        marks = bytearray(len(symbols))
+        live = [0] * (len(symbols) + 1)
+        current = 0
+        for position in range(len(symbols) - 1, pos - 1, -1):
+            i = symbol_index.get(symbols[position])
+            if i is None:
+                # no run of the DFA reads a symbol outside its alphabet
+                current = 0
+            else:
+                after = accepting | current
+                memo = before[i]
+                current = memo.get(after, -1)
+                if current < 0:
+                    if len(memo) >= MAX_LIVE_SETS:
+                        memo.clear()
+                    current = memo[after] = self._predecessors(i, after)
+            live[position] = current
+            marks[position] = current >> initial & 1
+        return marks, live
+
+    def _predecessors(self, i: int, targets: int) -> int:
+        """States that move into `targets` on the symbol with index `i`."""
+        forward = self.forward
+        table = forward.table
+        width = forward.width
+        found = 0
+        for p in range(len(forward.states)):
+            target = table[p * width + i]
+            if target >= 0 and targets >> target & 1:
+                found |= 1 << p
+        return found
+
+    def _run(self, symbols: str, start: int, live: list[int] | None) -> tuple[int, int]:
+        """
+        End of the longest non-empty match from `start` (``DEAD`` if none),
+        and the position where the run stopped. With live sets the run stops
+        as soon as no later match end is possible.
+        """
+        forward = self.forward
+        symbol_index = forward.symbol_index
+        table = forward.table
+        width = forward.width
+        accepting = forward.accepting
+        current = forward.initial
+        end = DEAD
+        position = start
+        while position < len(symbols):
+            if live is not None and not live[position] >> current & 1:
+                break
+            i = symbol_index.get(symbols[position])
+            if i is None:
+                break
+            current = table[current * width + i]
+            if current < 0:
+                break
+            position += 1
+            if accepting[current]:
+                end = position
+        return end, position
+
+    def fullmatch(self, text: str) -> Match | None:
+        if not isinstance(text, str):  # pyright: ignore[reportUnnecessaryIsInstance]
+            raise TypeError("Searcher expects string input only.")  # pyright: ignore[reportUnreachable]
+        if self.prefilter is not None and not self.prefilter.may_fullmatch(text):
+            return None
+        if not self.forward.accepts(text):
+            return None
+        return Match(text, 0, len(text))
+
+    def search(self, text: str, pos: int = 0) -> Match | None:
+        return next(self.finditer(text, pos), None)
+
+    def findall(self, text: str, pos: int = 0) -> list[str]:
+        return [match.group() for match in self.finditer(text, pos)]
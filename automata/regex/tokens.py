@@ -0,0 +1,84 @@
+"""
+Postfix tokens of `RegExParser.parse` beyond single characters.
+
+Operands are single alphanumeric characters, `.` and bracket classes such
+as `[a-z0-9]` or `[^,]`; postfix operators are `*`, `+`, `?` and counted
+repetitions such as `{2,5}`. The binary operators are `|` and `CONCAT`,
+which the parser inserts between adjacent items.
+"""
+
+from automata.charclass import ANY_CHAR, ClassMap, Intervals, negate, normalize
+
+CONCAT = "·"
+
+
+def is_operand(token: str) -> bool:
+    return token.isalnum() or token == "." or token.startswith("[")
+
+
+def is_postfix(token: str) -> bool:
+    return token in ("*", "+", "?") or token.startswith("{")
+
+
+def char_class(token: str) -> Intervals:
+    """Code points matched by an operand token."""
+    if token == ".":
+        return ANY_CHAR
+    elif not token.startswith("["):
+        return ((ord(token), ord(token) + 1),)
+    body = token[1:-1]
+    negated = body.startswith("^")
+    if negated:
+        body = body[1:]
+    chars: list[str] = []
+    escaped: list[bool] = []
+    i = 0
+    while i < len(body):
+        if body[i] == "\\" and i + 1 < len(body):
+            i += 1
+            escaped.append(True)
+        else:
+            escaped.append(False)
+        chars.append(body[i])
+        i += 1
+    intervals: list[tuple[int, int]] = []
+    i = 0
+    while i < len(chars):
+        if i + 2 < len(chars) and chars[i + 1] == "-" and not escaped[i + 1]:
+            low, high = ord(chars[i]), ord(chars[i + 2])
+            if low > high:
+                raise ValueError(f"Invalid range {chars[i]}-{chars[i + 2]}.")
+            intervals.append((low, high + 1))
+            i += 3
+        else:
+            intervals.append((ord(chars[i]), ord(chars[i]) + 1))
+            i += 1
+    merged = normalize(intervals)
+    return negate(merged) if negated else merged
+
+
+def repeat_bounds(token: str) -> tuple[int, int | None]:
+    """Minimum and maximum (None if unbounded) of a `{m}`, `{m,}` or `{m,n}`."""
+    body = token[1:-1]
+    if "," not in body:
+        return int(body), int(body)
+    minimum, maximum = body.split(",")
+    return int(minimum), int(maximum) if maximum else None
+
+
+def class_map(parsed_tokens: list[str]) -> ClassMap | None:
+    """
+    Partition for the character classes in the tokens, or None if every
+    operand is a single character and the characters can be used as they are.
+    """
+    operands = [token for token in parsed_tokens if is_operand(token)]
+    if all(token.isalnum() for token in operands):
+        return None
+    return ClassMap.from_intervals(char_class(token) for token in operands)
+
+
+def operand_symbols(token: str, classes: ClassMap | None) -> list[str]:
+    """Alphabet symbols an operand token stands for."""
+    if classes is None:
+        return [token]
+    return classes.symbols_of(char_class(token))
@@ -0,0 +1,343 @@
+"""
+Versioned binary format for automata, and an on-disk cache built on it.
+
+A file is a fixed header, a table of length-prefixed UTF-8 strings (state
+names, then symbols), zero padding to a 4-byte boundary, and a block of
+little-endian int32 values. For DFAs the int block holds the flat
+transition table of `CompiledDFA`, so on little-endian machines `load` can
+memory-map the file and use the table in place without parsing it. The
+block ends with the character classes of the automaton, if it has any.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Callable
+from pathlib import Path
+from typing import TypeVar
+
+from automata import instrumentation
+from automata.charclass import ClassMap
+from automata.dfa.compiled import DEAD, CompiledDFA
+from automata.dfa.dfa import DFA
+from automata.nfa.epsilon import Epsilon, epsilon
+from automata.nfa.nfa import NFA
+from automata.state import State
+
+MAGIC = b"AUTM"
+VERSION = 2
+
+KIND_COMPILED_DFA = 1
+KIND_DFA = 2
+KIND_NFA = 3
+
+# magic, version, kind, number of strings, size of string table, number of ints
+HEADER = struct.Struct("<4sHBxIII")
+LENGTH = struct.Struct("<I")
+
+T = TypeVar("T")
+
+
+class SerializationError(Exception):
+    def __init__(self, *args: object):
+        super().__init__(*args)
+
+
+def dumps(automaton: DFA | NFA | CompiledDFA) -> bytes:
+    if isinstance(automaton, CompiledDFA):
+        kind, compiled = KIND_COMPILED_DFA, automaton
+    elif isinstance(automaton, DFA):
+        kind, compiled = KIND_DFA, automaton.compile()
+    elif isinstance(automaton, NFA):  # pyright: ignore[reportUnnecessaryIsInstance]
+        return _pack(KIND_NFA, *_nfa_sections(automaton))
+    else:
+        raise TypeError(f"Cannot serialize {type(automaton).__name__}.")  # pyright: ignore[reportUnreachable]
+    strings = [state.name for state in compiled.states] + list(compiled.symbols)
+    ints = array("i", [len(compiled.states), compiled.width, compiled.initial])
+    ints.extend(compiled.accepting)
+    ints.extend(compiled.table)
+    ints.extend(_classes_section(compiled.classes))
+    return _pack(kind, strings, ints)
+
+
+def loads(data: bytes | memoryview) -> DFA | NFA | CompiledDFA:
+    try:
+        kind, strings, ints = _unpack(memoryview(data))
+        if kind == KIND_NFA:
+            return _load_nfa(strings, ints)
+        compiled = _load_compiled(strings, ints)
+        return compiled if kind == KIND_COMPILED_DFA else _to_dfa(compiled)
+    except (struct.error, ValueError, IndexError, OverflowError) as error:
+        # sizes that pass the header checks but not the data behind them
+        raise SerializationError(f"Corrupt automaton file: {error}") from error
+
+
+def save(automaton: DFA | NFA | CompiledDFA, path: str | os.PathLike[str]):
+    """Write atomically, so readers never see a partial file."""
+    path = Path(path)
+    fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            _ = file.write(dumps(automaton))
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def load(
+    path: str | os.PathLike[str], use_mmap: bool = True
+) -> DFA | NFA | CompiledDFA:
+    """
+    Read an automaton written by `save`.
+
+    With `use_mmap`, the file is memory-mapped and the transition table of a
+    `CompiledDFA` is a view into the mapping rather than a parsed copy. The
+    loaded automaton owns the mapping: it is unmapped once the automaton and
+    every view of its table are garbage collected. Other kinds are copied
+    out of the mapping, which is released before `load` returns.
+    """
+    with open(path, "rb") as file:
+        if not use_mmap or sys.byteorder != "little":
+            return loads(file.read())
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            # an empty file cannot be mapped at all
+            return loads(file.read())
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return loads(memoryview(mapping))
+
+
+class AutomatonCache:
+    """
+    Directory of serialized automata keyed by a content hash.
+
+    The key covers the source (a pattern string, raw bytes, or an automaton,
+    hashed through its serialized form), any build options, and the format
+    version, so entries never outlive a change in any of them.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]):
+        self.directory: Path = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(
+        self, source: str | bytes | DFA | NFA | CompiledDFA, **options: object
+    ) -> str:
+        digest = hashlib.sha256(f"{MAGIC!r}:{VERSION}".encode())
+        if isinstance(source, str):
+            digest.update(b"str:" + source.encode())
+        elif isinstance(source, bytes):
+            digest.update(b"bytes:" + source)
+        else:
+            digest.update(b"automaton:" + dumps(source))
+        for name in sorted(options):
+            digest.update(f"\0{name}={options[name]!r}".encode())
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.atm"
+
+    def get_or_build(
+        self,
+        source: str | bytes | DFA | NFA | CompiledDFA,
+        build: Callable[[], T],
+        **options: object,
+    ) -> T:
+        stats = instrumentation.active()
+        path = self.path(self.key(source, **options))
+        if path.exists():
+            try:
+                automaton = load(path)
+            except SerializationError:
+                pass
+            else:
+                if stats is not None:
+                    stats.count("disk_cache.hits")
+                return automaton  # pyright: ignore[reportReturnType]
+        if stats is not None:
+            stats.count("disk_cache.misses")
+        automaton = build()
+        save(automaton, path)  # pyright: ignore[reportArgumentType]
+        return automaton
+
+    def purge(self):
+        for path in self.directory.glob("*.atm"):
+            path.unlink(missing_ok=True)
+
+
+def _pack(kind: int, strings: list[str], ints: array[int]) -> bytes:
+    encoded = bytearray()
+    for string in strings:
+        data = string.encode()
+        encoded += LENGTH.pack(len(data))
+        encoded += data
+    encoded += bytes(-(HEADER.size + len(encoded)) % 4)
+    if sys.byteorder != "little":
+        ints = array("i", ints)
+        ints.byteswap()
+    header = HEADER.pack(MAGIC, VERSION, kind, len(strings), len(encoded), len(ints))
+    return header + bytes(encoded) + ints.tobytes()
+
+
+def _unpack(data: memoryview) -> tuple[int, list[str], memoryview | array[int]]:
+    if len(data) < HEADER.size:
+        raise SerializationError("Truncated automaton file.")
+    magic, version, kind, string_count, strings_size, int_count = HEADER.unpack_from(
+        data
+    )
+    if magic != MAGIC:
+        raise SerializationError("Not an automaton file.")
+    if version != VERSION:
+        raise SerializationError(f"Unsupported format version {version}.")
+    if kind not in (KIND_COMPILED_DFA, KIND_DFA, KIND_NFA):
+        raise SerializationError(f"Unknown automaton kind {kind}.")
+    offset = HEADER.size
+    ints_offset = offset + strings_size
+    if len(data) != ints_offset + 4 * int_count:
+        raise SerializationError("Truncated automaton file.")
+
+    strings: list[str] = []
+    for _ in range(string_count):
+        (length,) = LENGTH.unpack_from(data, offset)
+        offset += LENGTH.size
+        strings.append(bytes(data[offset : offset + length]).decode())
+        offset += length
+
+    raw = data[ints_offset:]
+    if sys.byteorder == "little":
+        return kind, strings, raw.cast("i")
+    ints = array("i", raw.tobytes())
+    ints.byteswap()
+    return kind, strings, ints
+
+
+def _load_compiled(strings: list[str], ints: memoryview | array[int]) -> CompiledDFA:
+    size, width, initial = ints[0], ints[1], ints[2]
+    table_end = 3 + size + size * width
+    if len(strings) != size + width or len(ints) <= table_end:
+        raise SerializationError("Inconsistent DFA section sizes.")
+    states = tuple(State(name) for name in strings[:size])
+    symbols = tuple(strings[size:])
+    accepting = bytes(list(ints[3 : 3 + size]))
+    table = ints[3 + size : table_end]
+    classes = _load_classes(ints[table_end:])
+    return CompiledDFA(states, symbols, table, initial, accepting, classes)  # pyright: ignore[reportArgumentType]
+
+
+def _to_dfa(compiled: CompiledDFA) -> DFA:
+    states = compiled.states
+    transitions: dict[State, dict[str, State]] = {}
+    for i, state in enumerate(states):
+        base = i * compiled.width
+        row = {
+            symbol: states[target]
+            for a, symbol in enumerate(compiled.symbols)
+            if (target := compiled.table[base + a]) != DEAD
+        }
+        if row:
+            transitions[state] = row
+    dfa = DFA(
+        set(states),
+        set(compiled.symbols),
+        transitions,
+        states[compiled.initial],
+        {state for i, state in enumerate(states) if compiled.accepting[i]},
+    )
+    dfa.classes = compiled.classes
+    return dfa
+
+
+def _nfa_sections(nfa: NFA) -> tuple[list[str], array[int]]:
+    """
+    States are numbered in BFS order from the initial states, visiting
+    symbols and targets in sorted order, so the bytes depend only on the
+    automaton and not on set or dict iteration order.
+    """
+    symbols = sorted(nfa.alphabet)
+    symbol_index: dict[str | Epsilon, int] = {
+        symbol: i for i, symbol in enumerate(symbols)
+    }
+    symbol_index[epsilon] = -1
+    by_name = sorted(nfa.states, key=lambda s: s.name)
+    states = sorted(nfa.initial, key=lambda s: s.name)
+    state_index = {state: i for i, state in enumerate(states)}
+    edges = array("i")
+    i = 0
+    rest = iter(by_name)
+    while i < len(states) or len(states) < len(by_name):
+        if i == len(states):
+            # unreachable states follow in name order
+            state = next(s for s in rest if s not in state_index)
+            state_index[state] = len(states)
+            states.append(state)
+        state = states[i]
+        row = nfa.transitions.get(state, {})
+        for symbol in sorted(row, key=symbol_index.__getitem__):
+            for target in sorted(row[symbol], key=lambda s: s.name):
+                if target not in state_index:
+                    state_index[target] = len(states)
+                    states.append(target)
+                edges.extend((i, symbol_index[symbol], state_index[target]))
+        i += 1
+    initial = sorted(state_index[state] for state in nfa.initial)
+    accepting = sorted(
+        state_index[state] for state in nfa.accepting if state in state_index
+    )
+    ints = array(
+        "i", [len(states), len(symbols), len(initial), len(accepting), len(edges)]
+    )
+    ints.extend(initial)
+    ints.extend(accepting)
+    ints.extend(edges)
+    ints.extend(_classes_section(nfa.classes))
+    return [state.name for state in states] + symbols, ints
+
+
+def _load_nfa(strings: list[str], ints: memoryview | array[int]) -> NFA:
+    size, width, initial_count, accepting_count, edge_count = ints[:5]
+    edges_offset = 5 + initial_count + accepting_count
+    edges_end = edges_offset + edge_count
+    if len(strings) != size + width or edge_count % 3 or len(ints) <= edges_end:
+        raise SerializationError("Inconsistent NFA section sizes.")
+    states = [State(name) for name in strings[:size]]
+    symbols: list[str | Epsilon] = list(strings[size:])
+    transitions: dict[State, dict[str | Epsilon, set[State]]] = {}
+    for i in range(edges_offset, edges_end, 3):
+        source, symbol, target = ints[i], ints[i + 1], ints[i + 2]
+        row = transitions.setdefault(states[source], {})
+        row.setdefault(epsilon if symbol < 0 else symbols[symbol], set()).add(
+            states[target]
+        )
+    nfa = NFA(
+        set(states),
+        set(strings[size:]),
+        transitions,
+        {states[i] for i in ints[5 : 5 + initial_count]},
+        {states[i] for i in ints[5 + initial_count : edges_offset]},
+    )
+    nfa.classes = _load_classes(ints[edges_end:])
+    return nfa
+
+
+def _classes_section(classes: ClassMap | None) -> list[int]:
+    """Class count, then the start and symbol (-1 if none) of every class."""
+    if classes is None:
+        return [0]
+    symbols = [-1 if symbol is None else ord(symbol) for symbol in classes.symbols]
+    return [len(classes.starts), *classes.starts, *symbols]
+
+
+def _load_classes(ints: memoryview | array[int]) -> ClassMap | None:
+    count = ints[0]
+    if len(ints) != 1 + 2 * count:
+        raise SerializationError("Inconsistent character class section size.")
+    if not count:
+        return None
+    return ClassMap(
+        tuple(ints[1 : 1 + count]),
+        tuple(None if code < 0 else chr(code) for code in ints[1 + count :]),
+    )
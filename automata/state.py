@@ -2,6 +2,15 @@ from typing import override
 
 
 class State:
+    """
+    Automaton state, identified by its name.
+
+    States have no per-instance `__dict__`, and hash and compare by name.
+    States made by `from_set` are named `{a,b,...}` after their members.
+    """
+
+    __slots__ = ("name",)
+
     base_name: str = "q"
     instance_counter: int = 0
 
@@ -36,6 +45,10 @@ class State:
         else:
             return False
 
+    @override
+    def __reduce__(self):
+        return State, (self.name,)
+
     @classmethod
     def set_base_name(cls, base_name: str):
         if not isinstance(base_name, str):  # pyright: ignore[reportUnnecessaryIsInstance]
@@ -48,7 +61,5 @@ class State:
         cls.instance_counter = 0
 
     @classmethod
-    def from_set(cls, states: set["State"]) -> "State":
-        return State(
-            f"{{{','.join(state.name for state in sorted(states, key=lambda s: s.name))}}}"
-        )
+    def from_set(cls, states: set["State"] | frozenset["State"]) -> "State":
+        return State(f"{{{','.join(sorted(state.name for state in states))}}}")
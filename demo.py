@@ -21,7 +21,7 @@ def main():
     print()
 
     # manual re to NFA
-    # "(a*)(b|c)"
+    # "(a*b)|c"
     re = "a*b|c"
     tokens = RegExParser.tokenize(re)
     print("6a.", tokens)
@@ -0,0 +1,31 @@
+from automata.charclass import ANY_CHAR, MAX_CODE_POINT, ClassMap, negate, normalize
+
+
+def test_normalize_and_negate():
+    assert normalize([(5, 7), (0, 2), (1, 3), (7, 9), (4, 4)]) == ((0, 3), (5, 9))
+    assert negate(((0, 3), (5, 9))) == ((3, 5), (9, MAX_CODE_POINT))
+    assert negate(ANY_CHAR) == ()
+    assert negate(()) == ANY_CHAR
+
+
+def test_class_map_partition():
+    lower = ((ord("a"), ord("z") + 1),)
+    digit = ((ord("0"), ord("9") + 1),)
+    x = ((ord("x"), ord("x") + 1),)
+    classes = ClassMap.from_intervals([lower, digit, x])
+
+    assert classes.alphabet == {"0", "a", "x"}
+    assert classes.symbol("q") == "a"
+    assert classes.symbol("z") == "a"
+    assert classes.symbol("x") == "x"
+    assert classes.symbol("7") == "0"
+    assert classes.symbol("-") is None
+    assert classes.symbols_of(lower) == ["a", "x"]
+    assert classes.translate("hello-x42") == "aaaaa-x00"
+
+
+def test_class_map_equality():
+    lower = ((ord("a"), ord("z") + 1),)
+
+    assert ClassMap.from_intervals([lower]) == ClassMap.from_intervals([lower])
+    assert ClassMap.from_intervals([lower]) != ClassMap.from_intervals([ANY_CHAR])
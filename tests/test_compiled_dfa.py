@@ -0,0 +1,91 @@
+import pytest
+
+from automata import DFA, NFA, State, epsilon
+from automata.dfa import CompiledDFA
+from automata.dfa.compiled import DEAD
+from automata.dfa.samples import EVEN_OCCURRENCE_EACH_CHAR, NO_MAX
+
+
+def test_compiled_matches_dfa():
+    for dfa in (EVEN_OCCURRENCE_EACH_CHAR, NO_MAX):
+        compiled = dfa.compile()
+        for string in ("", "a", "aa", "abab", "max", "mamx", "cabac", "z", "maz"):
+            assert compiled.accepts(string) == dfa.accepts(string)
+
+
+def test_compiled_dense_numbering():
+    compiled = NO_MAX.compile()
+
+    assert isinstance(compiled, CompiledDFA)
+    assert compiled.symbols == ("a", "m", "x")
+    assert len(compiled.table) == len(compiled.states) * compiled.width
+    assert compiled.states[compiled.initial] == NO_MAX.initial
+
+
+def test_compiled_incomplete_transition():
+    ab_or_b = DFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2")},
+        {"a", "b"},
+        {q0: {"a": q1, "b": q2}, q1: {"b": q2}},
+        q0,
+        {q2},
+    ).compile()
+
+    assert ab_or_b.accepts("b")
+    assert ab_or_b.accepts("ab")
+    assert not ab_or_b.accepts("aa")
+    assert ab_or_b.run("aa") == DEAD
+    assert ab_or_b.step(ab_or_b.initial, "c") == DEAD
+
+
+def test_compiled_from_nfa():
+    nfa = NFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2"), q3 := State("q3")},
+        {"0", "1"},
+        {q0: {epsilon: {q1}, "1": {q2}}, q1: {"0": {q3}}, q2: {epsilon: {q3}}},
+        {q0},
+        {q3},
+    )
+    compiled = nfa.to_dfa().compile()
+
+    for string in ("0", "1", "00", "01", "10"):
+        assert compiled.accepts(string) == nfa.accepts(string)
+
+
+def test_compiled_is_frozen():
+    compiled = NO_MAX.compile()
+
+    with pytest.raises(AttributeError):
+        compiled.initial = 0  # pyright: ignore[reportAttributeAccessIssue]
+
+    with pytest.raises(TypeError):
+        _ = compiled.accepts(1)  # pyright: ignore[reportArgumentType]
+
+
+def test_accepts_many():
+    strings = ["", "a", "aa", "abab", "max", "mamx", "cabac", "z", "maz"]
+
+    for dfa in (EVEN_OCCURRENCE_EACH_CHAR, NO_MAX):
+        results = dfa.accepts_many(iter(strings))
+
+        assert isinstance(results, bytearray)
+        assert [bool(r) for r in results] == [dfa.accepts(s) for s in strings]
+
+    with pytest.raises(TypeError):
+        _ = NO_MAX.accepts_many(["a", 1])  # pyright: ignore[reportArgumentType]
+
+
+def test_compiled_longest_prefix():
+    a_b_plus = DFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2")},
+        {"a", "b"},
+        {q0: {"a": q1}, q1: {"b": q2}, q2: {"b": q2}},
+        q0,
+        {q2},
+    ).compile()
+
+    assert a_b_plus.longest_prefix("abbba") == 4
+    assert a_b_plus.longest_prefix("babb", 1) == 4
+    assert a_b_plus.longest_prefix("abab", 1) == DEAD
+    assert a_b_plus.longest_prefix("acbb") == DEAD
+    assert a_b_plus.longest_prefix("ab", 2) == DEAD
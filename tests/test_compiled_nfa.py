@@ -0,0 +1,68 @@
+import pytest
+
+from automata import NFA, State, epsilon
+from automata.nfa import CompiledNFA
+from automata.nfa.samples import A_OR_B_WHOLE_STAR
+from automata.regex import RegExParser
+
+
+def test_compiled_matches_nfa():
+    compiled = A_OR_B_WHOLE_STAR.compile()
+
+    assert isinstance(compiled, CompiledNFA)
+    for string in ("", "a", "b", "ab", "aba", "baaabbbbabababb", "c", "abc"):
+        assert compiled.accepts(string) == A_OR_B_WHOLE_STAR.accepts(string)
+
+
+def test_compiled_masks():
+    nfa = NFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2"), q3 := State("q3")},
+        {"0", "1"},
+        {q0: {epsilon: {q1}, "1": {q2}}, q1: {"0": {q3}}, q2: {epsilon: {q3}}},
+        {q0},
+        {q3},
+    )
+    compiled = nfa.compile()
+
+    assert compiled.to_states(compiled.initial) == {q0, q1}
+    assert compiled.to_states(compiled.run("1")) == {q2, q3}
+    assert compiled.to_states(compiled.step(compiled.initial, "0")) == {q3}
+    assert compiled.run("11") == 0
+    assert compiled.accepts("0")
+    assert compiled.accepts("1")
+    assert not compiled.accepts("10")
+
+
+def test_compiled_is_frozen():
+    compiled = A_OR_B_WHOLE_STAR.compile()
+
+    with pytest.raises(AttributeError):
+        compiled.initial = 0  # pyright: ignore[reportAttributeAccessIssue]
+
+    with pytest.raises(TypeError):
+        _ = compiled.accepts(1)  # pyright: ignore[reportArgumentType]
+
+
+def test_accepts_many():
+    strings = ["", "a", "b", "ab", "aba", "baaabbbbabababb", "c", "abc"]
+
+    results = A_OR_B_WHOLE_STAR.accepts_many(strings)
+
+    assert isinstance(results, bytearray)
+    assert [bool(r) for r in results] == [A_OR_B_WHOLE_STAR.accepts(s) for s in strings]
+
+
+def test_compiled_follow_masks():
+    literal = RegExParser.to_nfa("abcdefgh" * 8).compile()
+
+    # a chain of literals is followed by shifts alone
+    assert literal.irregular == 0
+    assert literal.linear.bit_count() == 64
+    assert literal.accepts("abcdefgh" * 8)
+    assert not literal.accepts("abcdefgh" * 7 + "abcdefgx")
+
+    looped = RegExParser.to_nfa("(a|b)*abb").compile()
+    assert looped.irregular != 0
+    assert looped.accepts("babaabb")
+    assert not looped.accepts("babaab")
+    assert looped.step(looped.step(looped.initial, "a"), "c") == 0
@@ -0,0 +1,68 @@
+from itertools import product
+from random import Random
+
+import pytest
+
+from automata.dfa import LanguageCounter
+from automata.dfa.samples import EVEN_OCCURRENCE_EACH_CHAR, NO_MAX
+from automata.regex import RegExParser
+
+
+def test_count_matches_enumeration():
+    for dfa in (NO_MAX, EVEN_OCCURRENCE_EACH_CHAR):
+        for n in range(6):
+            expected = sum(
+                dfa.accepts("".join(chars)) for chars in product("abcmx", repeat=n)
+            )
+            assert dfa.count(n) == expected
+
+
+def test_count_empty_string():
+    assert NO_MAX.count(0) == 0
+    with pytest.raises(ValueError):
+        _ = NO_MAX.count(-1)
+
+
+def test_count_large_lengths():
+    counter = NO_MAX.counter()
+
+    assert isinstance(counter, LanguageCounter)
+    for n in (1, 7, 64, 300):
+        assert counter.count(n) == counter._count_by_powers(n)  # pyright: ignore[reportPrivateUsage]
+    # strings over {a, b, c} of even length with every symbol even
+    assert EVEN_OCCURRENCE_EACH_CHAR.count(2) == 3
+    assert EVEN_OCCURRENCE_EACH_CHAR.count(10**3) == (3**1000 + 3) // 4
+
+
+def test_count_character_classes():
+    dfa = RegExParser.to_nfa("[a-z][0-9]?").to_dfa()
+
+    assert dfa.count(1) == 26
+    assert dfa.count(2) == 260
+    assert dfa.count(3) == 0
+
+
+def test_sample():
+    dfa = RegExParser.to_nfa("[a-z][0-9]?").to_dfa()
+
+    samples = dfa.sample(2, 50, Random(0))
+
+    assert len(samples) == 50
+    assert all(len(sample) == 2 and dfa.accepts(sample) for sample in samples)
+    assert dfa.sample(2, 3, Random(1)) == dfa.sample(2, 3, Random(1))
+
+
+def test_sample_is_uniform():
+    counter = NO_MAX.counter()
+
+    samples = counter.sample(3, 2600, Random(0))
+
+    assert len(set(samples)) == counter.count(3) == 26
+    assert all(NO_MAX.accepts(sample) for sample in samples)
+
+
+def test_sample_without_strings():
+    with pytest.raises(ValueError):
+        _ = NO_MAX.sample(0)
+    with pytest.raises(ValueError):
+        _ = RegExParser.to_nfa("ab").to_dfa().sample(3)
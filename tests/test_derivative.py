@@ -0,0 +1,96 @@
+import gc
+
+import pytest
+
+from automata.regex import DerivativeMatcher, RegExParser
+from automata.regex.derivative import (
+    EMPTY,
+    EPSILON,
+    Expr,
+    concat,
+    star,
+    symbol,
+    union,
+)
+from automata.regex.regex import ParsingError
+
+
+def test_hash_consing():
+    a = symbol("a")
+    b = symbol("b")
+
+    assert symbol("a") is a
+    assert union(a, b) is union(b, a) is union(a, union(b, a))
+    assert concat(concat(a, b), a) is concat(a, concat(b, a))
+    assert star(star(a)) is star(a)
+    assert union(a, EMPTY) is a
+    assert concat(a, EPSILON) is a
+    assert concat(EMPTY, a) is EMPTY
+    assert star(EPSILON) is EPSILON
+
+
+def test_derivative_matcher_matches_nfa():
+    patterns = ["ab", "a|b", "a*b|c", "(a|b)*", "a+b*", "((a|b|c|d)|((z*)|a))*"]
+    strings = ["", "a", "b", "c", "ab", "ac", "ba", "abb", "aab", "zzd", "abab", "x"]
+
+    for pattern in patterns:
+        nfa = RegExParser.to_nfa(pattern)
+        matcher = RegExParser.to_derivative_matcher(pattern)
+
+        assert isinstance(matcher, DerivativeMatcher)
+        for string in strings:
+            assert matcher.accepts(string) == nfa.accepts(string)
+
+
+def test_derivative_cache():
+    matcher = RegExParser.to_derivative_matcher("(a|b)*")
+
+    assert matcher.accepts("abba")
+    cached = matcher.cache_size
+
+    assert matcher.accepts("baab")
+    assert matcher.cache_size == cached
+
+
+def test_derivative_to_dfa():
+    matcher = RegExParser.to_derivative_matcher("a+b*")
+    dfa = matcher.to_dfa()
+
+    assert len(dfa.states) == 3
+    for string in ("a", "aa", "ab", "abb", "aab", "b", "ba", "aba"):
+        assert dfa.accepts(string) == matcher.accepts(string)
+
+
+def test_derivative_invalid():
+    with pytest.raises(ParsingError):
+        _ = RegExParser.to_derivative_matcher("a||b")
+
+    with pytest.raises(TypeError):
+        _ = RegExParser.to_derivative_matcher("a").accepts(1)  # pyright: ignore[reportArgumentType]
+
+
+def test_derivative_long_patterns():
+    literal = RegExParser.to_derivative_matcher("a" * 3000)
+
+    assert literal.accepts("a" * 3000)
+    assert not literal.accepts("a" * 2999)
+
+    stars = RegExParser.to_derivative_matcher("a*" * 2000 + "b")
+
+    assert stars.accepts("b")
+    assert not stars.accepts("a")
+
+
+def test_hash_consing_releases_unused():
+    _ = gc.collect()
+    interned = len(Expr._table)  # pyright: ignore[reportPrivateUsage]
+    expression = EPSILON
+    for c in "abcdefghij" * 10:
+        expression = concat(star(symbol(c)), expression)
+
+    assert len(Expr._table) > interned  # pyright: ignore[reportPrivateUsage]
+
+    del expression
+    _ = gc.collect()
+
+    assert len(Expr._table) == interned  # pyright: ignore[reportPrivateUsage]
@@ -1,6 +1,9 @@
+import time
+
 import pytest
 
 from automata import DFA, State
+from automata.dfa.samples import NO_MAX
 
 
 def test_non_string_input():
@@ -97,3 +100,90 @@ def test_unrecognized_accepting():
     )
 
     assert test_dfa.accepting == {q5}
+
+
+def test_minimize():
+    minimal = NO_MAX.minimize()
+
+    assert len(minimal.states) == 3
+    assert minimal.initial == State("q0")
+    for string in ("a", "m", "ma", "max", "amax", "mamaaaa", "xmxmaxmmaamx"):
+        assert minimal.accepts(string) == NO_MAX.accepts(string)
+
+
+def test_minimize_merges_equivalent_states():
+    test_dfa = DFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2"), q3 := State("q3")},
+        {"a", "b"},
+        {
+            q0: {"a": q1, "b": q2},
+            q1: {"a": q3, "b": q3},
+            q2: {"a": q3, "b": q3},
+            q3: {"a": q3, "b": q3},
+        },
+        q0,
+        {q1, q2},
+    )
+
+    minimal = test_dfa.minimize()
+
+    assert len(minimal.states) == 2
+    assert minimal.accepts("a")
+    assert minimal.accepts("b")
+    assert not minimal.accepts("ab")
+
+
+def test_minimize_empty_language():
+    test_dfa = DFA(
+        {q0 := State("q0"), q1 := State("q1")},
+        {"a"},
+        {q0: {"a": q1}, q1: {"a": q0}},
+        q0,
+        set(),
+    )
+
+    minimal = test_dfa.minimize()
+
+    assert minimal.states == {State("q0")}
+    assert minimal.accepting == set()
+    assert minimal.transitions == {State("q0"): {"a": State("q0")}}
+
+
+def test_minimize_long_chain_is_not_quadratic():
+    def minimize_chain(length: int) -> float:
+        states = [State(f"c{i}") for i in range(length)]
+        transitions = {p: {"a": q} for p, q in zip(states, states[1:])}
+        transitions[states[-1]] = {"a": states[-1]}
+        chain = DFA(set(states), {"a"}, transitions, states[0], {states[-1]})
+        start = time.perf_counter()
+        minimal = chain.minimize()
+        elapsed = time.perf_counter() - start
+        assert len(minimal.states) == length
+        return elapsed
+
+    # every split of a chain peels a single state off a block that holds
+    # most of the chain, so a split costing O(|block|) is quadratic
+    small = min(minimize_chain(5_000) for _ in range(3))
+    large = min(minimize_chain(20_000) for _ in range(3))
+    assert large < 10 * small
+
+
+def test_iter_transitions():
+    ab_or_b = DFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2")},
+        {"a", "b"},
+        {q0: {"a": q1, "b": q2}, q1: {"b": q2}},
+        q0,
+        {q2},
+    )
+
+    trace = ab_or_b.iter_transitions("ab")
+
+    assert next(trace) == q0
+    assert list(trace) == [q1, q2]
+    assert ab_or_b.state_transitions("aab") == [q0, q1]
+    assert ab_or_b.state_transitions("c") == [q0]
+    assert ab_or_b._traverse("ab") == ([q0, q1, q2], True)  # pyright: ignore[reportPrivateUsage]
+
+    with pytest.raises(TypeError):
+        _ = ab_or_b.iter_transitions(1)  # pyright: ignore[reportArgumentType]
@@ -22,3 +22,61 @@ def test_closure_function():
     assert nfa_test.epsilon_closure({q1}) == {q1}
     assert nfa_test.epsilon_closure({q2}) == {q1, q2}
     assert nfa_test.epsilon_closure({q0, q2}) == {q0, q1, q2}
+
+
+def test_closure_does_not_mutate_input():
+    nfa_test = NFA(
+        {q0 := State("q0"), q1 := State("q1")},
+        {"a"},
+        {q0: {epsilon: {q1}}},
+        {q0},
+        {q1},
+    )
+    states = {q0}
+
+    assert nfa_test.epsilon_closure(states) == {q0, q1}
+    assert states == {q0}
+
+
+def test_closure_of_epsilon_cycle():
+    nfa_test = NFA(
+        {
+            q0 := State("q0"),
+            q1 := State("q1"),
+            q2 := State("q2"),
+            q3 := State("q3"),
+        },
+        {"a"},
+        {
+            q0: {epsilon: {q1}},
+            q1: {epsilon: {q2}},
+            q2: {epsilon: {q0, q3}},
+            q3: {"a": {q0}},
+        },
+        {q0},
+        {q3},
+    )
+
+    assert nfa_test.epsilon_closure({q0}) == {q0, q1, q2, q3}
+    assert nfa_test.epsilon_closure({q2}) == {q0, q1, q2, q3}
+    assert nfa_test.epsilon_closure({q3}) == {q3}
+
+
+def test_closure_cache_invalidation():
+    nfa_test = NFA(
+        {q0 := State("q0"), q1 := State("q1")},
+        {"a"},
+        {q0: {"a": {q1}}},
+        {q0},
+        {q1},
+    )
+
+    assert nfa_test.epsilon_closure({q0}) == {q0}
+
+    new_initial = nfa_test._merge_initial_states(State("s"))  # pyright: ignore[reportPrivateUsage]
+
+    assert nfa_test.epsilon_closure({new_initial}) == {new_initial, q0}
+
+    nfa_test.transitions = {q0: {epsilon: {q1}}}
+
+    assert nfa_test.epsilon_closure({q0}) == {q0, q1}
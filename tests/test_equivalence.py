@@ -0,0 +1,75 @@
+from automata import DFA, State
+from automata.comparison import Comparison
+from automata.dfa.samples import EVEN_NUMBER_OF_ZEROS, NO_MAX
+from automata.regex import RegExParser
+
+
+def test_dfa_equivalent():
+    dfa = RegExParser.to_nfa("(a|b)*a").to_dfa()
+
+    result = dfa.equivalent(dfa.minimize())
+
+    assert result
+    assert result == Comparison()
+    assert result.counterexample is None
+    assert NO_MAX.equivalent(NO_MAX.minimize())
+
+
+def test_dfa_not_equivalent():
+    a = RegExParser.to_nfa("(a|b)*a").to_dfa()
+    b = RegExParser.to_nfa("(a|b)*ba").to_dfa()
+
+    result = a.equivalent(b)
+
+    assert not result
+    assert result.counterexample == "a"
+    assert b.equivalent(a).counterexample == "a"
+
+
+def test_dfa_equivalence_ignores_empty_string():
+    # both accept only the empty string, which no DFA accepts
+    only_empty = DFA({q0 := State("q0")}, {"a"}, {q0: {}}, q0, {q0})
+    nothing = DFA({q1 := State("q1")}, {"a"}, {q1: {}}, q1, set())
+
+    assert only_empty.equivalent(nothing)
+
+
+def test_dfa_subset():
+    a = RegExParser.to_nfa("(a|b)*ab").to_dfa()
+    b = RegExParser.to_nfa("[ab]*b").to_dfa()
+
+    assert a.is_subset(b)
+    result = b.is_subset(a)
+    assert not result
+    assert result.counterexample == "b"
+
+
+def test_dfa_counterexample_is_shortest():
+    result = EVEN_NUMBER_OF_ZEROS.is_subset(NO_MAX)
+
+    assert result.counterexample == "1"
+    assert not NO_MAX.equivalent(RegExParser.to_nfa("[amx]*").to_dfa())
+    assert (
+        NO_MAX.equivalent(RegExParser.to_nfa("[amx]*").to_dfa()).counterexample == "max"
+    )
+
+
+def test_nfa_inclusion():
+    a = RegExParser.to_nfa("(a|b)*ab")
+    b = RegExParser.to_nfa("[ab]*b", "glushkov")
+
+    assert a.is_subset(b)
+    assert b.is_subset(a).counterexample == "b"
+    result = RegExParser.to_nfa("a*").is_subset(RegExParser.to_nfa("a+"))
+    assert result == Comparison("")
+
+
+def test_nfa_equivalence():
+    a = RegExParser.to_nfa("a{2,3}")
+    b = RegExParser.to_nfa("aaa?", "glushkov")
+
+    assert a.equivalent(b)
+    result = a.equivalent(RegExParser.to_nfa("aa"))
+    assert not result
+    assert result.counterexample == "aaa"
+    assert repr(result) == "Comparison(holds=False, counterexample='aaa')"
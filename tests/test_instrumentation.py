@@ -0,0 +1,91 @@
+from automata import instrumentation
+from automata.dfa.samples import NO_MAX
+from automata.nfa.samples import A_OR_B_WHOLE_STAR
+from automata.regex import RegExParser
+from automata.regex.cache import PatternCache
+
+
+def test_disabled_by_default():
+    assert instrumentation.active() is None
+    assert NO_MAX.accepts("max") is False
+    assert instrumentation.active() is None
+
+
+def test_collect_construction():
+    with instrumentation.collect() as stats:
+        _ = RegExParser.to_nfa("(a|b)*c").to_dfa().minimize()
+
+    assert instrumentation.active() is None
+    for name in ("regex.tokenize", "regex.parse", "regex.compile", "nfa.to_dfa"):
+        assert stats.counters[name] == 1
+        assert stats.timings[name] >= 0
+    assert stats.counters["dfa.minimize"] == 1
+    assert stats.counters["nfa.closures"] > 0
+    assert stats.counters["nfa.subsets"] > 0
+
+
+def test_collect_traversal():
+    with instrumentation.collect() as stats:
+        assert NO_MAX.accepts("amam")
+        assert A_OR_B_WHOLE_STAR.accepts("ab")
+
+    assert stats.counters["dfa.characters"] == 4
+    assert stats.counters["dfa.states"] == 5
+    assert stats.counters["nfa.characters"] == 2
+    assert stats.counters["nfa.states"] > 0
+
+    with instrumentation.collect() as stats:
+        assert not NO_MAX.accepts("maza")
+        _ = A_OR_B_WHOLE_STAR.state_transitions("abc")
+
+    # both stop at the first symbol outside their alphabet
+    assert stats.counters["dfa.characters"] == 2
+    assert stats.counters["nfa.characters"] == 2
+
+
+def test_cache_counters_and_hook():
+    cache = PatternCache()
+    events: list[tuple[str, float]] = []
+
+    with instrumentation.collect(
+        lambda name, value: events.append((name, value))
+    ) as stats:
+        _ = cache.get("a", lambda: 1)
+        _ = cache.get("a", lambda: 1)
+
+    assert stats.counters == {"cache.misses": 1, "cache.hits": 1}
+    assert events == [("cache.misses", 1), ("cache.hits", 1)]
+    assert stats.as_dict() == {
+        "counters": {"cache.misses": 1, "cache.hits": 1},
+        "timings": {},
+    }
+
+
+def test_lazy_dfa_and_derivative_counters():
+    lazy = A_OR_B_WHOLE_STAR.lazy_dfa()
+    matcher = RegExParser.to_derivative_matcher("(a|b)*c")
+
+    with instrumentation.collect() as stats:
+        assert lazy.accepts("ab")
+        assert lazy.accepts("ab")
+        assert matcher.accepts("abc")
+        assert matcher.accepts("abc")
+
+    assert stats.counters["lazy_dfa.misses"] == lazy.misses == 2
+    assert stats.counters["lazy_dfa.hits"] == lazy.hits == 2
+    assert stats.counters["derivative.misses"] == matcher.cache_size == 3
+    assert stats.counters["derivative.hits"] == 3
+
+
+def test_enable_and_disable():
+    stats = instrumentation.enable()
+    try:
+        _ = RegExParser.tokenize("ab")
+        assert instrumentation.active() is stats
+    finally:
+        assert instrumentation.disable() is stats
+
+    assert stats.counters["regex.tokenize"] == 1
+    stats.reset()
+    assert stats.counters == {}
+    assert instrumentation.disable() is None
@@ -0,0 +1,45 @@
+import pytest
+
+from automata.nfa import LazyDFA
+from automata.nfa.samples import A_OR_B_WHOLE_STAR, nth_symbol_from_end
+
+
+def test_lazy_matches_nfa():
+    lazy = A_OR_B_WHOLE_STAR.lazy_dfa()
+
+    assert isinstance(lazy, LazyDFA)
+    for string in ("", "a", "b", "ab", "aba", "baaabbbbabababb", "c", "abc"):
+        assert lazy.accepts(string) == A_OR_B_WHOLE_STAR.accepts(string)
+
+
+def test_lazy_cache_counters():
+    lazy = A_OR_B_WHOLE_STAR.lazy_dfa()
+
+    assert lazy.accepts("abab")
+    assert lazy.misses > 0
+    misses = lazy.misses
+
+    assert lazy.accepts("abab")
+    assert lazy.misses == misses
+    assert lazy.hits >= 4
+
+
+def test_lazy_eviction_and_fallback():
+    nfa = nth_symbol_from_end(6)
+    string = "ab" * 40 + "abbbbb"
+
+    for eviction in ("lru", "flush"):
+        lazy = nfa.lazy_dfa(max_states=4, eviction=eviction)
+
+        assert lazy.accepts(string) == nfa.accepts(string)
+        assert lazy.cache_size <= 4
+        assert lazy.evictions > 0
+        assert lazy.fallbacks == 1
+
+
+def test_lazy_invalid_parameters():
+    with pytest.raises(ValueError):
+        _ = A_OR_B_WHOLE_STAR.lazy_dfa(max_states=0)
+
+    with pytest.raises(ValueError):
+        _ = A_OR_B_WHOLE_STAR.lazy_dfa(eviction="random")
@@ -2,6 +2,7 @@ import pytest
 
 from automata import NFA, State
 from automata.nfa import epsilon
+from automata.nfa.samples import nth_symbol_from_end
 
 
 def test_non_string_input():
@@ -205,3 +206,143 @@ def test_kleene_plus():
 
     assert a_star.epsilon_closure({new_initial}) == {new_initial, a1}
     assert a_star.epsilon_closure({a2}) == {a1, a2, new_accepting}
+
+
+def test_to_dfa():
+    nfa = NFA(
+        {q1 := State("q1"), q2 := State("q2"), q3 := State("q3"), q4 := State("q4")},
+        {"0", "1"},
+        {
+            q1: {"0": {q1}, "1": {q1, q2}},
+            q2: {"0": {q3}, epsilon: {q3}},
+            q3: {"1": {q4}},
+            q4: {"0": {q4}, "1": {q4}},
+        },
+        {q1},
+        {q4},
+    )
+
+    dfa = nfa.to_dfa()
+
+    assert nfa.initial == {q1}
+    assert dfa.initial == State("{q1}")
+    assert dfa.states == {
+        State("{q1}"),
+        State("{q1,q2,q3}"),
+        State("{q1,q3}"),
+        State("{q1,q2,q3,q4}"),
+        State("{q1,q3,q4}"),
+        State("{q1,q4}"),
+    }
+    for string in ("1", "11", "101", "0110", "1000", "00100", "010101"):
+        assert dfa.accepts(string) == nfa.accepts(string)
+
+
+def test_to_dfa_nth_symbol_from_end():
+    n = 10
+    nfa = nth_symbol_from_end(n)
+
+    dfa = nfa.to_dfa()
+
+    assert len(dfa.states) == 2**n
+    assert dfa.accepts("a" + "b" * (n - 1))
+    assert not dfa.accepts("b" * n)
+
+
+def test_iter_transitions():
+    ab_or_b = NFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2")},
+        {"a", "b"},
+        {q0: {"a": {q1}, "b": {q2}}, q1: {epsilon: {q0}, "b": {q2}}},
+        {q0},
+        {q2},
+    )
+
+    trace = ab_or_b.iter_transitions("ab")
+
+    assert next(trace) == q0
+    rest = list(trace)
+    assert set(rest[:2]) == {q0, q1}
+    assert rest[2:] == [q2]
+    assert ab_or_b.state_transitions("c") == [q0]
+    assert ab_or_b.initial == {q0}
+
+    with pytest.raises(TypeError):
+        _ = ab_or_b.iter_transitions(1)  # pyright: ignore[reportArgumentType]
+
+
+def test_traverse_reads_input_once():
+    ab_or_b = NFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2")},
+        {"a", "b"},
+        {q0: {"a": {q1}, "b": {q2}}, q1: {epsilon: {q0}, "b": {q2}}},
+        {q0},
+        {q2},
+    )
+    closures: list[set[State]] = []
+    iter_closures = ab_or_b._iter_closures  # pyright: ignore[reportPrivateUsage]
+
+    def record(string: str):
+        for closure in iter_closures(string):
+            closures.append(closure)
+            yield closure
+
+    ab_or_b._iter_closures = record  # pyright: ignore[reportPrivateUsage]
+
+    for string in ("ab", "a", "b", "bb", "c", ""):
+        closures.clear()
+        visited, accepted = ab_or_b._traverse(string)  # pyright: ignore[reportPrivateUsage]
+        assert len(closures) <= len(string) + 1
+        assert visited == ab_or_b.state_transitions(string)
+        assert accepted == ab_or_b.accepts(string)
+
+
+def test_remove_epsilons():
+    nfa = NFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2"), q3 := State("q3")},
+        {"0", "1"},
+        {q0: {epsilon: {q1}, "1": {q2}}, q1: {"0": {q3}}, q2: {epsilon: {q3}}},
+        {q0},
+        {q3},
+    )
+
+    epsilon_free = nfa.remove_epsilons()
+
+    assert all(epsilon not in row for row in epsilon_free.transitions.values())
+    assert epsilon_free.initial == {q0}
+    assert epsilon_free.accepting == {q2}
+    assert epsilon_free.states == {q0, q2}
+    for string in ("", "0", "1", "00", "01", "10", "11"):
+        assert epsilon_free.accepts(string) == nfa.accepts(string)
+
+
+def test_remove_epsilons_prunes_useless_states():
+    nfa = NFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2"), q3 := State("q3")},
+        {"a", "b"},
+        {q0: {"a": {q1, q2}}, q2: {"b": {q2}}, q3: {"a": {q1}}},
+        {q0},
+        {q1},
+    )
+
+    epsilon_free = nfa.remove_epsilons()
+
+    assert epsilon_free.states == {q0, q1}
+    assert epsilon_free.transitions == {q0: {"a": {q1}}, q1: {}}
+
+
+def test_kleene_star_does_not_mutate_input():
+    a = NFA(
+        {a1 := State("a1"), a2 := State("a2")},
+        {"a"},
+        {a1: {"a": {a2}}},
+        {a1},
+        {a2},
+    )
+
+    _ = NFA.kleene_star(a)
+
+    assert a.states == {a1, a2}
+    assert a.transitions == {a1: {"a": {a2}}}
+    assert a.initial == {a1}
+    assert a.accepting == {a2}
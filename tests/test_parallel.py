@@ -0,0 +1,93 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from automata.dfa import ParallelMatcher
+from automata.dfa.compiled import DEAD
+from automata.dfa.parallel import chunk_mapping
+from automata.dfa.samples import EVEN_OCCURRENCE_EACH_CHAR, NO_MAX
+from automata.regex import RegExParser
+
+
+def test_chunk_mapping():
+    compiled = NO_MAX.compile()
+
+    for chunk in ("", "a", "mam", "max", "ammax", "z"):
+        mapping = chunk_mapping(compiled, chunk)
+        for state in range(len(compiled.states)):
+            expected = state
+            for symbol in chunk:
+                expected = compiled.step(expected, symbol)
+                if expected < 0:
+                    break
+            assert mapping[state] == expected
+
+
+def test_parallel_matches_serial():
+    compiled = EVEN_OCCURRENCE_EACH_CHAR.compile()
+    strings = ["abcabc" * 40, "abcabc" * 40 + "a", "ab" * 101, "abcz" * 30]
+
+    for workers in (1, 2):
+        with ParallelMatcher(compiled, workers=workers, chunk_size=16) as matcher:
+            for string in strings:
+                assert matcher.accepts(string) == compiled.accepts(string)
+                assert matcher.run(string) == compiled.run(string)
+
+
+def test_parallel_boundaries():
+    compiled = RegExParser.compiled("[a-c]+x?", target="dfa")
+
+    with compiled.parallel(workers=2, chunk_size=4) as matcher:
+        boundaries = matcher.boundaries("abcabcabcabx")
+
+        assert len(boundaries) == 4
+        assert boundaries[0] == compiled.initial
+        assert boundaries[1] == compiled.run("abca")
+        assert boundaries[2] == compiled.run("abcabcab")
+        assert matcher.accepts("abcabcabcabx")
+        assert matcher.boundaries("abxab")[-1] == DEAD
+        assert (
+            matcher.boundaries("abxa" + "abca" * 20) == [compiled.initial] + [DEAD] * 21
+        )
+        assert not matcher.accepts("")
+
+
+def test_parallel_reuses_pool():
+    compiled = EVEN_OCCURRENCE_EACH_CHAR.compile()
+    string = "abcabc" * 100
+
+    with compiled.parallel(workers=2, chunk_size=8) as matcher:
+        assert matcher.accepts(string)
+        pool = matcher._owned  # pyright: ignore[reportPrivateUsage]
+        assert pool is not None
+        assert not matcher.accepts(string + "a")
+        assert matcher._owned is pool  # pyright: ignore[reportPrivateUsage]
+    assert matcher._owned is None  # pyright: ignore[reportPrivateUsage]
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+        matcher = compiled.parallel(chunk_size=8, executor=executor)
+
+        assert matcher.accepts(string)
+        assert not matcher.accepts(string + "a")
+        assert matcher._owned is None  # pyright: ignore[reportPrivateUsage]
+
+
+def test_parallel_invalid():
+    with pytest.raises(ValueError):
+        _ = ParallelMatcher(NO_MAX.compile(), chunk_size=0)
+    with pytest.raises(ValueError):
+        _ = ParallelMatcher(NO_MAX.compile(), workers=0)
+    with pytest.raises(TypeError):
+        _ = ParallelMatcher(NO_MAX.compile()).accepts(1)  # pyright: ignore[reportArgumentType]
+
+
+def test_compiled_dfa_pickles():
+    compiled = RegExParser.compiled("[a-c]+x?", target="dfa")
+
+    copy = pickle.loads(pickle.dumps(compiled))
+
+    assert list(copy.table) == list(compiled.table)
+    assert copy.accepts("abx") and not copy.accepts("xa")
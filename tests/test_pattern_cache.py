@@ -0,0 +1,63 @@
+import pytest
+
+from automata.dfa import CompiledDFA
+from automata.nfa import CompiledNFA
+from automata.regex import PatternCache, RegExParser
+
+
+@pytest.fixture(autouse=True)
+def purge_pattern_cache():
+    RegExParser.cache.purge()
+    yield
+
+
+def test_compiled_is_cached():
+    nfa_matcher = RegExParser.compiled("(a|b)*c")
+    dfa_matcher = RegExParser.compiled("(a|b)*c", target="dfa")
+
+    assert isinstance(nfa_matcher, CompiledNFA)
+    assert isinstance(dfa_matcher, CompiledDFA)
+    assert RegExParser.compiled("(a|b)*c") is nfa_matcher
+    assert RegExParser.compiled("(a|b)*c", target="dfa") is dfa_matcher
+    assert RegExParser.compiled("(a|b)*c", construction="glushkov") is not nfa_matcher
+    for string in ("c", "abc", "ab", "bbac", "cc"):
+        assert nfa_matcher.accepts(string) == dfa_matcher.accepts(string)
+
+    stats = RegExParser.cache.stats()
+    assert stats["hits"] >= 2
+    assert stats["size"] == 3
+
+
+def test_purge():
+    matcher = RegExParser.compiled("ab")
+    RegExParser.cache.purge()
+
+    assert len(RegExParser.cache) == 0
+    assert RegExParser.compiled("ab") is not matcher
+
+
+def test_lru_eviction():
+    cache = PatternCache(maxsize=2)
+
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("b", lambda: 2) == 2
+    assert cache.get("a", lambda: 0) == 1
+    assert cache.get("c", lambda: 3) == 3
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+
+def test_invalid_target():
+    with pytest.raises(ValueError):
+        _ = RegExParser.compiled("ab", target="table")
+
+    with pytest.raises(ValueError):
+        _ = PatternCache(maxsize=0)
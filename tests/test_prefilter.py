@@ -0,0 +1,65 @@
+from automata.dfa import CompiledDFA
+from automata.nfa.compiled import CompiledNFA
+from automata.regex import Prefilter, RegExParser
+from automata.regex.prefilter import extract
+
+
+def prefilter(re: str) -> Prefilter:
+    return extract(RegExParser.parse(RegExParser.tokenize(re)))
+
+
+def test_extract_literals():
+    assert prefilter("abc").prefixes == ("abc",)
+    assert prefilter("abc").required == ("abc",)
+    assert prefilter("ab|cd").prefixes == ("ab", "cd")
+    assert prefilter("(ab|c)d").required == ("abd", "cd")
+    assert prefilter("a*bcd").prefixes == ()
+    assert prefilter("a*bcd").required == ("bcd",)
+    assert prefilter("x(a|b)y").required == ("xay", "xby")
+    assert prefilter("a+b").prefixes == ("a",)
+    assert prefilter("a+b").required == ("ab",)
+    assert prefilter("a*").required == ()
+
+
+def test_prefilter_scan():
+    literals = prefilter("(a|c)e")
+
+    assert literals.may_match("xxcexx")
+    assert not literals.may_match("aacc")
+    assert not literals.may_match("aexx", 1)
+    assert literals.next_candidate("xxaexce") == 2
+    assert literals.next_candidate("xxaexce", 3) == 5
+    assert literals.next_candidate("xxxx") == -1
+
+
+def test_search_with_prefilter():
+    searcher = RegExParser.searcher("abc(a|b)*c")
+    text = "x" * 50 + "abcabc" + "y" * 50 + "abcc"
+
+    assert searcher.prefilter is not None
+    assert searcher.prefilter.prefixes == ("abc",)
+    assert searcher.findall(text) == ["abcabc", "abcc"]
+    assert searcher.findall("abcab") == []
+    assert searcher.fullmatch("abcbac") is not None
+    assert searcher.fullmatch("xabcc") is None
+
+
+def test_compiled_matchers_use_prefilter(monkeypatch):
+    for target, matcher_type in (("nfa", CompiledNFA), ("dfa", CompiledDFA)):
+        compiled = RegExParser.compiled("x(a|b)*yz", target=target)
+
+        assert compiled.prefilter is not None
+        assert compiled.prefilter.prefixes == ("x",)
+        assert compiled.accepts("xabyz")
+        assert not compiled.accepts("xab")
+        assert compiled.accepts_many(["xyz", "ayz", "xy"]) == bytearray([1, 0, 0])
+
+        def run(self: object, string: str):
+            raise AssertionError(f"ran the automaton on {string!r}")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(matcher_type, "run", run)
+            assert not compiled.accepts("ab" * 1000)
+            assert not compiled.accepts("xab" * 1000)
+
+    assert RegExParser.compiled("(a|b)*", target="dfa").prefilter is None
@@ -0,0 +1,98 @@
+from itertools import product
+
+import pytest
+
+from automata import DFA
+from automata.dfa import ProductDFA
+from automata.dfa.compiled import DEAD
+from automata.dfa.samples import EVEN_NUMBER_OF_ZEROS, EVEN_OCCURRENCE_EACH_CHAR, NO_MAX
+from automata.regex import RegExParser
+
+
+def strings(alphabet: str, length: int) -> list[str]:
+    return [
+        "".join(chars)
+        for n in range(length + 1)
+        for chars in product(alphabet, repeat=n)
+    ]
+
+
+def test_boolean_operations():
+    a = NO_MAX
+    b = RegExParser.to_nfa("(a|m|x)*a").to_dfa()
+
+    both = a & b
+    either = a | b
+    only_a = a - b
+
+    assert isinstance(both, ProductDFA)
+    for string in strings("amxz", 5):
+        assert both.accepts(string) == (a.accepts(string) and b.accepts(string))
+        assert either.accepts(string) == (a.accepts(string) or b.accepts(string))
+        assert only_a.accepts(string) == (a.accepts(string) and not b.accepts(string))
+        assert (a ^ b).accepts(string) == (a.accepts(string) != b.accepts(string))
+
+
+def test_product_is_lazy():
+    both = EVEN_OCCURRENCE_EACH_CHAR & EVEN_OCCURRENCE_EACH_CHAR
+
+    assert both.size == 1
+    assert both.accepts("aa")
+    assert both.size == 2
+    assert not both.accepts("")
+
+
+def test_product_prunes_operands_that_cannot_accept():
+    # subset construction leaves the empty subset as a rejecting sink
+    ab = RegExParser.to_nfa("ab").to_dfa()
+    ba = RegExParser.to_nfa("ba").to_dfa()
+    both = ab & ba
+
+    assert not both.accepts("abab")
+    # after "a" the right operand is in its sink, so the pair is dead
+    assert both.size == 1
+    assert both.table[both.symbol_index["a"]] == DEAD
+    for string in strings("ab", 4):
+        assert (ab | ba).accepts(string) == (string in ("ab", "ba"))
+        assert (ab - ba).accepts(string) == (string == "ab")
+
+
+def test_product_to_dfa():
+    only_a = NO_MAX - EVEN_NUMBER_OF_ZEROS
+    dfa = only_a.to_dfa()
+
+    assert isinstance(dfa, DFA)
+    for string in strings("amx0", 4):
+        assert dfa.accepts(string) == only_a.accepts(string)
+
+
+def test_product_of_class_maps():
+    letters = RegExParser.to_nfa("[a-z]+").to_dfa()
+    no_vowels = RegExParser.to_nfa("[^aeiou]*").to_dfa()
+
+    both = letters & no_vowels
+
+    assert both.accepts("rhythm")
+    assert not both.accepts("vowel")
+    assert not both.accepts("R2D2")
+    assert (letters - no_vowels).accepts("vowel")
+    assert (letters | no_vowels).accepts("R2D2")
+    assert (both & NO_MAX).accepts("xm")
+    assert not (both & NO_MAX).accepts("xy")
+
+
+def test_complement():
+    complement = ~NO_MAX
+
+    for string in strings("amxz", 5)[1:]:
+        expected = set(string) <= NO_MAX.alphabet and not NO_MAX.accepts(string)
+        assert complement.accepts(string) == expected
+    assert not complement.accepts("")
+    assert (~~NO_MAX).accepts("amx")
+
+
+def test_invalid_operands():
+    with pytest.raises(TypeError):
+        _ = NO_MAX & "a"  # pyright: ignore[reportOperatorIssue]
+    with pytest.raises(ValueError):
+        _ = ProductDFA(NO_MAX, NO_MAX, "xor")
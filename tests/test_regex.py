@@ -6,10 +6,11 @@ from automata.nfa.nfa import NFA
 from automata.nfa.samples import A_OR_B_WHOLE_STAR
 from automata.regex import RegExParser
 from automata.regex.regex import ParsingError
+from automata.regex.tokens import CONCAT
 
 
 def test_tokenize_unrecognized_character():
-    for c in "!@#$%^&-= ,./<>?;':\"[]{}\\`~ ":
+    for c in "!@#$%^&-= ,/<>;':\"[]{}\\`~ ":
         with pytest.raises(ParsingError):
             _ = RegExParser.tokenize(f"ab{c}")
 
@@ -117,3 +118,113 @@ def test_re_nfa_equality():
     assert a_or_b_whole_star_from_re.accepts("ab")
     assert a_or_b_whole_star_from_re.accepts("aba")
     assert a_or_b_whole_star_from_re.accepts("baaabbbbabababb")
+
+
+def test_star_applies_to_preceding_symbol():
+    a_b_star = RegExParser.to_nfa("ab*")
+
+    assert a_b_star.accepts("a")
+    assert a_b_star.accepts("abbb")
+    assert not a_b_star.accepts("b")
+    assert not a_b_star.accepts("ba")
+
+
+def test_concatenation_binds_tighter_than_union():
+    parsed = RegExParser.parse(RegExParser.tokenize("ab|cd"))
+
+    assert parsed == ["a", "b", CONCAT, "c", "d", CONCAT, "|"]
+    for construction in ("thompson", "glushkov"):
+        nfa = RegExParser.to_nfa("ab|cd", construction)
+
+        assert nfa.accepts("ab")
+        assert nfa.accepts("cd")
+        assert not nfa.accepts("abd")
+        assert not nfa.accepts("acd")
+
+
+def test_compile_does_not_consume_tokens():
+    parsed = RegExParser.parse(RegExParser.tokenize("a*b|c"))
+    expected = list(parsed)
+
+    _ = RegExParser.compile(parsed)
+
+    assert parsed == expected
+
+
+def test_compile_long_pattern():
+    nfa = RegExParser.to_nfa("ab" * 2000)
+
+    assert len(nfa.states) == 8000
+    assert nfa.accepts("ab" * 2000)
+    assert not nfa.accepts("ab" * 1999)
+
+
+def test_empty_regex():
+    with pytest.raises(ParsingError):
+        _ = RegExParser.to_nfa("")
+
+
+def test_glushkov_construction():
+    patterns = ["ab", "a|b", "a*b|c", "(a|b)*", "a+b*", "((a|b|c|d)|((z*)|a))*"]
+    strings = ["", "a", "b", "c", "ab", "ac", "ba", "abb", "aab", "zzd", "abab"]
+
+    for pattern in patterns:
+        thompson = RegExParser.to_nfa(pattern)
+        glushkov = RegExParser.to_nfa(pattern, construction="glushkov")
+
+        symbol_count = sum(char.isalnum() for char in pattern)
+        assert len(glushkov.states) == symbol_count + 1
+        assert all(epsilon not in row for row in glushkov.transitions.values())
+        for string in strings:
+            assert glushkov.accepts(string) == thompson.accepts(string)
+
+
+def test_glushkov_invalid():
+    with pytest.raises(ParsingError):
+        _ = RegExParser.to_nfa("a||b", construction="glushkov")
+
+    with pytest.raises(ValueError):
+        _ = RegExParser.to_nfa("ab", construction="brzozowski")
+
+
+def test_character_classes():
+    cases = {
+        "[a-z0-9]{2,4}": (["ab", "a1b2", "zz9"], ["a", "abcde", "aB"]),
+        "[^,]+": (["abc", "é!"], [",", "a,b"]),
+        "a.c": (["abc", "a,c", "aéc"], ["ac", "abbc"]),
+        "ab?c": (["ac", "abc"], ["abbc", "bc"]),
+        "(ab){2}": (["abab"], ["ab", "abb", "ababab"]),
+        "(ab)?c": (["c", "abc"], ["ac", "bc", "abbc"]),
+        "(a|b)c{2}": (["acc", "bcc"], ["ac", "abcc"]),
+        "[a-c]{2,}": (["ab", "abcabc"], ["a", "abd"]),
+        "[-a\\]]*x": (["x", "-a]x"], ["bx"]),
+    }
+    for re, (accepted, rejected) in cases.items():
+        matchers = [
+            RegExParser.to_nfa(re),
+            RegExParser.to_nfa(re, "glushkov"),
+            RegExParser.to_nfa(re).to_dfa().minimize(),
+            RegExParser.compiled(re),
+            RegExParser.compiled(re, "glushkov", "dfa"),
+            RegExParser.to_derivative_matcher(re),
+        ]
+        for matcher in matchers:
+            for string in accepted:
+                assert matcher.accepts(string), (re, string, matcher)
+            for string in rejected:
+                assert not matcher.accepts(string), (re, string, matcher)
+
+
+def test_character_classes_stay_small():
+    nfa = RegExParser.to_nfa("[a-z0-9]{8,64}")
+
+    assert nfa.alphabet == {"0"}
+    assert len(nfa.states) < 300
+    assert RegExParser.compiled("[a-z0-9]{8,64}", target="dfa").width == 1
+
+
+def test_invalid_character_classes():
+    invalid = ("[a", "[z-a]", "a{2", "a{x}", "a{3,1}", "a{1,2,3}", "{2}", "a*?")
+    for re in (*invalid, "[^\x00-\U0010ffff]", "a|*", "(*a)", "a()b"):
+        with pytest.raises(ParsingError):
+            _ = RegExParser.to_nfa(re)
@@ -0,0 +1,36 @@
+import pytest
+
+from automata.regex import RegExParser, RegexSet
+
+PATTERNS = ["ab*", "(a|b)*c", "b+", "ab"]
+
+
+def test_regex_set_matches():
+    regex_set = RegexSet(PATTERNS)
+
+    assert len(regex_set) == 4
+    assert regex_set.matches("ab") == [0, 3]
+    assert regex_set.matches("abbc") == [1]
+    assert regex_set.matches("bbb") == [2]
+    assert regex_set.matches("a") == [0]
+    assert regex_set.matches("ca") == []
+    assert regex_set.matches("az") == []
+    assert regex_set.matches("") == []
+    assert regex_set.is_match("c")
+    assert not regex_set.is_match("ba")
+
+
+def test_regex_set_agrees_with_patterns():
+    regex_set = RegexSet(PATTERNS)
+    nfas = [RegExParser.to_nfa(pattern) for pattern in PATTERNS]
+
+    for string in ("a", "b", "c", "ab", "abb", "abc", "bac", "bb", "cab", "abab"):
+        expected = [i for i, nfa in enumerate(nfas) if nfa.accepts(string)]
+        assert regex_set.matches(string) == expected
+
+
+def test_regex_set_invalid():
+    with pytest.raises(ValueError):
+        _ = RegexSet([])
+    with pytest.raises(TypeError):
+        _ = RegexSet(["a"]).matches(1)  # pyright: ignore[reportArgumentType]
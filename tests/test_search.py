@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from automata.regex import Match, RegExParser, Searcher
+
+
+def test_search_leftmost_longest():
+    searcher = RegExParser.searcher("a(b|c)*")
+
+    match = searcher.search("xxabcbxab")
+
+    assert match is not None
+    assert match.span() == (2, 6)
+    assert match.group() == "abcb"
+    assert searcher.search("xxbcx") is None
+
+
+def test_finditer_non_overlapping():
+    searcher = RegExParser.searcher("ba*b")
+
+    matches = list(searcher.finditer("babaabbxbb"))
+
+    assert matches == [
+        Match("babaabbxbb", 0, 3),
+        Match("babaabbxbb", 5, 7),
+        Match("babaabbxbb", 8, 10),
+    ]
+    assert matches[1].group() == "bb"
+    assert searcher.findall("babbab") == ["bab", "bab"]
+
+
+def test_findall_unknown_symbols():
+    searcher = RegExParser.searcher("(a|b)*c")
+
+    assert searcher.findall("zzabczcc-bbbac") == ["abc", "c", "c", "bbbac"]
+    assert searcher.findall("") == []
+    assert searcher.findall("ab", pos=1) == []
+    assert searcher.findall("abcac", pos=1) == ["bc", "ac"]
+
+
+def test_search_never_matches_empty():
+    searcher = RegExParser.searcher("a*")
+
+    assert searcher.findall("baab") == ["aa"]
+    with pytest.raises(TypeError):
+        _ = searcher.search(b"aa")  # pyright: ignore[reportArgumentType]
+
+
+def test_searcher_is_cached():
+    assert RegExParser.searcher("ab|c") is RegExParser.searcher("ab|c")
+
+
+def test_findall_is_linear():
+    searcher = RegExParser.searcher("a+b|a")
+    plain = Searcher(searcher.forward)
+
+    def findall(length: int) -> float:
+        text = "a" * length
+        start = time.perf_counter()
+        for matcher in (searcher, plain):
+            assert matcher.findall(text) == ["a"] * length
+        return time.perf_counter() - start
+
+    # every run from a start can read on to the end of the text, so runs
+    # that do not stop at the last possible match end are quadratic
+    small = min(findall(10_000) for _ in range(3))
+    large = min(findall(40_000) for _ in range(3))
+    assert large < 10 * small
+    assert plain.findall("aaab" + "a" * 1000) == ["aaab"] + ["a"] * 1000
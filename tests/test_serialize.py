@@ -0,0 +1,159 @@
+import pytest
+
+from automata import DFA, NFA, State
+from automata.dfa import CompiledDFA
+from automata.dfa.samples import EVEN_OCCURRENCE_EACH_CHAR, NO_MAX
+from automata.regex import RegExParser
+from automata.serialize import (
+    AutomatonCache,
+    SerializationError,
+    dumps,
+    load,
+    loads,
+    save,
+)
+
+STRINGS = ("", "a", "ab", "abab", "aabb", "max", "mamx", "abc", "cabac", "z")
+
+
+def test_compiled_dfa_round_trip():
+    for dfa in (EVEN_OCCURRENCE_EACH_CHAR, NO_MAX):
+        compiled = dfa.compile()
+        loaded = loads(dumps(compiled))
+
+        assert isinstance(loaded, CompiledDFA)
+        assert loaded.states == compiled.states
+        assert loaded.symbols == compiled.symbols
+        assert list(loaded.table) == list(compiled.table)
+        for string in STRINGS:
+            assert loaded.accepts(string) == compiled.accepts(string)
+
+
+def test_dfa_round_trip():
+    loaded = loads(dumps(NO_MAX))
+
+    assert isinstance(loaded, DFA)
+    assert loaded.states == NO_MAX.states
+    assert loaded.transitions == NO_MAX.transitions
+    assert loaded.initial == NO_MAX.initial
+    assert loaded.accepting == NO_MAX.accepting
+
+
+def test_nfa_round_trip():
+    nfa = RegExParser.to_nfa("(a|b)*c")
+    loaded = loads(dumps(nfa))
+
+    assert isinstance(loaded, NFA)
+    assert loaded.states == nfa.states
+    assert loaded.transitions == nfa.transitions
+    assert loaded.initial == nfa.initial
+    assert loaded.accepting == nfa.accepting
+    for string in STRINGS:
+        assert loaded.accepts(string) == nfa.accepts(string)
+
+
+def test_nfa_bytes_do_not_depend_on_iteration_order(tmp_path):
+    cache = AutomatonCache(tmp_path)
+    nfa = RegExParser.to_nfa("(a|b)*c|ab")
+    key = cache.key(nfa)
+
+    # unrelated automata built in between must not change the key
+    _ = RegExParser.to_nfa("(c|d)*e").to_dfa()
+    _ = [State() for _ in range(100)]
+    assert cache.key(nfa) == key
+
+    reordered = NFA(
+        set(reversed(list(nfa.states))),
+        set(nfa.alphabet),
+        {
+            state: {
+                symbol: set(reversed(list(targets)))
+                for symbol, targets in reversed(row.items())
+            }
+            for state, row in reversed(nfa.transitions.items())
+        },
+        set(nfa.initial),
+        set(nfa.accepting),
+    )
+    assert dumps(reordered) == dumps(nfa)
+    assert cache.key(reordered) == key
+
+
+def test_load_mmap(tmp_path):
+    compiled = RegExParser.compiled("(ab|b)*a", target="dfa")
+    path = tmp_path / "pattern.atm"
+    save(compiled, path)
+
+    for use_mmap in (True, False):
+        loaded = load(path, use_mmap=use_mmap)
+        assert isinstance(loaded, CompiledDFA)
+        assert list(loaded.table) == list(compiled.table)
+        for string in ("a", "aba", "ba", "abba", "bbbba"):
+            assert loaded.accepts(string) == compiled.accepts(string)
+
+
+def test_invalid_data():
+    data = dumps(NO_MAX)
+
+    with pytest.raises(SerializationError):
+        _ = loads(b"JUNK" + data[4:])
+    with pytest.raises(SerializationError):
+        _ = loads(data[:-4])
+    with pytest.raises(SerializationError):
+        _ = loads(data[:4] + b"\xff\xff" + data[6:])
+    with pytest.raises(TypeError):
+        _ = dumps("not an automaton")  # pyright: ignore[reportArgumentType]
+
+
+def test_automaton_cache(tmp_path):
+    cache = AutomatonCache(tmp_path / "cache")
+    builds: list[str] = []
+
+    def build():
+        builds.append("(a|b)*c")
+        return RegExParser.compiled("(a|b)*c", target="dfa")
+
+    first = cache.get_or_build("(a|b)*c", build, target="dfa")
+    second = cache.get_or_build("(a|b)*c", build, target="dfa")
+
+    assert builds == ["(a|b)*c"]
+    assert isinstance(second, CompiledDFA)
+    assert list(second.table) == list(first.table)
+    assert cache.key("(a|b)*c", target="dfa") != cache.key("(a|b)*c", target="nfa")
+    assert cache.key(NO_MAX) == cache.key(NO_MAX)
+    assert cache.key(NO_MAX) != cache.key(EVEN_OCCURRENCE_EACH_CHAR)
+
+    cache.purge()
+    _ = cache.get_or_build("(a|b)*c", build, target="dfa")
+    assert len(builds) == 2
+
+
+def test_automaton_cache_rebuilds_corrupt_entry(tmp_path):
+    cache = AutomatonCache(tmp_path)
+    key = cache.key(NO_MAX)
+    _ = cache.path(key).write_bytes(b"garbage")
+
+    result = cache.get_or_build(NO_MAX, NO_MAX.compile)
+
+    assert isinstance(result, CompiledDFA)
+    assert isinstance(load(cache.path(key)), CompiledDFA)
+
+
+def test_automaton_cache_rebuilds_unreadable_entries(tmp_path):
+    cache = AutomatonCache(tmp_path)
+    key = cache.key(NO_MAX)
+    data = dumps(NO_MAX)
+
+    for content in (
+        b"",
+        data[:-8] + b"\xff" * 8,
+        data[:32] + b"\xff" * (len(data) - 32),
+    ):
+        _ = cache.path(key).write_bytes(content)
+        with pytest.raises(SerializationError):
+            _ = load(cache.path(key))
+
+        result = cache.get_or_build(NO_MAX, NO_MAX.compile)
+
+        assert isinstance(result, CompiledDFA)
+        assert result.accepts("max") == NO_MAX.accepts("max")
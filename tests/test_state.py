@@ -1,6 +1,11 @@
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from automata import State
+from automata.regex import RegExParser
 
 
 def test_equality():
@@ -23,3 +28,49 @@ def test_non_string_base_state_name():
 def test_auto_naming():
     assert State(f"{State.base_name}{State.instance_counter}") == State() == State("q0")
     assert State(f"{State.base_name}{State.instance_counter}") == State() == State("q1")
+
+
+def test_from_set():
+    subset = State.from_set({State("q1"), State("q0")})
+
+    assert subset == State.from_set({State("q0"), State("q1")})
+    assert subset == State("{q0,q1}")
+    assert subset.name == "{q0,q1}"
+    assert State("{q0,q2}") == State.from_set({State("q2"), State("q0")})
+    assert State.from_set(set()) == State("{}")
+    assert State("{q1,q0}") != subset
+
+
+def test_compact_state():
+    state = State("q0")
+
+    assert not hasattr(state, "__dict__")
+    assert hash(state) == hash(State("q0"))
+    assert State("q0") != State("q1")
+
+
+def test_pickle_by_name():
+    subset = State.from_set({State("q0"), State("q1")})
+
+    assert pickle.loads(pickle.dumps(subset)) == subset
+    assert pickle.loads(pickle.dumps(State("q7"))) == State("q7")
+
+
+def test_states_from_several_threads():
+    patterns = [f"(a|b)*a(a|b){{{n}}}c" for n in range(2, 8)] * 4
+    strings = ["ab" * 5 + "c", "a" * 12 + "c", "b" * 9 + "c"]
+
+    def accepted(pattern: str) -> list[bool]:
+        dfa = RegExParser.to_nfa(pattern).to_dfa().minimize()
+        return [dfa.accepts(string) for string in strings]
+
+    # switch threads often, so that races would show up
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(accepted, patterns))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert results == [accepted(pattern) for pattern in patterns]
@@ -0,0 +1,76 @@
+import io
+
+import pytest
+
+from automata import DFA, State
+from automata.dfa import StreamMatcher
+from automata.dfa.samples import EVEN_NUMBER_OF_ZEROS, NO_MAX
+
+
+def test_feed_matches_accepts():
+    matcher = NO_MAX.stream()
+
+    assert isinstance(matcher, StreamMatcher)
+    for string in ("a", "mam", "maaaaax", "mamxa", "xmxmaxmmaamx"):
+        matcher.reset()
+        for i in range(0, len(string), 2):
+            _ = matcher.feed(string[i : i + 2])
+        assert matcher.is_accepting == NO_MAX.accepts(string)
+
+
+def test_empty_input_not_accepting():
+    matcher = EVEN_NUMBER_OF_ZEROS.stream()
+
+    assert not matcher.is_accepting
+    assert matcher.feed("")
+    assert not matcher.is_accepting
+    assert matcher.feed("00")
+    assert matcher.is_accepting
+
+
+def test_stops_at_dead_state():
+    matcher = DFA(
+        {q0 := State("q0"), q1 := State("q1"), q2 := State("q2")},
+        {"a", "b"},
+        {q0: {"a": q1, "b": q2}, q1: {"b": q2}},
+        q0,
+        {q2},
+    ).stream()
+
+    assert matcher.feed("a")
+    assert not matcher.feed("aba")
+    assert matcher.is_dead
+    assert matcher.consumed == 2
+    assert not matcher.feed("b")
+    assert matcher.consumed == 2
+    assert matcher.current_state is None
+
+    matcher = EVEN_NUMBER_OF_ZEROS.stream()
+
+    assert not matcher.feed("00z00")
+    assert matcher.consumed == 3
+
+
+def test_snapshot_restore():
+    matcher = EVEN_NUMBER_OF_ZEROS.stream()
+    _ = matcher.feed("0")
+    snapshot = matcher.snapshot()
+
+    _ = matcher.feed("0")
+    assert matcher.is_accepting
+
+    matcher.restore(snapshot)
+    assert not matcher.is_accepting
+    assert matcher.consumed == 1
+
+    with pytest.raises(ValueError):
+        matcher.restore((100, 0))
+
+
+def test_consume_file():
+    source = io.StringIO("10" * 1000)
+
+    matcher = EVEN_NUMBER_OF_ZEROS.stream()
+
+    assert matcher.consume(iter(lambda: source.read(64), ""))
+    assert matcher.consumed == 2000